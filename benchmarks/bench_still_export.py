@@ -0,0 +1,92 @@
+"""Benchmark of StillManager.export_stills on a simulated still album.
+
+Grabs one still per clip of a simulated timeline, then exports them with the
+previous per-still ExportStills loop followed by clean_and_rename_stills, and
+with the batched export_stills. Both run against the same album with a per-call
+latency modelling the scripting round trip, and must produce the same files.
+
+Usage:
+    python -m benchmarks.bench_still_export [--stills 1000] [--latency 0.002]
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from pybmd import Resolve
+from pybmd.gallery_still_album import StillFormat
+from pybmd.simulator import SimulatedBMDModule, SimulatorConfig, populate_project
+from pybmd.toolkits import StillManager
+
+FILE_NAME_FORMAT = "$file_name$_$clip_frame_tc$"
+
+
+def _per_still_export(manager: StillManager, export_path: Path):
+    """export_stills before batching: one ExportStills call per still."""
+    original_contents = {entry.name for entry in export_path.iterdir()}
+    for marker_still in manager.marker_still_list:
+        file_prefix = (
+            f"{manager._get_metadata(marker_still, 'file_name')}_"
+            f"{manager._get_metadata(marker_still, 'clip_frame_tc')}"
+        )
+        manager._still_album.export_stills(
+            gallery_stills=[marker_still.still_obj],
+            folder_path=str(export_path),
+            file_prefix=file_prefix,
+            format=StillFormat.TIF,
+        )
+        # export result entry
+        marker_still.clip_obj.get_name()
+    manager.clean_and_rename_stills(str(export_path), True, original_contents)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stills", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.002)
+    args = parser.parse_args()
+    logging.getLogger("pybmd.toolkits").setLevel(logging.WARNING)
+
+    config = SimulatorConfig()
+    resolve = Resolve(bmd_module=SimulatedBMDModule(config))
+    project = resolve.get_project_manager().get_current_project()
+    populate_project(project._object, clip_count=args.stills)
+
+    manager = StillManager(project)
+    manager.grab_all_still()
+    # exported files are named after the clip, keep one still per name
+    manager.marker_still_list = list(
+        {
+            (still.clip_obj.get_name(), still.marker_source_tc.frame): still
+            for still in manager.marker_still_list
+        }.values()
+    )
+    config.latency = args.latency
+
+    with (
+        tempfile.TemporaryDirectory() as before_dir,
+        tempfile.TemporaryDirectory() as after_dir,
+    ):
+        start = time.perf_counter()
+        _per_still_export(manager, Path(before_dir))
+        before = time.perf_counter() - start
+
+        start = time.perf_counter()
+        manager.export_stills(after_dir, FILE_NAME_FORMAT, format=StillFormat.TIF)
+        after = time.perf_counter() - start
+
+        before_files = sorted(entry.name for entry in Path(before_dir).iterdir())
+        after_files = sorted(entry.name for entry in Path(after_dir).iterdir())
+        if before_files != after_files:
+            raise SystemExit("exported files differ")
+
+    print(
+        f"{len(after_files)} stills, {args.latency * 1e3:g} ms per scripting call: "
+        f"{before:.2f} s -> {after:.2f} s ({before / after:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
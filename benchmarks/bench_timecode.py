@@ -0,0 +1,90 @@
+"""Benchmark of the vectorized timecode engine against dftt_timecode.
+
+Converts a batch of frame counts to SMPTE timecodes and back with
+pybmd.timecode and with one DfttTimecode per value, and checks that both
+agree. dftt_timecode is timed on a sample and extrapolated to the batch size;
+it is installed with the dev dependency group (uv sync --group dev).
+
+Usage:
+    python -m benchmarks.bench_timecode [--count 100000] [--fps 29.97] [--drop-frame]
+"""
+
+import argparse
+import time
+
+import numpy as np
+from dftt_timecode import DfttTimecode
+
+from pybmd.timecode import TimecodeConverter
+
+
+def _seconds(fn) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--fps", type=float, default=29.97)
+    parser.add_argument("--drop-frame", action="store_true")
+    parser.add_argument("--sample", type=int, default=5_000)
+    args = parser.parse_args()
+
+    converter = TimecodeConverter(args.fps, args.drop_frame)
+    # one hour in, like a timeline starting at 01:00:00:00
+    frames = np.arange(args.count, dtype=np.int64) + round(args.fps * 3600)
+    timecodes = converter.to_timecode(frames)
+    sample_frames = frames[: args.sample].tolist()
+    sample_timecodes = timecodes[: args.sample].tolist()
+
+    def dftt_to_timecode():
+        return [
+            DfttTimecode(
+                frame, "frame", args.fps, drop_frame=args.drop_frame
+            ).timecode_output("smpte")
+            for frame in sample_frames
+        ]
+
+    def dftt_to_frames():
+        return [
+            int(
+                DfttTimecode(
+                    timecode, "auto", args.fps, drop_frame=args.drop_frame
+                ).timecode_output("frame")
+            )
+            for timecode in sample_timecodes
+        ]
+
+    if dftt_to_timecode() != sample_timecodes:
+        raise SystemExit("timecodes differ from dftt_timecode")
+    if dftt_to_frames() != sample_frames:
+        raise SystemExit("frame counts differ from dftt_timecode")
+
+    scale = args.count / len(sample_frames)
+    rows = [
+        (
+            "frames -> timecode",
+            _seconds(dftt_to_timecode) * scale,
+            _seconds(lambda: converter.to_timecode(frames)),
+        ),
+        (
+            "timecode -> frames",
+            _seconds(dftt_to_frames) * scale,
+            _seconds(lambda: converter.to_frames(timecodes)),
+        ),
+    ]
+    print(f"{args.count} values at {converter!r}, dftt_timecode extrapolated")
+    for label, before, after in rows:
+        print(
+            f"{label}: {before * 1e3:9.1f} ms -> {after * 1e3:7.1f} ms "
+            f"({before / after:5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
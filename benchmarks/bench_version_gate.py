@@ -0,0 +1,63 @@
+"""Micro-benchmark for the per-call overhead of @requires_resolve_version.
+
+Compares an undecorated method, the per-call check used for objects without a
+connection context, and the gate precomputed in a ResolveContext. No DaVinci
+Resolve is needed.
+
+Usage:
+    python -m benchmarks.bench_version_gate [--number 1000000]
+"""
+
+import argparse
+import timeit
+
+import pybmd.resolve
+from pybmd._context import ResolveContext
+from pybmd.decorators import requires_resolve_version
+from pybmd.version_registry import VersionRegistry
+
+RESOLVE_VERSION = [20, 2, 0, 12345, ""]
+
+
+class _Item:
+    _context = None
+
+    def plain(self) -> int:
+        return 1
+
+    @requires_resolve_version(added_in="19.0.0")
+    def gated(self) -> int:
+        return 1
+
+
+def _ns_per_call(stmt, number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    item = _Item()
+    pybmd.resolve.RESOLVE_VERSION = RESOLVE_VERSION
+
+    baseline = _ns_per_call(item.plain, args.number)
+
+    VersionRegistry.reset_resolution()
+    per_call = _ns_per_call(item.gated, args.number)
+
+    item._context = ResolveContext(None, None, RESOLVE_VERSION)
+    resolved = _ns_per_call(item.gated, args.number)
+
+    print(f"undecorated            : {baseline:8.1f} ns/call")
+    print(f"per-call check (before): {per_call:8.1f} ns/call")
+    print(f"context gate (after)   : {resolved:8.1f} ns/call")
+    print(
+        f"decorator overhead     : {per_call - baseline:8.1f} -> "
+        f"{resolved - baseline:.1f} ns/call"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Memory benchmark for TimelineItem / MediaPoolItem wrappers.
+
+Measures the bytes allocated per wrapper with tracemalloc for the slotted
+wrappers and for a replica of the previous layout (a ``__dict__`` holding
+``_object`` plus the per-class alias such as ``_timeline_item``). Raw objects
+come from the simulator, so no DaVinci Resolve is needed.
+
+Usage:
+    python -m benchmarks.bench_wrapper_memory [--count 200000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from pybmd.media_pool_item import MediaPoolItem
+from pybmd.simulator import SimulatedBMDModule, SimulatedMediaPoolItem
+from pybmd.timeline_item import TimelineItem
+
+
+class _DictTimelineItem(object):
+    """Layout of TimelineItem before wrappers were slotted."""
+
+    def __init__(self, timeline_item):
+        self._object = timeline_item
+        self._timeline_item = self._object
+
+
+class _DictMediaPoolItem(object):
+    """Layout of MediaPoolItem before wrappers were slotted."""
+
+    def __init__(self, media_pool_item):
+        self._object = media_pool_item
+        self._media_pool_item = self._object
+
+
+def _bytes_per_wrapper(cls, raw_objects) -> float:
+    gc.collect()
+    tracemalloc.start()
+    wrappers = [cls(raw) for raw in raw_objects]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # the list holding the wrappers is not part of the wrapper cost
+    allocated -= wrappers.__sizeof__()
+    del wrappers
+    return allocated / len(raw_objects)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    sim = SimulatedBMDModule().scriptapp("Resolve")._sim
+    raw_clips = [
+        SimulatedMediaPoolItem(sim, f"/media/clip_{index:06d}.mov", {})
+        for index in range(args.count)
+    ]
+
+    for name, before, after in (
+        ("TimelineItem", _DictTimelineItem, TimelineItem),
+        ("MediaPoolItem", _DictMediaPoolItem, MediaPoolItem),
+    ):
+        before_bytes = _bytes_per_wrapper(before, raw_clips)
+        after_bytes = _bytes_per_wrapper(after, raw_clips)
+        print(
+            f"{name:<14}: {before_bytes:6.1f} -> {after_bytes:6.1f} bytes/wrapper "
+            f"({args.count} wrappers, "
+            f"{(before_bytes - after_bytes) * args.count / 2**20:.1f} MiB saved)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,26 +8,12 @@
 import sys
 import os
 import tomllib
-import pybmd._init_bmd
 import pybmd as package
 
 sys.path.append(os.path.abspath(".."))
 
-
-# Mock the _resolve_object before importing pybmd
-# This prevents import errors when building docs without DaVinci Resolve running
-class MockResolveObject:
-    """Mock object for DaVinci Resolve constants during documentation build."""
-
-    def __getattr__(self, name):
-        # Return incrementing float values for any attribute access
-        # This ensures Enum classes can be defined without errors
-        return hash(name) % 1000 + 0.0
-
-
-# Inject the mock into pybmd._init_bmd before it gets imported
-
-pybmd._init_bmd._resolve_object = MockResolveObject()
+# Resolve constant enums (pybmd.settings, pybmd.export_type) resolve their
+# values lazily, so the modules import without DaVinci Resolve running
 
 
 # Read version from pyproject.toml
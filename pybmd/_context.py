@@ -0,0 +1,98 @@
+"""Per-connection state of a Resolve instance.
+
+Every `Resolve` owns a ResolveContext holding its scripting module, raw
+Resolve object, version and precomputed version gates. The context is handed
+down to every wrapper produced from that Resolve (``wrapper._context``), so
+several connections to Resolve instances of different versions can be used
+side by side in one process.
+
+Wrappers created without a context, e.g. ``Timeline(raw_timeline)``, fall back
+to the context of the most recently created Resolve.
+"""
+
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from pybmd.version_info import Version
+from pybmd.version_registry import GateStatus, VersionRegistry
+
+if TYPE_CHECKING:
+    from pybmd.executor import ConnectionExecutor
+    from pybmd.timeline_index import TimelineIndex
+
+
+class ResolveContext(object):
+    """Connection state shared by one Resolve and all wrappers it produces.
+
+    Attributes:
+        bmd_module: scripting module the connection was made with
+        resolve_object: raw Resolve scripting object
+        version: Resolve version in [major, minor, patch, build, suffix] format
+        gate_status: version gates of decorated APIs, indexed by gate index
+        interned: interned wrappers of this connection, see pybmd.interning
+        executor: owner thread of the connection, None unless Resolve(executor=True)
+        timeline_generation: bumped whenever pybmd adds, renames or deletes a timeline, see pybmd.timeline_index
+        timeline_indexes: timeline name indexes of this connection by project unique id
+    """
+
+    __slots__ = (
+        "bmd_module",
+        "resolve_object",
+        "version",
+        "gate_status",
+        "interned",
+        "executor",
+        "timeline_generation",
+        "timeline_indexes",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        bmd_module,
+        resolve_object,
+        version: List[Any],
+        executor: "ConnectionExecutor | None" = None,
+    ):
+        self.bmd_module = bmd_module
+        self.resolve_object = resolve_object
+        self.version = version
+        self.gate_status: List[GateStatus] = VersionRegistry.compute_gate_statuses(
+            Version.from_list(version)
+        )
+        self.interned: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+        self.executor = executor
+        self.timeline_generation = 0
+        self.timeline_indexes: Dict[str, "TimelineIndex"] = {}
+
+    def sync_gates(self):
+        """Evaluates gates of APIs registered after the context was created."""
+        start = len(self.gate_status)
+        if start < VersionRegistry.gate_count():
+            self.gate_status.extend(
+                VersionRegistry.compute_gate_statuses(
+                    Version.from_list(self.version), start
+                )
+            )
+
+    def __repr__(self) -> str:
+        return f"ResolveContext(version={self.version!r})"
+
+
+_default_context: Optional[ResolveContext] = None
+
+
+def timelines_changed(context: Optional[ResolveContext]):
+    """Invalidates the timeline indexes of context's connection."""
+    if context is not None:
+        context.timeline_generation += 1
+
+
+def get_default_context() -> Optional[ResolveContext]:
+    """Returns the context of the most recently created Resolve, None before."""
+    return _default_context
+
+
+def set_default_context(context: Optional[ResolveContext]):
+    global _default_context
+    _default_context = context
@@ -35,6 +35,30 @@ class DEFAULT_LIB_PATH(Enum):
 
 
 def _init_bmd_module():
+    # PYBMD_SIMULATOR swaps fusionscript for the in-memory simulator
+    if os.environ.get("PYBMD_SIMULATOR", "").lower() in ("1", "true", "yes"):
+        from pybmd.simulator import default_module
+
+        return cast("BMDModule", default_module())
+    if replay_path := os.environ.get("PYBMD_REPLAY"):
+        from pybmd.replay import ReplayBMDModule
+
+        return cast("BMDModule", ReplayBMDModule(replay_path))
+    if record_path := os.environ.get("PYBMD_RECORD"):
+        from pybmd.replay import RecordingBMDModule
+
+        return cast("BMDModule", RecordingBMDModule(record_path))
+    return _load_fusionscript_module()
+
+
+_fusionscript_module: BMDModule | None = None
+
+
+def _load_fusionscript_module():
+    # the extension module can only be initialised once per process
+    global _fusionscript_module
+    if _fusionscript_module is not None:
+        return _fusionscript_module
     if sys.platform.startswith("darwin"):
         PYLIB = DEFAULT_LIB_PATH.LIB_MAC.value
     elif sys.platform.startswith("win"):
@@ -48,7 +72,8 @@ def _init_bmd_module():
     else:
         raise UnsupportSystemError()
     bmd_module = _load_dynamic(module_name="fusionscript", module_path=PYLIB)
-    return cast("BMDModule", bmd_module)
+    _fusionscript_module = cast("BMDModule", bmd_module)
+    return _fusionscript_module
 
 
 _bmd_module_object: BMDModule | None = None
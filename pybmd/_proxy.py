@@ -0,0 +1,62 @@
+"""Transparent proxies around raw fusionscript objects.
+
+Wrappers keep the raw scripting object in ``self._object``. An ObjectProxy can
+stand in for that object to observe or reroute scripting calls, while
+everything handed back to the scripting API is passed through `unwrap` first
+so Resolve only ever sees its own objects.
+"""
+
+from typing import Any
+
+
+class ObjectProxy(object):
+    """Base proxy forwarding attribute access to the wrapped scripting object.
+
+    Subclasses override `_call` to hook every scripting method invocation.
+    """
+
+    __slots__ = ("_target",)
+
+    def __init__(self, target):
+        object.__setattr__(self, "_target", target)
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        def method(*args, **kwargs):
+            return self._call(name, attr, args, kwargs)
+
+        return method
+
+    def __setattr__(self, name: str, value):
+        setattr(self._target, name, value)
+
+    def _call(self, name: str, method, args: tuple, kwargs: dict):
+        return method(*unwrap(args), **unwrap(kwargs))
+
+    def __eq__(self, other) -> bool:
+        return unwrap(self) == unwrap(other)
+
+    def __hash__(self) -> int:
+        return hash(unwrap(self))
+
+    def __bool__(self) -> bool:
+        return bool(unwrap(self))
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} of {unwrap(self)!r}>"
+
+
+def unwrap(value: Any) -> Any:
+    """Strips proxies from value, recursing into lists, tuples and dicts."""
+    while isinstance(value, ObjectProxy):
+        value = object.__getattribute__(value, "_target")
+    if isinstance(value, list):
+        return [unwrap(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(unwrap(item) for item in value)
+    if isinstance(value, dict):
+        return {key: unwrap(item) for key, item in value.items()}
+    return value
@@ -0,0 +1,81 @@
+"""Enums backed by constants of the Resolve scripting object.
+
+The numeric values of constants like ``resolve.EXPORT_AAF`` are only known once
+a Resolve object exists. Members of a ResolveConstantEnum are declared with the
+constant name and look the number up on first use of ``.value``, so importing
+the modules declaring them needs no running Resolve.
+"""
+
+from enum import Enum
+from typing import Any
+
+from pybmd import _init_bmd
+from pybmd.error import ResolveInitError
+
+
+class ResolveConstantEnum(Enum):
+    """Enum whose member values are resolved lazily from the Resolve object.
+
+    Example:
+        >>> class LUT_Export_Type(ResolveConstantEnum):
+        ...     CUBE_17PT = "EXPORT_LUT_17PTCUBE"
+        >>> LUT_Export_Type.CUBE_17PT.constant_name
+        'EXPORT_LUT_17PTCUBE'
+        >>> LUT_Export_Type.CUBE_17PT.value  # reads resolve.EXPORT_LUT_17PTCUBE
+    """
+
+    @property
+    def constant_name(self) -> str:
+        """Name of the constant on the Resolve scripting object."""
+        return self._value_
+
+    @property
+    def value(self) -> Any:
+        """Value of the constant, cached per Resolve object.
+
+        Raises:
+            ResolveInitError: no Resolve object has been created yet.
+        """
+        resolve_object = _init_bmd._resolve_object
+        cached = self.__dict__.get("_resolved")
+        if cached is not None and cached[0] is resolve_object:
+            return cached[1]
+        if resolve_object is None:
+            raise ResolveInitError(
+                f"{type(self).__name__}.{self.name} needs the Resolve constant "
+                f"{self._value_}, create Resolve() first."
+            )
+        resolved = getattr(resolve_object, self._value_)
+        self.__dict__["_resolved"] = (resolve_object, resolved)
+        return resolved
+
+    @classmethod
+    def _missing_(cls, value):
+        # lookup by resolved constant value, e.g. LUT_Export_Type(resolve.EXPORT_LUT_17PTCUBE)
+        if _init_bmd._resolve_object is None:
+            return None
+        for member in cls:
+            if member.value == value:
+                return member
+        return None
+
+    @classmethod
+    def _validate(cls, value):
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str) and value in cls.__members__:
+            return cls[value]
+        return cls(value)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type, handler):
+        # pydantic's enum schema reads every member value while building the
+        # model class, validate and serialize members without touching them
+        from pydantic_core import core_schema
+
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda member: member.value
+            ),
+        )
@@ -71,7 +71,7 @@ class ResolveObject(Protocol):
     AUTO_CAPTION_NETFLIX: float
 
     AUTO_CAPTION_LINE_SINGLE: float
-    AUPTO_CAPTION_LINE_DOUBLE: float
+    AUTO_CAPTION_LINE_DOUBLE: float
 
     SUBTITLE_LANGUAGE: float
     SUBTITLE_CAPTION_PRESET: float
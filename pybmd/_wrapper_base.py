@@ -1,11 +1,38 @@
+from typing import Optional
+
+from pybmd import _context, instrumentation, interning
 from pybmd.error import WrapperInitError
 
 
 class WrapperBase(object):
-    """base class for all wrapper classes."""
+    """base class for all wrapper classes.
+
+    Wrappers are slotted and hold the raw scripting object in `_object` only,
+    plus the ResolveContext of the connection that produced it in `_context`.
+    """
+
+    __slots__ = ("_object", "_context", "__weakref__")
 
-    def __init__(self, _object):
+    # read-only alias of _object, subclasses bind it to their historical attribute name (e.g. _timeline_item)
+    _handle_alias = property(lambda self: self._object)
+
+    # scripting API returning the id wrappers are interned by, None disables interning
+    _intern_id_api: Optional[str] = None
+
+    def __init__(self, _object, context: "_context.ResolveContext | None" = None):
         super(WrapperBase, self).__init__()
         if _object is None:
             raise WrapperInitError("davinci resolve object cannot be None")
+        if instrumentation._enabled:
+            _object = instrumentation.instrument(_object, type(self).__name__)
         self._object = _object
+        self._context = (
+            context if context is not None else _context.get_default_context()
+        )
+
+    @classmethod
+    def _wrap(cls, _object, context: "_context.ResolveContext | None" = None):
+        """Wraps a raw object returned by Resolve, reusing the interned wrapper when interning is enabled."""
+        if _object is None or not interning._enabled or cls._intern_id_api is None:
+            return cls(_object, context)
+        return interning.intern(cls, _object, context)
@@ -0,0 +1,311 @@
+"""asyncio facade over the pybmd object model.
+
+AsyncResolve, AsyncProject and AsyncTimeline mirror every public method of
+Resolve, Project and Timeline as a coroutine. Each call is submitted to the
+connection's ConnectionExecutor (see pybmd.executor) and awaited without
+blocking the event loop. Wrappers returned by a call come back as their async
+counterpart, other wrappers such as TimelineItem as a generic AsyncWrapper
+that mirrors their methods the same way. Public properties of the mirrored
+wrappers are read on the connection thread as well, they return an awaitable
+(``fusion = await resolve.fusion``).
+
+At most ``max_pending`` calls of one AsyncResolve wait on the connection at a
+time, further callers wait in the event loop (backpressure). Cancelling an
+awaiting task withdraws its call if it has not reached Resolve yet; a call
+already running completes and its result is dropped.
+
+Example:
+    >>> async with await AsyncResolve.connect(max_pending=32) as resolve:
+    ...     project_manager = await resolve.get_project_manager()
+    ...     project = await project_manager.get_current_project()
+    ...     timeline = await project.get_current_timeline()
+    ...     items = await timeline.get_item_list_in_track(TrackType.VIDEO_TRACK, 1)
+    ...     names = await asyncio.gather(*(item.get_name() for item in items))
+    ...     job_id = await project.add_render_job()
+    ...     await project.start_rendering([job_id])
+    ...     statuses = await project.wait_for_render([job_id], poll_interval=2)
+"""
+
+import asyncio
+import functools
+import inspect
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from pybmd._wrapper_base import WrapperBase
+from pybmd.executor import ConnectionExecutor
+from pybmd.project import Project
+from pybmd.resolve import Resolve
+from pybmd.timeline import Timeline, TrackType
+
+# wrapper type -> async counterpart, filled by AsyncWrapper subclasses
+_ASYNC_TYPES: Dict[type, type] = {}
+
+
+class _Runner(object):
+    """Submits calls of one AsyncResolve and bounds the calls in flight."""
+
+    def __init__(self, executor: ConnectionExecutor, max_pending: int):
+        self.executor = executor
+        self.max_pending = max_pending
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def run(self, fn: Callable, args: tuple, kwargs: dict, coalesce=False):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+        async with self._semaphore:
+            waiter = asyncio.wrap_future(
+                self.executor.submit(fn, *args, coalesce=coalesce, **kwargs)
+            )
+            # a coalesced future is shared with other callers, cancelling one
+            # of them must not cancel it for the rest
+            return await (asyncio.shield(waiter) if coalesce else waiter)
+
+    def to_async(self, value):
+        if isinstance(value, WrapperBase):
+            return _ASYNC_TYPES.get(type(value), AsyncWrapper)(value, self)
+        if isinstance(value, list):
+            return [self.to_async(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.to_async(item) for key, item in value.items()}
+        return value
+
+
+def _mirror(name: str, function: Callable) -> Callable:
+    @functools.wraps(function)
+    async def method(self, *args, **kwargs):
+        return await self._call(getattr(self._wrapper, name), args, kwargs)
+
+    return method
+
+
+def _read_property(self, name: str):
+    # getattr runs the property getter on the connection thread
+    return self._call(getattr, (self._wrapper, name), {})
+
+
+def _mirror_property(name: str, prop: property) -> property:
+    return property(lambda self: _read_property(self, name), doc=prop.__doc__)
+
+
+class AsyncWrapper(object):
+    """Coroutine mirror of a pybmd wrapper.
+
+    Subclasses name the mirrored class with ``wraps=``: its public methods
+    become coroutine methods and its public properties awaitable properties of
+    the subclass unless the subclass defines them itself. Methods and
+    properties of wrappers without a dedicated subclass are mirrored on
+    attribute access.
+    """
+
+    __slots__ = ("_wrapper", "_runner")
+
+    def __init_subclass__(cls, wraps: Optional[type] = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if wraps is None:
+            return
+        for klass in reversed(wraps.__mro__):
+            for name, attr in vars(klass).items():
+                if name.startswith("_") or name in cls.__dict__:
+                    continue
+                if inspect.isfunction(attr):
+                    setattr(cls, name, _mirror(name, attr))
+                elif isinstance(attr, property):
+                    setattr(cls, name, _mirror_property(name, attr))
+        _ASYNC_TYPES[wraps] = cls
+
+    def __init__(self, wrapper, runner: _Runner):
+        self._wrapper = wrapper
+        self._runner = runner
+
+    @property
+    def sync(self):
+        """The mirrored synchronous wrapper."""
+        return self._wrapper
+
+    async def _call(self, method: Callable, args: tuple, kwargs: dict):
+        return self._runner.to_async(await self._runner.run(method, args, kwargs))
+
+    def __getattr__(self, name: str):
+        if not name.startswith("_") and isinstance(
+            getattr(type(self._wrapper), name, None), property
+        ):
+            return _read_property(self, name)
+        attr = getattr(self._wrapper, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            return await self._call(attr, args, kwargs)
+
+        return method
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} of {self._wrapper!r}>"
+
+
+class AsyncResolve(AsyncWrapper, wraps=Resolve):
+    """Coroutine mirror of Resolve.
+
+    Args:
+        resolve (Resolve): Resolve created with an executor, e.g. Resolve(executor=True)
+        max_pending (int, optional): calls allowed to wait on the connection at a time. Defaults to 16.
+
+    Raises:
+        ValueError: resolve has no executor.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, resolve: Resolve, max_pending: int = 16):
+        if resolve.executor is None:
+            raise ValueError("AsyncResolve needs a Resolve created with executor=True")
+        super().__init__(resolve, _Runner(resolve.executor, max_pending))
+
+    @classmethod
+    async def connect(
+        cls,
+        resolve_ip: str = "127.0.0.1",
+        auto_start: bool = False,
+        bmd_module=None,
+        max_pending: int = 16,
+    ) -> "AsyncResolve":
+        """Opens a Resolve connection on a new connection thread.
+
+        Args:
+            resolve_ip (str, optional): davinci resolve ip. Defaults to 127.0.0.1.
+            auto_start (bool, optional): open davinci automatically if it's not running. Defaults to False.
+            bmd_module (BMDModule, optional): scripting module providing scriptapp(). Defaults to None (load fusionscript).
+            max_pending (int, optional): calls allowed to wait on the connection at a time. Defaults to 16.
+
+        Returns:
+            AsyncResolve: connected facade
+        """
+        executor = ConnectionExecutor()
+        try:
+            resolve = await asyncio.wrap_future(
+                executor.submit(Resolve, resolve_ip, auto_start, bmd_module, executor)
+            )
+        except BaseException:
+            executor.shutdown(wait=False, cancel_pending=True)
+            raise
+        return cls(resolve, max_pending)
+
+    @property
+    def executor(self) -> ConnectionExecutor:
+        return self._runner.executor
+
+    async def submit(self, fn: Callable, *args, coalesce: bool = False, **kwargs):
+        """Runs fn(*args, **kwargs), e.g. a synchronous wrapper method, on the connection thread.
+
+        Args:
+            fn (Callable): callable using this connection
+            coalesce (bool, optional): share the result of an identical call still waiting in the queue. Defaults to False.
+
+        Returns:
+            Any: result of fn, wrappers converted to their async counterpart
+        """
+        return self._runner.to_async(
+            await self._runner.run(fn, args, kwargs, coalesce=coalesce)
+        )
+
+    def close(self):
+        """Stops the connection thread once the queued calls are done, without waiting for it."""
+        self._runner.executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class AsyncProject(AsyncWrapper, wraps=Project):
+    """Coroutine mirror of Project."""
+
+    __slots__ = ()
+
+    async def _render_job_ids(self, job_ids: Optional[List[str]]) -> List[str]:
+        if job_ids is not None:
+            return list(job_ids)
+        return [job["JobId"] for job in await self.get_render_job_list()]
+
+    async def watch_render(
+        self, job_ids: Optional[List[str]] = None, poll_interval: float = 1.0
+    ) -> AsyncIterator[Dict[str, dict]]:
+        """Polls render job status until rendering stops.
+
+        Args:
+            job_ids (List[str], optional): jobs to report. Defaults to None (all jobs in the render queue).
+            poll_interval (float, optional): seconds between polls. Defaults to 1.0.
+
+        Yields:
+            Dict[str, dict]: job id to job status, the last one after rendering stopped
+        """
+        job_ids = await self._render_job_ids(job_ids)
+        while True:
+            in_progress = await self.is_rendering_in_progress()
+            statuses = await asyncio.gather(
+                *(self.get_render_job_status(job_id) for job_id in job_ids)
+            )
+            yield dict(zip(job_ids, statuses))
+            if not in_progress:
+                return
+            await asyncio.sleep(poll_interval)
+
+    async def wait_for_render(
+        self,
+        job_ids: Optional[List[str]] = None,
+        poll_interval: float = 1.0,
+        timeout: Optional[float] = None,
+        stop_on_cancel: bool = False,
+    ) -> Dict[str, dict]:
+        """Waits until rendering stops and returns the final job status.
+
+        Args:
+            job_ids (List[str], optional): jobs to report. Defaults to None (all jobs in the render queue).
+            poll_interval (float, optional): seconds between polls. Defaults to 1.0.
+            timeout (float, optional): seconds to wait at most. Defaults to None (no limit).
+            stop_on_cancel (bool, optional): stop rendering when the wait is cancelled or times out. Defaults to False.
+
+        Raises:
+            TimeoutError: rendering did not stop within timeout.
+
+        Returns:
+            Dict[str, dict]: job id to final job status
+        """
+
+        async def poll():
+            statuses = {}
+            async for statuses in self.watch_render(job_ids, poll_interval):
+                pass
+            return statuses
+
+        try:
+            return await asyncio.wait_for(poll(), timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            if stop_on_cancel:
+                await asyncio.shield(self.stop_rendering())
+            raise
+
+
+class AsyncTimeline(AsyncWrapper, wraps=Timeline):
+    """Coroutine mirror of Timeline."""
+
+    __slots__ = ()
+
+    async def iter_items(
+        self, track_type: TrackType = TrackType.VIDEO_TRACK
+    ) -> AsyncIterator[AsyncWrapper]:
+        """Yields the items of every track of track_type, track by track.
+
+        Args:
+            track_type (TrackType, optional): tracks to scan. Defaults to TrackType.VIDEO_TRACK.
+
+        Yields:
+            AsyncWrapper: timeline item
+        """
+        track_count = await self.get_track_count(track_type)
+        for index in range(1, track_count + 1):
+            for item in await self.get_item_list_in_track(track_type, index):
+                yield item
@@ -10,9 +10,11 @@ if TYPE_CHECKING:
 class ColorGroup(WrapperBase):
     """docstring for ColorGroup."""
 
-    def __init__(self, color_group):
-        super(ColorGroup, self).__init__(color_group)
-        self._color_group = self._object
+    __slots__ = ()
+    _color_group = WrapperBase._handle_alias
+
+    def __init__(self, color_group, context=None):
+        super(ColorGroup, self).__init__(color_group, context)
 
     def get_name(self) -> str:
         """Returns the name (string) of the ColorGroup.
@@ -20,7 +22,7 @@ class ColorGroup(WrapperBase):
         Returns:
             str: name of the ColorGroup.
         """
-        return self._color_group.GetName()
+        return self._object.GetName()
 
     def set_name(self, group_name: str) -> bool:
         """Renames ColorGroup to groupName (string).
@@ -31,7 +33,7 @@ class ColorGroup(WrapperBase):
         Returns:
             bool: Returns True if successful, False otherwise.
         """
-        return self._color_group.SetName(group_name)
+        return self._object.SetName(group_name)
 
     def get_clips_in_timeline(self, timeline: "Timeline") -> List["TimelineItem"]:
         """Returns a list of TimelineItem that are in colorGroup in the given Timeline.
@@ -43,8 +45,8 @@ class ColorGroup(WrapperBase):
             List[TimelineItem]: a list of TimelineItem that are in colorGroup in the given Timeline.
         """
         timeline_item_list = [
-            TimelineItem(ti_item)
-            for ti_item in self._color_group.GetClipsInTimeline(timeline._timeline)
+            TimelineItem._wrap(ti_item, self._context)
+            for ti_item in self._object.GetClipsInTimeline(timeline._object)
         ]
         return timeline_item_list
 
@@ -54,7 +56,7 @@ class ColorGroup(WrapperBase):
         Returns:
             Graph: ColorGroup Pre-clip graph
         """
-        return Graph(self._color_group.GetPreClipNodeGraph())
+        return Graph(self._object.GetPreClipNodeGraph(), self._context)
 
     def get_post_clip_node_graph(self) -> Graph:
         """Returns the ColorGroup Post-clip graph.
@@ -62,4 +64,4 @@ class ColorGroup(WrapperBase):
         Returns:
             Graph: ColorGroup Post-clip graph
         """
-        return Graph(self._color_group.GetPostClipNodeGraph())
+        return Graph(self._object.GetPostClipNodeGraph(), self._context)
@@ -7,24 +7,78 @@ check version compatibility at runtime. When a method is decorated, it will:
 3. Raise APIVersionError if incompatible
 4. Warn if deprecated
 
+Compatibility is evaluated once for every registered API when a Resolve
+instance learns its version and kept in its ResolveContext. Calls on wrappers
+then look up the precomputed gate of the connection they belong to, so
+wrappers of Resolve instances with different versions are checked against
+their own version.
+
 Example:
     @requires_resolve_version(added_in="20.2.0")
     def set_name(self, name: str) -> bool:
-        return self._timeline_item.SetName(name)
+        return self._object.SetName(name)
 """
 
 import functools
 import warnings
-from typing import Callable, Optional, TypeVar, cast, Any
+from typing import Callable, Optional, Tuple, TypeVar, cast, Any
 
 from pybmd.version_info import Version, VersionConstraint, APIStatus
-from pybmd.version_registry import VersionRegistry
+from pybmd.version_registry import GateStatus, VersionRegistry
 from pybmd.error import APIVersionError, APIDeprecationWarning
 
 
 F = TypeVar('F', bound=Callable)
 
 
+def _evaluate_gate(
+    api_name: str, constraint: VersionConstraint, gate_index: int, args: tuple
+) -> GateStatus:
+    """Evaluate a constraint when the precomputed gate is unavailable (slow path).
+
+    Extends the context gates for APIs registered after the context was
+    created, without a context falls back to the global Resolve version.
+    """
+    context = getattr(args[0], "_context", None) if args else None
+    if context is not None:
+        context.sync_gates()
+        return context.gate_status[gate_index]
+
+    # Lazy import to avoid circular dependency
+    from pybmd.resolve import RESOLVE_VERSION
+
+    # Get current Resolve version
+    if RESOLVE_VERSION is None:
+        raise APIVersionError(
+            api_name=api_name,
+            current_version="unknown",
+            constraint="Resolve version not initialized. Please create a Resolve instance first.",
+        )
+
+    current_version = Version.from_list(RESOLVE_VERSION)
+    return VersionRegistry.compute_gate_status(constraint, current_version)
+
+
+def _enforce_gate(
+    api_name: str, gate: Tuple[bool, APIStatus, str, str], moved_to: Optional[str]
+) -> None:
+    """Raise or warn for a gate that is not a plain pass-through."""
+    is_compatible, status, message, current_version = gate
+
+    if not is_compatible:
+        raise APIVersionError(
+            api_name=api_name,
+            current_version=current_version,
+            constraint=message,
+            moved_to=moved_to,
+        )
+
+    # Warn if deprecated
+    if status == APIStatus.DEPRECATED:
+        # stacklevel 3 points past the decorator wrapper at the caller
+        warnings.warn(f"{api_name}: {message}", APIDeprecationWarning, stacklevel=3)
+
+
 def requires_resolve_version(
     added_in: Optional[str] = None,
     removed_in: Optional[str] = None,
@@ -60,7 +114,7 @@ def requires_resolve_version(
         Basic usage with minimum version:
         >>> @requires_resolve_version(added_in="20.2.0")
         ... def set_name(self, name: str) -> bool:
-        ...     return self._timeline_item.SetName(name)
+        ...     return self._object.SetName(name)
 
         API that was moved:
         >>> @requires_resolve_version(
@@ -70,7 +124,7 @@ def requires_resolve_version(
         ...     notes="Use get_node_graph().set_lut() instead"
         ... )
         ... def set_lut(self, node_index: int, lut_path: str) -> bool:
-        ...     return self._timeline_item.SetLUT(node_index, lut_path)
+        ...     return self._object.SetLUT(node_index, lut_path)
 
         Deprecated API:
         >>> @requires_resolve_version(
@@ -100,39 +154,19 @@ def requires_resolve_version(
         api_identifier = (
             f"{class_name}.{func.__name__}" if class_name else func.__name__
         )
-        VersionRegistry.register(api_identifier, constraint)
+        gate_index = VersionRegistry.register(api_identifier, constraint)
+        api_name = func.__name__
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Lazy import to avoid circular dependency
-            from pybmd.resolve import RESOLVE_VERSION
-
-            # Get current Resolve version
-            if RESOLVE_VERSION is None:
-                raise APIVersionError(
-                    api_name=func.__name__,
-                    current_version="unknown",
-                    constraint="Resolve version not initialized. Please create a Resolve instance first.",
-                )
-
-            current_version = Version.from_list(RESOLVE_VERSION)
-
-            # Check compatibility
-            is_compatible, status, message = constraint.get_status(current_version)
-
-            if not is_compatible:
-                raise APIVersionError(
-                    api_name=func.__name__,
-                    current_version=str(current_version),
-                    constraint=message,
-                    moved_to=moved_to,
-                )
-
-            # Warn if deprecated
-            if status == APIStatus.DEPRECATED:
-                warnings.warn(
-                    f"{func.__name__}: {message}", APIDeprecationWarning, stacklevel=2
-                )
+            # Fast path: gates precomputed for the connection of self
+            try:
+                gate = args[0]._context.gate_status[gate_index]
+            except (AttributeError, IndexError):
+                gate = _evaluate_gate(api_name, constraint, gate_index, args)
+
+            if gate is not None:
+                _enforce_gate(api_name, gate, moved_to)
 
             # Call the original function
             return func(*args, **kwargs)
@@ -162,7 +196,7 @@ def minimum_resolve_version(version_str: str) -> Callable:
     Example:
         >>> @minimum_resolve_version("20.0.0")
         ... def link_full_resolution_media(self, file_path: str) -> bool:
-        ...     return self._media_pool_item.LinkProxyMedia(file_path)
+        ...     return self._object.LinkProxyMedia(file_path)
     """
     return requires_resolve_version(added_in=version_str)
 
@@ -56,4 +56,23 @@ class APIDeprecationWarning(Warning):
     Emitted when using an API that has been deprecated but still functions.
     The warning message typically suggests an alternative API to use.
     """
-    pass
\ No newline at end of file
+    pass
+
+class ReplayMismatchError(Exception):
+    """Error for a scripting call diverging from a recorded session.
+
+    Raised by pybmd.replay when the replayed program makes a call that is not
+    the next one in the recording.
+
+    Attributes:
+        seq: Index of the expected call in the recording
+        expected: Description of the recorded call
+        actual: Description of the call that was made
+    """
+    def __init__(self, seq: int, expected: str, actual: str):
+        super().__init__(
+            f"Replay diverged at call #{seq}: expected {expected}, got {actual}"
+        )
+        self.seq = seq
+        self.expected = expected
+        self.actual = actual
@@ -0,0 +1,287 @@
+"""Run every scripting call of a Resolve connection on one owner thread.
+
+fusionscript objects must not be used from arbitrary threads. With
+``Resolve(executor=True)`` the connection is opened on the thread of a
+ConnectionExecutor and every raw scripting object handed out is a
+MarshallingObject: calling one of its methods from any thread runs the call on
+the owner thread and blocks until the result is back. Code running on the
+owner thread itself calls straight through.
+
+Whole wrapper calls can be queued with `ConnectionExecutor.submit` (or
+`Resolve.submit`), which returns a `concurrent.futures.Future`. Meanwhile the
+submitting thread is free for CPU side work such as timecode math, file I/O or
+renaming exported stills. Calls submitted with ``coalesce=True`` that are
+identical to one still waiting in the queue share its future instead of
+running again.
+
+Example:
+    >>> resolve = Resolve(executor=True)
+    >>> timeline = resolve.get_project_manager().get_current_project().get_current_timeline()
+    >>> future = resolve.submit(timeline.get_item_list_in_track, TrackType.VIDEO_TRACK, 1)
+    >>> ...  # other work while Resolve answers
+    >>> items = future.result()
+    >>> resolve.executor.stats().max_depth
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Callable, Dict, Optional
+
+from pybmd._proxy import ObjectProxy, unwrap
+
+_PRIMITIVES = (type(None), bool, int, float, str)
+
+
+@dataclass
+class QueueStats:
+    """Queue statistics of a ConnectionExecutor.
+
+    Attributes:
+        submitted: calls queued
+        executed: calls run on the owner thread
+        coalesced: submissions answered by an identical queued call
+        cancelled: queued calls cancelled before they ran
+        max_depth: largest number of calls waiting in the queue
+        depth_total: sum of the queue depth seen by every submission
+        wait_total: seconds calls spent waiting in the queue
+        run_total: seconds the owner thread spent running calls
+    """
+
+    submitted: int = 0
+    executed: int = 0
+    coalesced: int = 0
+    cancelled: int = 0
+    max_depth: int = 0
+    depth_total: int = 0
+    wait_total: float = 0.0
+    run_total: float = 0.0
+
+    @property
+    def mean_depth(self) -> float:
+        return self.depth_total / self.submitted if self.submitted else 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        done = self.executed + self.cancelled
+        return self.wait_total / done if done else 0.0
+
+    def to_dict(self) -> dict:
+        result = asdict(self)
+        result["mean_depth"] = self.mean_depth
+        result["mean_wait"] = self.mean_wait
+        return result
+
+
+class _WorkItem(object):
+    __slots__ = ("fn", "args", "kwargs", "future", "key", "queued_at")
+
+    def __init__(self, fn, args, kwargs, key):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future = Future()
+        self.key = key
+        self.queued_at = time.perf_counter()
+
+
+def _coalesce_key(fn, args: tuple, kwargs: dict):
+    key = (fn, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        # unhashable arguments, e.g. a list of clips, are never coalesced
+        return None
+    return key
+
+
+class ConnectionExecutor(object):
+    """Owner thread of a Resolve scripting connection.
+
+    Args:
+        name (str, optional): name of the owner thread. Defaults to "pybmd-connection".
+    """
+
+    def __init__(self, name: str = "pybmd-connection"):
+        self._condition = threading.Condition()
+        self._queue: "deque[_WorkItem]" = deque()
+        self._pending: Dict[Any, _WorkItem] = {}
+        self._stats = QueueStats()
+        self._shutdown = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def depth(self) -> int:
+        """Number of calls waiting in the queue."""
+        return len(self._queue)
+
+    def is_owner_thread(self) -> bool:
+        """Whether the calling thread is the owner thread."""
+        return threading.get_ident() == self._thread.ident
+
+    def submit(
+        self, fn: Callable, /, *args, coalesce: bool = False, **kwargs
+    ) -> Future:
+        """Queues fn(*args, **kwargs) for the owner thread.
+
+        Do not wait for the returned future on the owner thread itself, use
+        `call` there.
+
+        Args:
+            fn (Callable): wrapper method or any callable using the connection
+            coalesce (bool, optional): share the future of an identical call still waiting in the queue (same callable and arguments). Cancelling a shared future cancels it for all submitters. Defaults to False.
+
+        Returns:
+            Future: result of the call
+
+        Raises:
+            RuntimeError: the executor is shut down
+        """
+        key = _coalesce_key(fn, args, kwargs) if coalesce else None
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot submit to a shut down ConnectionExecutor")
+            if key is not None:
+                queued = self._pending.get(key)
+                if queued is not None:
+                    self._stats.coalesced += 1
+                    return queued.future
+            item = _WorkItem(fn, args, kwargs, key)
+            if key is not None:
+                self._pending[key] = item
+            self._queue.append(item)
+            depth = len(self._queue)
+            self._stats.submitted += 1
+            self._stats.depth_total += depth
+            if depth > self._stats.max_depth:
+                self._stats.max_depth = depth
+            self._condition.notify()
+        return item.future
+
+    def call(self, fn: Callable, /, *args, **kwargs):
+        """Runs fn(*args, **kwargs) on the owner thread and returns its result.
+
+        Called on the owner thread, fn runs right away.
+        """
+        if threading.get_ident() == self._thread.ident:
+            return fn(*args, **kwargs)
+        return self.submit(fn, *args, **kwargs).result()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._shutdown:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                item = self._queue.popleft()
+                if item.key is not None:
+                    del self._pending[item.key]
+                self._stats.wait_total += time.perf_counter() - item.queued_at
+            if not item.future.set_running_or_notify_cancel():
+                with self._condition:
+                    self._stats.cancelled += 1
+                continue
+            start = time.perf_counter()
+            try:
+                result = item.fn(*item.args, **item.kwargs)
+            except BaseException as error:
+                item.future.set_exception(error)
+            else:
+                item.future.set_result(result)
+            with self._condition:
+                self._stats.executed += 1
+                self._stats.run_total += time.perf_counter() - start
+
+    def stats(self) -> QueueStats:
+        """Returns a snapshot of the queue statistics."""
+        with self._condition:
+            return replace(self._stats)
+
+    def reset_stats(self):
+        with self._condition:
+            self._stats = QueueStats()
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False):
+        """Stops the owner thread once the queue is drained.
+
+        Args:
+            wait (bool, optional): block until the owner thread has finished. Defaults to True.
+            cancel_pending (bool, optional): cancel calls still waiting in the queue. Defaults to False.
+        """
+        with self._condition:
+            self._shutdown = True
+            if cancel_pending:
+                for item in self._queue:
+                    item.future.cancel()
+            self._condition.notify()
+        if wait and not self.is_owner_thread():
+            self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+
+class MarshallingObject(ObjectProxy):
+    """Proxy running every call on a scripting object on the owner thread."""
+
+    __slots__ = ("_executor",)
+
+    # (scripting object type, attribute name) -> attribute is a method
+    _callable_attrs: Dict[tuple, bool] = {}
+
+    def __init__(self, target, executor: ConnectionExecutor):
+        super().__init__(target)
+        object.__setattr__(self, "_executor", executor)
+
+    def __getattr__(self, name: str):
+        target = self._target
+        key = (type(target), name)
+        is_method = MarshallingObject._callable_attrs.get(key)
+        if is_method is None:
+            attr = self._executor.call(getattr, target, name)
+            is_method = MarshallingObject._callable_attrs[key] = callable(attr)
+            if not is_method:
+                return attr
+        elif not is_method:
+            return self._executor.call(getattr, target, name)
+
+        def method(*args, **kwargs):
+            return self._call(name, None, args, kwargs)
+
+        return method
+
+    def __setattr__(self, name: str, value):
+        self._executor.call(setattr, self._target, name, unwrap(value))
+
+    def _call(self, name: str, method, args: tuple, kwargs: dict):
+        # attribute lookup and call in a single trip to the owner thread
+        result = self._executor.call(
+            _invoke, self._target, name, unwrap(args), unwrap(kwargs)
+        )
+        return marshal(result, self._executor)
+
+
+def _invoke(target, name: str, args: tuple, kwargs: dict):
+    return getattr(target, name)(*args, **kwargs)
+
+
+def marshal(value, executor: Optional[ConnectionExecutor]):
+    """Replaces scripting objects in value by proxies bound to executor."""
+    if executor is None or isinstance(value, _PRIMITIVES):
+        return value
+    if isinstance(value, MarshallingObject):
+        return value
+    if isinstance(value, list):
+        return [marshal(item, executor) for item in value]
+    if isinstance(value, tuple):
+        return tuple(marshal(item, executor) for item in value)
+    if isinstance(value, dict):
+        return {key: marshal(item, executor) for key, item in value.items()}
+    return MarshallingObject(value, executor)
@@ -4,10 +4,12 @@ from pybmd.media_pool_item import MediaPoolItem
 
 
 class Folder(WrapperBase):
+
+    __slots__ = ()
+    _folder = WrapperBase._handle_alias
     
-    def __init__(self, folder):
-        super(Folder, self).__init__(folder)
-        self._folder = self._object
+    def __init__(self, folder, context=None):
+        super(Folder, self).__init__(folder, context)
     
     def __repr__(self) -> str:
         return f'Folder: {self.get_name()}'
@@ -15,30 +17,32 @@ class Folder(WrapperBase):
     def get_clip_list(self) -> List[MediaPoolItem]:
         """Returns list of MediaPoolItem objects for all clips in this folder."""
         media_pool_item_list = []
-        for media_pool_item in self._folder.GetClipList():
-            media_pool_item_list.append(MediaPoolItem(media_pool_item))
+        for media_pool_item in self._object.GetClipList():
+            media_pool_item_list.append(
+                MediaPoolItem._wrap(media_pool_item, self._context)
+            )
         return media_pool_item_list
 
     def get_name(self) -> str:
         """Returns name of this folder."""
-        return self._folder.GetName()
+        return self._object.GetName()
     
     def get_sub_folder_list(self) -> List['Folder']:
         """Return a list of sub folders in this folder."""
         folder_list = []
-        for folder in self._folder.GetSubFolderList():
-            folder_list.append(Folder(folder))
+        for folder in self._object.GetSubFolderList():
+            folder_list.append(Folder(folder, self._context))
         return folder_list
     
     ###########################################################################
     #Add at DR18.0.0
     def get_is_folder_stale(self) -> bool:
         """Returns true if folder is stale in collaboration mode, false otherwise"""
-        return self._folder.GetIsFolderStale()
+        return self._object.GetIsFolderStale()
     
     def get_unique_id(self) -> str:
         """Returns a unique ID for the media pool folder"""
-        return self._folder.GetUniqueId()
+        return self._object.GetUniqueId()
     
     ###########################################################################
     #Add at DR18.5.0
@@ -51,7 +55,7 @@ class Folder(WrapperBase):
         Returns:
             bool: Returns true if export of DRB folder to filePath is successful, false otherwise
         """        
-        return self._folder.Export(file_path)   
+        return self._object.Export(file_path)   
     ###########################################################################
     #Add at DR18.6.4
     def transcribe_audio(self) -> bool:
@@ -60,7 +64,7 @@ class Folder(WrapperBase):
         Returns:
             bool: Returns True if successful; False otherwise
         """        
-        return self._folder.TranscribeAudio()
+        return self._object.TranscribeAudio()
     
     def clear_transcription(self) -> bool:
         """Clears audio transcription of the MediaPoolItems within the folder and nested folders.
@@ -68,6 +72,4 @@ class Folder(WrapperBase):
         Returns:
             bool: Returns True if successful; False otherwise.
         """        
-        return self._folder.ClearTranscription()
-    
-    
\ No newline at end of file
+        return self._object.ClearTranscription()
@@ -6,26 +6,28 @@ from pybmd.ui_manager import UI_Manager
 class Fusion(WrapperBase):
     """docstring for Fusion."""
 
-    def __init__(self, fusion_obj):
-        super(Fusion, self).__init__(fusion_obj)
-        self._fusion = self._object
-        self._ui_manager = UI_Manager(self._fusion.UIManager)
+    __slots__ = ("_ui_manager",)
+    _fusion = WrapperBase._handle_alias
+
+    def __init__(self, fusion_obj, context=None):
+        super(Fusion, self).__init__(fusion_obj, context)
+        self._ui_manager = UI_Manager(self._object.UIManager, self._context)
 
     @property
     def ui_manager(self) -> UI_Manager:
         return self._ui_manager
 
     def set_pref(self, pref_name: str, pref_value) -> bool:
-        return self._fusion.SetPrefs(pref_name, pref_value)
+        return self._object.SetPrefs(pref_name, pref_value)
 
     def set_prefs(self, prefs_dict: dict[str, Any]) -> bool:  # -> Any:
-        return self._fusion.SetPrefs(prefs_dict)
+        return self._object.SetPrefs(prefs_dict)
 
     def get_prefs(self, pref_name: str = "") -> Dict | Any:
-        return self._fusion.GetPrefs(pref_name)
+        return self._object.GetPrefs(pref_name)
 
     def load_prefs(self, file_name: str = "") -> bool:
-        return self._fusion.LoadPrefs(file_name)
+        return self._object.LoadPrefs(file_name)
 
     def save_prefs(self, file_name: str) -> bool:
-        return self._fusion.SavePrefs(file_name)
+        return self._object.SavePrefs(file_name)
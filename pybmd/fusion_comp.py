@@ -3,9 +3,11 @@ from pybmd._wrapper_base import WrapperBase
 
 class FusionComp(WrapperBase):
     """Fusion Composite Object"""
-    def __init__(self, fusion_comp):
-        super(FusionComp, self).__init__(fusion_comp)
-        self._fusion_comp = self._object
+
+    __slots__ = ()
+    _fusion_comp = WrapperBase._handle_alias
+    def __init__(self, fusion_comp, context=None):
+        super(FusionComp, self).__init__(fusion_comp, context)
         
     
 
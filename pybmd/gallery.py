@@ -7,23 +7,27 @@ from pybmd.gallery_still_album import GalleryStillAlbum
 class Gallery(WrapperBase):
     """docstring for Gallery."""
 
-    def __init__(self, gallery):
-        super(Gallery, self).__init__(gallery)
-        self._gallery = self._object
+    __slots__ = ()
+    _gallery = WrapperBase._handle_alias
+
+    def __init__(self, gallery, context=None):
+        super(Gallery, self).__init__(gallery, context)
 
     def get_album_name(self, gallery_still_album: GalleryStillAlbum) -> str:
         """return the album name of the GalleryStillAlbum object"""
-        return self._gallery.GetAlbumName(gallery_still_album)
+        return self._object.GetAlbumName(gallery_still_album._object)
 
     def get_current_still_album(self) -> GalleryStillAlbum:
         """return the current GalleryStillAlbum object"""
-        return GalleryStillAlbum(self._gallery.GetCurrentStillAlbum())
+        return GalleryStillAlbum(self._object.GetCurrentStillAlbum(), self._context)
 
     def get_gallery_still_albums(self) -> List[GalleryStillAlbum]:
         """return a list of GalleryStillAlbum objects"""
         gallery_still_album_list = []
-        for gallery_still_album in self._gallery.GetGalleryStillAlbums():
-            gallery_still_album_list.append(GalleryStillAlbum(gallery_still_album))
+        for gallery_still_album in self._object.GetGalleryStillAlbums():
+            gallery_still_album_list.append(
+                GalleryStillAlbum(gallery_still_album, self._context)
+            )
         return gallery_still_album_list
 
     def set_album_name(
@@ -38,8 +42,8 @@ class Gallery(WrapperBase):
         Returns:
             bool: true if successful, false otherwise
         """
-        return self._gallery.SetAlbumName(
-            gallery_still_album._gallery_still_album, album_name
+        return self._object.SetAlbumName(
+            gallery_still_album._object, album_name
         )
 
     def set_current_still_album(self, gallery_still_album: GalleryStillAlbum) -> bool:
@@ -53,8 +57,8 @@ class Gallery(WrapperBase):
         """
         if gallery_still_album is None:
             return False
-        return self._gallery.SetCurrentStillAlbum(
-            gallery_still_album._gallery_still_album
+        return self._object.SetCurrentStillAlbum(
+            gallery_still_album._object
         )
 
     ##############################################################################################################
@@ -73,8 +77,8 @@ class Gallery(WrapperBase):
             Added in DaVinci Resolve 19.1.0
         """
         power_grade_albums = []
-        for album in self._gallery.GetGalleryPowerGradeAlbums():
-            power_grade_albums.append(GalleryStillAlbum(album))
+        for album in self._object.GetGalleryPowerGradeAlbums():
+            power_grade_albums.append(GalleryStillAlbum(album, self._context))
         return power_grade_albums
 
     @requires_resolve_version(added_in="19.1.0")
@@ -84,8 +88,8 @@ class Gallery(WrapperBase):
         Returns:
             Optional[GalleryStillAlbum]: New gallery still album object if successful, None otherwise
         """
-        album = self._gallery.CreateGalleryStillAlbum()
-        return GalleryStillAlbum(album) if album else None
+        album = self._object.CreateGalleryStillAlbum()
+        return GalleryStillAlbum(album, self._context) if album else None
 
     @requires_resolve_version(added_in="19.1.0")
     def create_gallery_power_grade_album(self) -> Optional[GalleryStillAlbum]:
@@ -94,5 +98,5 @@ class Gallery(WrapperBase):
         Returns:
             Optional[GalleryStillAlbum]: New gallery PowerGrade album object if successful, None otherwise
         """
-        album = self._gallery.CreateGalleryPowerGradeAlbum()
-        return GalleryStillAlbum(album) if album else None
+        album = self._object.CreateGalleryPowerGradeAlbum()
+        return GalleryStillAlbum(album, self._context) if album else None
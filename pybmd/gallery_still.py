@@ -4,6 +4,8 @@ from pybmd._wrapper_base import WrapperBase
 class GalleryStill(WrapperBase):
     """GalleryStill Object"""
 
-    def __init__(self, gallery_still):
-        super(GalleryStill, self).__init__(gallery_still)
-        self._gallery_still = self._object
+    __slots__ = ()
+    _gallery_still = WrapperBase._handle_alias
+
+    def __init__(self, gallery_still, context=None):
+        super(GalleryStill, self).__init__(gallery_still, context)
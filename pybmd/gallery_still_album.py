@@ -22,14 +22,16 @@ class StillFormat(Enum):
 class GalleryStillAlbum(WrapperBase):
     """docstring for GalleryStillAlbum."""
 
-    def __init__(self, gallery_still_album):
-        super(GalleryStillAlbum, self).__init__(gallery_still_album)
-        self._gallery_still_album = self._object
+    __slots__ = ()
+    _gallery_still_album = WrapperBase._handle_alias
+
+    def __init__(self, gallery_still_album, context=None):
+        super(GalleryStillAlbum, self).__init__(gallery_still_album, context)
 
     def delete_stills(self, gallery_stills: List[GalleryStill]) -> bool:
         """Delete the given gallery stills from the album."""
-        gallery_still_list = [still._gallery_still for still in gallery_stills]
-        return self._gallery_still_album.DeleteStills(gallery_still_list)
+        gallery_still_list = [still._object for still in gallery_stills]
+        return self._object.DeleteStills(gallery_still_list)
 
     def export_stills(
         self,
@@ -48,20 +50,20 @@ class GalleryStillAlbum(WrapperBase):
         Returns:
             bool: function returns true if export was successful, false otherwise
         """
-        gallery_still_list = [still._gallery_still for still in gallery_stills]
-        return self._gallery_still_album.ExportStills(
+        gallery_still_list = [still._object for still in gallery_stills]
+        return self._object.ExportStills(
             gallery_still_list, str(folder_path), file_prefix, format.value
         )
 
     def get_label(self, gallery_still: GalleryStill) -> str:
         """Returns label of given gallery still."""
-        return self._gallery_still_album.GetLabel(gallery_still._gallery_still)
+        return self._object.GetLabel(gallery_still._object)
 
     def get_stills(self) -> List[GalleryStill]:
         """Returns list of GalleryStill objects in this album."""
         gallery_still_list = []
-        for gallery_still in self._gallery_still_album.GetStills():
-            gallery_still_list.append(GalleryStill(gallery_still))
+        for gallery_still in self._object.GetStills():
+            gallery_still_list.append(GalleryStill(gallery_still, self._context))
         return gallery_still_list
 
     def set_label(self, gallery_still: GalleryStill, label: str) -> bool:
@@ -74,7 +76,7 @@ class GalleryStillAlbum(WrapperBase):
         Returns:
             bool: true if successful, false otherwise
         """
-        return self._gallery_still_album.SetLabel(gallery_still, label)
+        return self._object.SetLabel(gallery_still._object, label)
 
     ##############################################################################################################################
     # Add at DR 20.3.0
@@ -95,4 +97,4 @@ class GalleryStillAlbum(WrapperBase):
         Version:
             Added in DaVinci Resolve 20.3.0
         """
-        return self._gallery_still_album.ImportStills(file_paths)
+        return self._object.ImportStills(file_paths)
@@ -7,9 +7,11 @@ from pybmd.decorators import requires_resolve_version
 class Graph(WrapperBase):
     """docstring for Graph."""
 
-    def __init__(self, graph):
-        super(Graph, self).__init__(graph)
-        self._graph = self._object
+    __slots__ = ()
+    _graph = WrapperBase._handle_alias
+
+    def __init__(self, graph, context=None):
+        super(Graph, self).__init__(graph, context)
 
     def get_num_nodes(self) -> int:
         """Returns the number of nodes in the graph
@@ -17,7 +19,7 @@ class Graph(WrapperBase):
         Returns:
             int: number of nodes in the graph
         """
-        return self._graph.GetNumNodes()
+        return self._object.GetNumNodes()
 
     def set_lut(self, node_index: int, lut_path: str) -> bool:
         """Sets LUT on the node mapping the node index provided
@@ -28,7 +30,7 @@ class Graph(WrapperBase):
         Returns:
             bool: The operation is successful for valid lut paths that Resolve has already discovered (see Project.RefreshLUTList).
         """
-        return self._graph.SetLUT(node_index, lut_path)
+        return self._object.SetLUT(node_index, lut_path)
 
     def get_lut(self, node_index: str) -> str:
         """Gets relative LUT path based on the node index provided
@@ -39,7 +41,7 @@ class Graph(WrapperBase):
         Returns:
             str: relative LUT path
         """
-        return self._graph.GetLUT(node_index)
+        return self._object.GetLUT(node_index)
 
     def get_node_label(self, node_index: int) -> str:
         """Returns the label of the node at nodeIndex.
@@ -50,7 +52,7 @@ class Graph(WrapperBase):
         Returns:
             str: the label of the node at nodeIndex.
         """
-        return self._graph.GetNodeLabel(node_index)
+        return self._object.GetNodeLabel(node_index)
 
     def get_tools_in_node(self, node_index: int) -> List[str]:
         """Returns toolsList (list of strings) of the tools used in the node indicated by given nodeIndex (int).
@@ -61,7 +63,7 @@ class Graph(WrapperBase):
         Returns:
             List[str]: toolsList (list of strings) of the tools used in the node indicated by given nodeIndex (int).
         """
-        return self._graph.GetToolsInNode(node_index)
+        return self._object.GetToolsInNode(node_index)
 
     def set_node_enabled(self, node_index: int, is_enable: bool) -> bool:
         """Sets the node at the given nodeIndex (int) to isEnabled (bool).
@@ -73,7 +75,7 @@ class Graph(WrapperBase):
         Returns:
             bool: Return True if the operation is successful.
         """
-        return self._graph.SetNodeEnabled(node_index, is_enable)
+        return self._object.SetNodeEnabled(node_index, is_enable)
 
     ##############################################################################################################
     # Add at DR 19.1.0
@@ -98,7 +100,7 @@ class Graph(WrapperBase):
         Version:
             Added in DaVinci Resolve 19.1.0
         """
-        return self._graph.SetNodeCacheMode(node_index, cache_value)
+        return self._object.SetNodeCacheMode(node_index, cache_value)
 
     @requires_resolve_version(added_in="19.1.0")
     def get_node_cache_mode(self, node_index: int) -> int:
@@ -113,7 +115,7 @@ class Graph(WrapperBase):
                 - resolve.CACHE_DISABLED      =  0
                 - resolve.CACHE_ENABLED       =  1
         """
-        return self._graph.GetNodeCacheMode(node_index)
+        return self._object.GetNodeCacheMode(node_index)
 
     @requires_resolve_version(added_in="19.1.0")
     def apply_grade_from_drx(self, path: str, grade_mode: int = 0) -> bool:
@@ -127,7 +129,7 @@ class Graph(WrapperBase):
         Returns:
             bool: True if successful, False otherwise
         """
-        return self._graph.ApplyGradeFromDRX(path, grade_mode)
+        return self._object.ApplyGradeFromDRX(path, grade_mode)
 
     @requires_resolve_version(added_in="19.1.0")
     def apply_arri_cdl_lut(self) -> bool:
@@ -136,7 +138,7 @@ class Graph(WrapperBase):
         Returns:
             bool: True if successful, False otherwise
         """
-        return self._graph.ApplyArriCdlLut()
+        return self._object.ApplyArriCdlLut()
 
     @requires_resolve_version(added_in="19.1.0")
     def reset_all_grades(self) -> bool:
@@ -145,4 +147,4 @@ class Graph(WrapperBase):
         Returns:
             bool: True if all grades were reset successfully, False otherwise
         """
-        return self._graph.ResetAllGrades()
+        return self._object.ResetAllGrades()
@@ -0,0 +1,224 @@
+"""Opt-in latency instrumentation for Resolve scripting round-trips.
+
+When enabled, every wrapper created afterwards routes the calls it makes on
+its raw scripting object through a timing proxy. Stats are keyed by wrapper
+class and API name (e.g. ``("Timeline", "GetItemListInTrack")``) and hold the
+call count, total and extreme latencies and a log-scale latency histogram.
+While disabled no proxy is created, wrappers talk to fusionscript directly.
+
+Example:
+    >>> from pybmd import Resolve, instrumentation
+    >>> instrumentation.enable()
+    >>> resolve = Resolve()
+    >>> resolve.get_project_manager().get_current_project().get_name()
+    >>> print(instrumentation.format_table())
+
+    Set ``PYBMD_INSTRUMENT=1`` to enable instrumentation at import time and
+    write the stats at interpreter exit, to stderr as a table or to the file
+    named by ``PYBMD_INSTRUMENT_OUTPUT`` (JSON for a ``.json`` suffix).
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from pybmd._proxy import ObjectProxy, unwrap
+
+# Upper bounds in seconds of the histogram buckets, the last bucket is open ended
+BUCKET_BOUNDS: Tuple[float, ...] = tuple(
+    mantissa * 10.0**exponent
+    for exponent in range(-5, 1)
+    for mantissa in (1, 2, 5)
+)
+
+StatsKey = Tuple[str, str]
+
+
+@dataclass
+class CallStats:
+    """Latency stats of one API called from one wrapper class."""
+
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = 0.0
+    buckets: List[int] = field(
+        default_factory=lambda: [0] * (len(BUCKET_BOUNDS) + 1)
+    )
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def record(self, elapsed: float):
+        self.count += 1
+        self.total += elapsed
+        if elapsed < self.min:
+            self.min = elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        for index, bound in enumerate(BUCKET_BOUNDS):
+            if elapsed <= bound:
+                self.buckets[index] += 1
+                return
+        self.buckets[-1] += 1
+
+    def to_dict(self) -> dict:
+        labels = [f"<={bound:g}s" for bound in BUCKET_BOUNDS] + [
+            f">{BUCKET_BOUNDS[-1]:g}s"
+        ]
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "histogram": {
+                label: hits for label, hits in zip(labels, self.buckets) if hits
+            },
+        }
+
+
+_enabled = False
+_stats: Dict[StatsKey, CallStats] = {}
+_lock = threading.Lock()
+_exit_output: Optional[str] = None
+_exit_registered = False
+
+
+class InstrumentedObject(ObjectProxy):
+    """Proxy timing every scripting call made on the wrapped object."""
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, target, owner: str):
+        super().__init__(target)
+        object.__setattr__(self, "_owner", owner)
+
+    def _call(self, name: str, method, args: tuple, kwargs: dict):
+        args, kwargs = unwrap(args), unwrap(kwargs)
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            record(self._owner, name, time.perf_counter() - start)
+
+
+def record(owner: str, api_name: str, elapsed: float):
+    """Adds one call of api_name made from wrapper class owner to the stats."""
+    key = (owner, api_name)
+    with _lock:
+        stats = _stats.get(key)
+        if stats is None:
+            stats = _stats[key] = CallStats()
+        stats.record(elapsed)
+
+
+def instrument(_object, owner: str):
+    """Returns _object wrapped in a timing proxy attributed to owner.
+
+    Marshalling and recording proxies are wrapped as well, the recorded
+    latency then includes the trip to the owner thread or the recorder.
+    """
+    if isinstance(_object, InstrumentedObject):
+        return _object
+    return InstrumentedObject(_object, owner)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def enable(output: Optional[str] = None, dump_at_exit: bool = False):
+    """Instruments every wrapper created from now on.
+
+    Args:
+        output (str, optional): file written at exit, JSON for a ``.json`` suffix, a text table otherwise. Defaults to None (stderr).
+        dump_at_exit (bool, optional): dump stats when the interpreter exits. Implied by output. Defaults to False.
+    """
+    global _enabled, _exit_output, _exit_registered
+    _enabled = True
+    if output is not None or dump_at_exit:
+        _exit_output = output
+        if not _exit_registered:
+            atexit.register(_dump_at_exit)
+            _exit_registered = True
+
+
+def disable():
+    """Stops instrumenting new wrappers. Already instrumented wrappers keep recording."""
+    global _enabled
+    _enabled = False
+
+
+def reset():
+    """Drops all recorded stats."""
+    with _lock:
+        _stats.clear()
+
+
+def get_stats() -> Dict[StatsKey, CallStats]:
+    """Returns a snapshot of the stats keyed by (wrapper class, API name)."""
+    with _lock:
+        return {
+            key: CallStats(
+                stats.count, stats.total, stats.min, stats.max, list(stats.buckets)
+            )
+            for key, stats in _stats.items()
+        }
+
+
+def to_dict() -> dict:
+    """Returns the stats as {wrapper class: {API name: stats dict}}."""
+    result: Dict[str, dict] = {}
+    for (owner, api_name), stats in sorted(get_stats().items()):
+        result.setdefault(owner, {})[api_name] = stats.to_dict()
+    return result
+
+
+def dump_json(file_path: str):
+    """Writes the stats to file_path as JSON."""
+    with open(file_path, "w", encoding="utf-8") as file:
+        json.dump(to_dict(), file, indent=2)
+
+
+def format_table(sort_by: str = "total") -> str:
+    """Formats the stats as a text table, slowest APIs first.
+
+    Args:
+        sort_by (str, optional): "total", "count", "mean" or "max". Defaults to "total".
+    """
+    rows = sorted(
+        get_stats().items(),
+        key=lambda item: getattr(item[1], sort_by),
+        reverse=True,
+    )
+    header = f"{'wrapper':<20} {'api':<32} {'count':>8} {'total ms':>10} {'mean ms':>9} {'max ms':>9}"
+    lines = [header, "-" * len(header)]
+    for (owner, api_name), stats in rows:
+        lines.append(
+            f"{owner:<20} {api_name:<32} {stats.count:>8} "
+            f"{stats.total * 1e3:>10.2f} {stats.mean * 1e3:>9.3f} {stats.max * 1e3:>9.3f}"
+        )
+    return "\n".join(lines)
+
+
+def _dump_at_exit():
+    if not _stats:
+        return
+    if _exit_output is None:
+        print(format_table(), file=sys.stderr)
+    elif _exit_output.endswith(".json"):
+        dump_json(_exit_output)
+    else:
+        with open(_exit_output, "w", encoding="utf-8") as file:
+            file.write(format_table() + "\n")
+
+
+if os.environ.get("PYBMD_INSTRUMENT", "").lower() in ("1", "true", "yes"):
+    enable(output=os.environ.get("PYBMD_INSTRUMENT_OUTPUT") or None, dump_at_exit=True)
@@ -0,0 +1,77 @@
+"""Opt-in identity interning of wrapper objects.
+
+Wrappers are normally created afresh for every raw object Resolve returns, so
+two `TimelineItem` wrappers of the same clip are different objects. With
+interning enabled, wrapper classes declaring an `_intern_id_api` (TimelineItem
+and MediaPoolItem, keyed by ``GetUniqueId()``) are looked up in a weak-value
+table first: the same Resolve object yields the same wrapper instance for as
+long as somebody holds a reference to it, and anything cached on that
+instance is reused. Each Resolve connection has its own table.
+
+Looking up the key costs one ``GetUniqueId()`` round-trip per returned object.
+
+Example:
+    >>> from pybmd import interning
+    >>> interning.enable()
+    >>> a = timeline.get_item_list_in_track(TrackType.VIDEO_TRACK, 1)
+    >>> b = timeline.get_item_list_in_track(TrackType.VIDEO_TRACK, 1)
+    >>> a[0] is b[0]
+    True
+"""
+
+import threading
+import weakref
+
+from pybmd._context import get_default_context
+
+_enabled = False
+_table: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+_lock = threading.Lock()
+
+
+def enable():
+    """Interns wrappers returned from now on."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stops interning, already interned wrappers stay valid."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _table_of(context) -> "weakref.WeakValueDictionary":
+    if context is None:
+        context = get_default_context()
+    return _table if context is None else context.interned
+
+
+def clear(context=None):
+    """Forgets all interned wrappers of context (default: the latest Resolve)."""
+    with _lock:
+        _table_of(context).clear()
+
+
+def size(context=None) -> int:
+    """Number of live interned wrappers of context (default: the latest Resolve)."""
+    return len(_table_of(context))
+
+
+def intern(cls, _object, context=None):
+    """Returns the interned cls wrapper of _object, creating it on first sight."""
+    object_id = getattr(_object, cls._intern_id_api)()
+    if not object_id:
+        return cls(_object, context)
+    key = (cls, object_id)
+    table = _table_of(context)
+    with _lock:
+        wrapper = table.get(key)
+        if wrapper is None:
+            wrapper = cls(_object, context)
+            table[key] = wrapper
+    return wrapper
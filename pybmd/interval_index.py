@@ -0,0 +1,238 @@
+"""Frame to timeline item lookups without moving the playhead.
+
+Finding the clip under a frame through the scripting API means moving the
+playhead there (``SetCurrentTimecode``) and asking ``GetCurrentVideoItem()``:
+two round-trips and a redraw per frame. TimelineIntervalIndex reads the start
+and end frame of every item once and answers "which item covers frame N on
+track T" locally. Items of one track never overlap, so each query is a binary
+search over the sorted start frames, and bulk queries over thousands of frames
+are vectorized with NumPy.
+
+Frames are record frames as returned by ``TimelineItem.get_start()``, i.e.
+they include the timeline start frame. Timeline markers are offsets from the
+start frame, add ``timeline.get_start_frame()`` to them first.
+
+Example:
+    >>> index = timeline.interval_index()
+    >>> index.item_at(86400 + 120)  # topmost video item
+    >>> index.item_at(86400 + 120, track_index=2)
+    >>> index.items_at_frames(start_frame + np.array(list(timeline.get_markers())))
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from pybmd.timeline import Timeline, TrackType
+    from pybmd.timeline_item import TimelineItem
+    from pybmd.timeline_snapshot import TimelineSnapshot
+
+
+class ItemSpan(NamedTuple):
+    """Item covering a frame, with its track and record frame range."""
+
+    track_index: int
+    start: float
+    end: float
+    item: "TimelineItem"
+
+
+class _Track(object):
+    __slots__ = ("starts", "ends", "items")
+
+    def __init__(self, starts, ends, items: List["TimelineItem"]):
+        order = np.argsort(starts, kind="stable")
+        self.starts = np.asarray(starts, dtype=np.float64)[order]
+        self.ends = np.asarray(ends, dtype=np.float64)[order]
+        self.items = [items[position] for position in order]
+
+    def positions(self, frames: np.ndarray) -> np.ndarray:
+        """Returns the position of the item covering each frame, -1 where none does."""
+        positions = np.searchsorted(self.starts, frames, side="right") - 1
+        hit = positions >= 0
+        hit[hit] = frames[hit] < self.ends[positions[hit]]
+        return np.where(hit, positions, -1)
+
+
+class TimelineIntervalIndex(object):
+    """Start/end interval index of the items of a timeline's tracks.
+
+    Build it with `Timeline.interval_index()` or `from_snapshot`.
+
+    Args:
+        tracks (Dict[Tuple[str, int], Tuple[Sequence, Sequence, List[TimelineItem]]]): (track type, track index) to the start frames, end frames and items of that track
+    """
+
+    def __init__(
+        self,
+        tracks: Dict[Tuple[str, int], Tuple[Sequence, Sequence, List["TimelineItem"]]],
+    ):
+        self._tracks: Dict[Tuple[str, int], _Track] = {
+            key: _Track(starts, ends, items)
+            for key, (starts, ends, items) in tracks.items()
+        }
+
+    @classmethod
+    def from_timeline(
+        cls,
+        timeline: "Timeline",
+        track_types: Optional[Iterable["TrackType"]] = None,
+    ) -> "TimelineIntervalIndex":
+        """Reads start and end of every item on the tracks of track_types (default: video)."""
+        from pybmd.timeline import TrackType
+
+        tracks = {}
+        for track_type in track_types or (TrackType.VIDEO_TRACK,):
+            for track_index in range(1, timeline.get_track_count(track_type) + 1):
+                items = timeline.get_item_list_in_track(track_type, track_index)
+                tracks[(track_type.value, track_index)] = (
+                    [item.get_start() for item in items],
+                    [item.get_end() for item in items],
+                    items,
+                )
+        return cls(tracks)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: "TimelineSnapshot") -> "TimelineIntervalIndex":
+        """Builds the index from a TimelineSnapshot without further scripting calls."""
+        tracks = {}
+        for track_type, track_index in sorted(
+            set(zip(snapshot["track_type"].tolist(), snapshot["track_index"].tolist()))
+        ):
+            mask = (snapshot["track_type"] == track_type) & (
+                snapshot["track_index"] == track_index
+            )
+            tracks[(track_type, track_index)] = (
+                snapshot["start"][mask],
+                snapshot["end"][mask],
+                list(snapshot.items[mask]),
+            )
+        return cls(tracks)
+
+    def track_indexes(self, track_type: "TrackType") -> List[int]:
+        """Returns the indexed track indexes of track_type, ascending."""
+        return sorted(index for kind, index in self._tracks if kind == track_type.value)
+
+    def _track_type(self, track_type: Optional["TrackType"]) -> "TrackType":
+        if track_type is None:
+            from pybmd.timeline import TrackType
+
+            return TrackType.VIDEO_TRACK
+        return track_type
+
+    def items_at(
+        self, frame: float, track_type: Optional["TrackType"] = None
+    ) -> List[Tuple[int, "TimelineItem"]]:
+        """Returns (track index, item) of every track_type item covering frame, lowest track first."""
+        track_type = self._track_type(track_type)
+        frames = np.array([frame], dtype=np.float64)
+        result = []
+        for track_index in self.track_indexes(track_type):
+            track = self._tracks[(track_type.value, track_index)]
+            position = track.positions(frames)[0]
+            if position >= 0:
+                result.append((track_index, track.items[position]))
+        return result
+
+    def item_at(
+        self,
+        frame: float,
+        track_index: Optional[int] = None,
+        track_type: Optional["TrackType"] = None,
+    ) -> Optional["TimelineItem"]:
+        """Returns the item covering frame on track_index, or on the topmost track if track_index is None.
+
+        Args:
+            frame (float): record frame
+            track_index (int, optional): track to look at. Defaults to None (topmost track with an item at frame, like get_current_video_item).
+            track_type (TrackType, optional): Defaults to None (video).
+
+        Returns:
+            TimelineItem: covering item, None if there is none
+        """
+        return self.items_at_frames([frame], track_index, track_type)[0]
+
+    def positions_at_frames(
+        self,
+        frames: Iterable[float],
+        track_index: Optional[int] = None,
+        track_type: Optional["TrackType"] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Bulk lookup returning arrays instead of items.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: track index and position within that track of the covering item for each frame, both -1 where no item covers the frame
+        """
+        track_type = self._track_type(track_type)
+        frames = np.asarray(
+            frames if isinstance(frames, np.ndarray) else list(frames),
+            dtype=np.float64,
+        )
+        track_indexes = np.full(frames.shape, -1, dtype=np.int64)
+        positions = np.full(frames.shape, -1, dtype=np.int64)
+        candidates = (
+            [track_index] if track_index is not None else self.track_indexes(track_type)
+        )
+        # topmost track first, lower tracks only fill frames still uncovered
+        for index in reversed(candidates):
+            track = self._tracks.get((track_type.value, index))
+            if track is None:
+                continue
+            open_frames = positions < 0
+            if not open_frames.any():
+                break
+            found = track.positions(frames[open_frames])
+            hit = found >= 0
+            open_positions = np.flatnonzero(open_frames)[hit]
+            positions[open_positions] = found[hit]
+            track_indexes[open_positions] = index
+        return track_indexes, positions
+
+    def spans_at_frames(
+        self,
+        frames: Iterable[float],
+        track_index: Optional[int] = None,
+        track_type: Optional["TrackType"] = None,
+    ) -> List[Optional[ItemSpan]]:
+        """Returns the covering item with its track and frame range for each of frames, see item_at."""
+        track_type = self._track_type(track_type)
+        track_indexes, positions = self.positions_at_frames(
+            frames, track_index, track_type
+        )
+        spans: List[Optional[ItemSpan]] = []
+        for index, position in zip(track_indexes.tolist(), positions.tolist()):
+            if position < 0:
+                spans.append(None)
+                continue
+            track = self._tracks[(track_type.value, index)]
+            spans.append(
+                ItemSpan(
+                    index,
+                    track.starts[position].item(),
+                    track.ends[position].item(),
+                    track.items[position],
+                )
+            )
+        return spans
+
+    def items_at_frames(
+        self,
+        frames: Iterable[float],
+        track_index: Optional[int] = None,
+        track_type: Optional["TrackType"] = None,
+    ) -> List[Optional["TimelineItem"]]:
+        """Returns the covering item for each of frames, see item_at."""
+        return [
+            span.item if span is not None else None
+            for span in self.spans_at_frames(frames, track_index, track_type)
+        ]
@@ -0,0 +1,286 @@
+"""Interval index of the markers of a timeline, timeline item or clip.
+
+``get_markers()`` returns a plain dict keyed by frame, so questions like
+"markers between frames A and B with color Red" or "markers overlapping this
+item" are linear scans over every marker. MarkerStore reads the markers once
+and keeps them as intervals ``[frame, frame + duration)``, sorted by start and
+augmented with the maximal end of every subtree, per color and overall. Range,
+overlap, color and customData queries then cost O(log n) plus the number of
+markers returned.
+
+`Timeline.get_marker_store()`, `TimelineItem.get_marker_store()` and
+`MediaPoolItem.get_marker_store()` return the store of a wrapper. Markers
+added, updated or deleted through that wrapper (or, with pybmd.interning
+enabled, any wrapper of the same clip) are applied to the store without
+re-reading the markers. Call `MarkerStore.refresh` after markers were changed
+elsewhere, e.g. in the Resolve UI.
+
+Frames are those of ``get_markers()``: offsets from the timeline start frame
+for timeline markers, from the clip start for clip markers.
+
+Example:
+    >>> store = timeline.get_marker_store()
+    >>> store.between(0, 2400, color="Red")
+    >>> store.overlapping_item(timeline_item)
+    >>> store.find_by_custom_data("shot-042")
+"""
+
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, Iterator, List, NamedTuple, Optional, Set
+
+if TYPE_CHECKING:
+    from pybmd.timeline_item import TimelineItem
+
+ALL_COLORS = "All"
+
+
+class Marker(NamedTuple):
+    """One marker as returned by get_markers()."""
+
+    frame: float
+    color: str
+    name: str
+    note: str
+    duration: float
+    custom_data: str
+
+    @property
+    def end(self) -> float:
+        """First frame after the marker, a marker covers at least one frame."""
+        return self.frame + max(self.duration, 1)
+
+    @classmethod
+    def from_info(cls, frame: float, info: dict) -> "Marker":
+        return cls(
+            float(frame),
+            info.get("color", ""),
+            info.get("name", ""),
+            info.get("note", ""),
+            float(info.get("duration", 1)),
+            info.get("customData", ""),
+        )
+
+
+class _IntervalSet(object):
+    """Markers sorted by frame with a max-end segment tree for overlap queries.
+
+    Inserts and deletes only update the marker dict and mark the sorted frames
+    and the segment tree stale; both are rebuilt on the first query after a
+    change, so a batch of edits costs one rebuild.
+    """
+
+    __slots__ = ("markers", "_frames", "_tree", "_size")
+
+    def __init__(self):
+        self.markers: Dict[float, Marker] = {}
+        self._frames: Optional[List[float]] = []
+        self._tree: Optional[List[float]] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self.markers)
+
+    @property
+    def frames(self) -> List[float]:
+        if self._frames is None:
+            self._frames = sorted(self.markers)
+        return self._frames
+
+    def add(self, marker: Marker):
+        if marker.frame not in self.markers:
+            self._frames = None
+        self.markers[marker.frame] = marker
+        self._tree = None
+
+    def remove(self, frame: float):
+        if self.markers.pop(frame, None) is not None:
+            self._frames = None
+            self._tree = None
+
+    def between(self, start: float, end: float) -> List[Marker]:
+        markers, frames = self.markers, self.frames
+        return [
+            markers[frame]
+            for frame in frames[bisect_left(frames, start) : bisect_left(frames, end)]
+        ]
+
+    def _build(self):
+        frames = self.frames
+        size = 1
+        while size < len(frames):
+            size *= 2
+        tree = [float("-inf")] * (2 * size)
+        for position, frame in enumerate(frames):
+            tree[size + position] = self.markers[frame].end
+        for node in range(size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self._tree, self._size = tree, size
+
+    def overlapping(self, start: float, end: float) -> List[Marker]:
+        # candidates start before end: a prefix of the sorted frames, of which
+        # the segment tree yields those ending after start
+        frames = self.frames
+        limit = bisect_left(frames, end)
+        if not limit:
+            return []
+        if self._tree is None:
+            self._build()
+        tree, size = self._tree, self._size
+        result = []
+        pending = [(1, 0, size)]
+        while pending:
+            node, low, high = pending.pop()
+            if low >= limit or tree[node] <= start:
+                continue
+            if node >= size:
+                result.append(self.markers[frames[low]])
+                continue
+            middle = (low + high) // 2
+            pending.append((2 * node + 1, middle, high))
+            pending.append((2 * node, low, middle))
+        return result
+
+
+class MarkerStore(object):
+    """Markers of a Timeline, TimelineItem or MediaPoolItem by frame, color and customData.
+
+    Args:
+        owner (Timeline | TimelineItem | MediaPoolItem): wrapper whose markers are indexed
+    """
+
+    def __init__(self, owner):
+        self._owner = owner
+        self.refresh()
+
+    def refresh(self):
+        """Re-reads all markers of the owner with one GetMarkers() call."""
+        self._all = _IntervalSet()
+        self._by_color: Dict[str, _IntervalSet] = {}
+        self._by_custom_data: Dict[str, Set[float]] = {}
+        for frame, info in (self._owner._object.GetMarkers() or {}).items():
+            self._add(Marker.from_info(frame, info))
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def __iter__(self) -> Iterator[Marker]:
+        markers = self._all.markers
+        return (markers[frame] for frame in list(self._all.frames))
+
+    def __contains__(self, frame: float) -> bool:
+        return float(frame) in self._all.markers
+
+    def _set(self, color: Optional[str]) -> Optional[_IntervalSet]:
+        return self._all if color is None else self._by_color.get(color)
+
+    def get(self, frame: float) -> Optional[Marker]:
+        """Returns the marker at frame, None if there is none."""
+        return self._all.markers.get(float(frame))
+
+    def between(
+        self, start: float, end: float, color: Optional[str] = None
+    ) -> List[Marker]:
+        """Returns the markers placed at frames start <= frame < end, by frame.
+
+        Args:
+            start (float): first frame
+            end (float): frame after the last frame
+            color (str, optional): only markers of this color. Defaults to None (any color).
+        """
+        markers = self._set(color)
+        return markers.between(start, end) if markers is not None else []
+
+    def overlapping(
+        self, start: float, end: float, color: Optional[str] = None
+    ) -> List[Marker]:
+        """Returns the markers whose duration overlaps frames start <= frame < end, by frame.
+
+        Args:
+            start (float): first frame
+            end (float): frame after the last frame
+            color (str, optional): only markers of this color. Defaults to None (any color).
+        """
+        markers = self._set(color)
+        return markers.overlapping(start, end) if markers is not None else []
+
+    def overlapping_item(
+        self, item: "TimelineItem", color: Optional[str] = None
+    ) -> List[Marker]:
+        """Returns the timeline markers overlapping a timeline item, for a store of a Timeline.
+
+        Args:
+            item (TimelineItem): item of the timeline
+            color (str, optional): only markers of this color. Defaults to None (any color).
+        """
+        from pybmd.timeline import Timeline
+
+        if not isinstance(self._owner, Timeline):
+            raise TypeError("overlapping_item() needs the marker store of a Timeline")
+        start_frame = self._owner.get_start_frame()
+        return self.overlapping(
+            item.get_start() - start_frame, item.get_end() - start_frame, color
+        )
+
+    def by_color(self, color: str) -> List[Marker]:
+        """Returns the markers of color, by frame."""
+        markers = self._by_color.get(color)
+        return [markers.markers[frame] for frame in markers.frames] if markers else []
+
+    def colors(self) -> List[str]:
+        """Returns the colors in use."""
+        return [color for color, markers in self._by_color.items() if len(markers)]
+
+    def find_by_custom_data(self, custom_data: str) -> List[Marker]:
+        """Returns the markers carrying custom_data, by frame."""
+        markers = self._all.markers
+        return [
+            markers[frame]
+            for frame in sorted(self._by_custom_data.get(custom_data, ()))
+        ]
+
+    def _add(self, marker: Marker):
+        if marker.frame in self._all.markers:
+            self._remove(marker.frame)
+        self._all.add(marker)
+        self._by_color.setdefault(marker.color, _IntervalSet()).add(marker)
+        self._by_custom_data.setdefault(marker.custom_data, set()).add(marker.frame)
+
+    def _remove(self, frame: float) -> Optional[Marker]:
+        marker = self._all.markers.get(frame)
+        if marker is None:
+            return None
+        self._all.remove(frame)
+        self._by_color[marker.color].remove(frame)
+        frames = self._by_custom_data[marker.custom_data]
+        frames.discard(frame)
+        if not frames:
+            del self._by_custom_data[marker.custom_data]
+        return marker
+
+    # applied by the owner's marker methods after a successful call
+
+    def _marker_added(self, frame, color, name, note, duration, custom_data):
+        self._add(
+            Marker(float(frame), color, name, note, float(duration), custom_data or "")
+        )
+
+    def _marker_deleted_at(self, frame):
+        self._remove(float(frame))
+
+    def _markers_deleted_by_color(self, color: str):
+        if color == ALL_COLORS:
+            for frame in list(self._all.markers):
+                self._remove(frame)
+        elif color in self._by_color:
+            for frame in list(self._by_color[color].markers):
+                self._remove(frame)
+
+    def _marker_deleted_by_custom_data(self, custom_data: str):
+        frames = self._by_custom_data.get(custom_data)
+        if frames:
+            self._remove(min(frames))
+
+    def _custom_data_updated(self, frame, custom_data: str):
+        marker = self._all.markers.get(float(frame))
+        if marker is not None:
+            self._add(marker._replace(custom_data=custom_data))
@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, List
 
 from multimethod import multimethod
+from pybmd._context import timelines_changed
 from pybmd._wrapper_base import WrapperBase
 from pybmd.decorators import requires_resolve_version
 from pybmd.folder import Folder
@@ -31,7 +32,7 @@ class ClipInfo:
 
     def to_dict(self):
         return {
-            "mediaPoolItem": self.media_pool_item._media_pool_item,
+            "mediaPoolItem": self.media_pool_item._object,
             "startFrame": self.start_frame,
             "endFrame": self.end_frame,
             "mediaType": self.media_type,
@@ -61,9 +62,11 @@ class TimelineImportOptions:
 class MediaPool(WrapperBase):
     """MediaPool Object"""
 
-    def __init__(self, media_pool):
-        super(MediaPool, self).__init__(media_pool)
-        self._media_pool = self._object
+    __slots__ = ()
+    _media_pool = WrapperBase._handle_alias
+
+    def __init__(self, media_pool, context=None):
+        super(MediaPool, self).__init__(media_pool, context)
 
     def add_sub_folder(self, folder: Folder, name: str) -> Folder:
         """add sub folder to folder
@@ -75,7 +78,7 @@ class MediaPool(WrapperBase):
         Returns:
             Folder: folder object of new sub folder
         """
-        return Folder(self._media_pool.AddSubFolder(folder._folder, name))
+        return Folder(self._object.AddSubFolder(folder._object, name), self._context)
 
     @multimethod
     def append_to_timeline(self, clips: List["MediaPoolItem"]) -> List[TimelineItem]:
@@ -88,23 +91,30 @@ class MediaPool(WrapperBase):
             List[TimelineItem]: timeline items of appended clips at timeline
         """
 
-        temp_list = self._media_pool.AppendToTimeline(
-            [clip._media_pool_item for clip in clips]
+        temp_list = self._object.AppendToTimeline(
+            [clip._object for clip in clips]
         )
-        return [TimelineItem(timeline_item) for timeline_item in temp_list]
+        return [
+            TimelineItem._wrap(timeline_item, self._context)
+            for timeline_item in temp_list
+        ]
 
     @multimethod
     def append_to_timeline(  # noqa: F811
         self, clip_info_list: List["ClipInfo"]
     ) -> List["TimelineItem"]:
-        temp_list = self._media_pool.AppendToTimeline(
+        temp_list = self._object.AppendToTimeline(
             [clip_info.to_dict() for clip_info in clip_info_list]
         )
-        return [TimelineItem(timeline_item) for timeline_item in temp_list]
+        return [
+            TimelineItem._wrap(timeline_item, self._context)
+            for timeline_item in temp_list
+        ]
 
     def create_empty_timeline(self, name) -> Timeline:
         """create empty timeline"""
-        return Timeline(self._media_pool.CreateEmptyTimeline(name))
+        timelines_changed(self._context)
+        return Timeline(self._object.CreateEmptyTimeline(name), self._context)
 
     def create_timeline_from_clips(self, name: str, clips) -> Timeline:
         """create new timeline from clips with name
@@ -116,17 +126,20 @@ class MediaPool(WrapperBase):
         Returns:
             Timeline: new timeline object
         """
+        timelines_changed(self._context)
         if type(clips[0]) is MediaPoolItem:
             return Timeline(
-                self._media_pool.CreateTimelineFromClips(
+                self._object.CreateTimelineFromClips(
                     name, [clip.media_pool_item for clip in clips]
-                )
+                ),
+                self._context,
             )
         elif type(clips[0]) is ClipInfo:
             return Timeline(
-                self._media_pool.CreateTimelineFromClips(
+                self._object.CreateTimelineFromClips(
                     name, [asdict(ClipInfo) for clip in clips]
-                )
+                ),
+                self._context,
             )
         else:
             raise ValueError("clips must contain MediaPoolItem or ClipInfo objects")
@@ -147,15 +160,15 @@ class MediaPool(WrapperBase):
         Returns:
             bool: true if successful, false if not
         """
-        return self._media_pool.DeleteClipMattes(media_pool_item, paths)
+        return self._object.DeleteClipMattes(media_pool_item, paths)
 
     def delete_clips(self, clips: List[MediaPoolItem]) -> bool:
         """Delete clips from media pool"""
-        return self._media_pool.DeleteClips([clip._media_pool_item for clip in clips])
+        return self._object.DeleteClips([clip._object for clip in clips])
 
     def delete_folders(self, subfolders: List[Folder]) -> bool:
         """delete folders from media pool"""
-        return self._media_pool.DeleteFolders([folder._folder for folder in subfolders])
+        return self._object.DeleteFolders([folder._object for folder in subfolders])
 
     def delete_timelines(self, timelines: List[Timeline]) -> bool:
         """delete timelines from media pool
@@ -166,8 +179,9 @@ class MediaPool(WrapperBase):
         Returns:
             bool: true if successful, false if not
         """
-        return self._media_pool.DeleteTimelines(
-            [timeline._timeline for timeline in timelines]
+        timelines_changed(self._context)
+        return self._object.DeleteTimelines(
+            [timeline._object for timeline in timelines]
         )
 
     def export_metadata(
@@ -183,16 +197,16 @@ class MediaPool(WrapperBase):
             bool: True if successful, False if not
         """
         if not clips:
-            return self._media_pool.ExportMetadata(file_name)
+            return self._object.ExportMetadata(file_name)
 
-        return self._media_pool.ExportMetadata(
-            file_name, [clip._media_pool_item for clip in clips]
+        return self._object.ExportMetadata(
+            file_name, [clip._object for clip in clips]
         )
 
     def get_clip_matte_list(self, media_pool_item) -> List[Path]:
         """get list of clip mattes for specified media pool item"""
         path_list = []
-        for str_path in self._media_pool.GetClipMatteList(media_pool_item):
+        for str_path in self._object.GetClipMatteList(media_pool_item):
             path_list.append(Path(str_path))
         return path_list
 
@@ -202,7 +216,7 @@ class MediaPool(WrapperBase):
         Returns:
             Folder: current folder object
         """
-        return Folder(self._media_pool.GetCurrentFolder())
+        return Folder(self._object.GetCurrentFolder(), self._context)
 
     def get_root_folder(self) -> Folder:
         """return root folder object of media pool
@@ -210,7 +224,7 @@ class MediaPool(WrapperBase):
         Returns:
             Folder: root folder object
         """
-        return Folder(self._media_pool.GetRootFolder())
+        return Folder(self._object.GetRootFolder(), self._context)
 
     def get_timeline_matte_list(self, folder: Folder) -> List[MediaPoolItem]:
         """Get mattes in specified Folder
@@ -222,8 +236,10 @@ class MediaPool(WrapperBase):
             List[MediaPoolItem]: list of media pool items that are mattes
         """
         media_pool_item_list = []
-        for media_pool_item in self._media_pool.GetTimelineMatteList(folder._folder):
-            media_pool_item_list.append(MediaPoolItem(media_pool_item))
+        for media_pool_item in self._object.GetTimelineMatteList(folder._object):
+            media_pool_item_list.append(
+                MediaPoolItem._wrap(media_pool_item, self._context)
+            )
         return media_pool_item_list
 
     def import_media(self, file_paths: List[str]) -> List[MediaPoolItem]:
@@ -240,8 +256,8 @@ class MediaPool(WrapperBase):
         # for media_pool_item in self.media_pool.ImportMedia(file_paths):
         #     media_pool_item_list.append(MediaPoolItem(media_pool_item))
         return [
-            MediaPoolItem(media_pool_item)
-            for media_pool_item in self._media_pool.ImportMedia(file_paths)
+            MediaPoolItem(media_pool_item, self._context)
+            for media_pool_item in self._object.ImportMedia(file_paths)
         ]
 
     # @dispatch(List[dict])
@@ -263,10 +279,10 @@ class MediaPool(WrapperBase):
         Returns:
             Timeline: timeline object
         """
+        timelines_changed(self._context)
         return Timeline(
-            self._media_pool.ImportTimelineFromFile(
-                str(file_path), asdict(import_option)
-            )
+            self._object.ImportTimelineFromFile(str(file_path), asdict(import_option)),
+            self._context,
         )
 
     def move_clips(self, clips: List[MediaPoolItem], target_folder: Folder) -> bool:
@@ -279,8 +295,8 @@ class MediaPool(WrapperBase):
         Returns:
             bool: true if successful, false if not
         """
-        return self._media_pool.MoveClips(
-            [clip._media_pool_item for clip in clips], target_folder._folder
+        return self._object.MoveClips(
+            [clip._object for clip in clips], target_folder._object
         )
 
     def move_folders(self, folders: List[Folder], target_folder: Folder) -> bool:
@@ -294,8 +310,8 @@ class MediaPool(WrapperBase):
         Returns:
             bool: true if successful, false if not
         """
-        return self._media_pool.MoveFolders(
-            [folder._folder for folder in folders], target_folder._folder
+        return self._object.MoveFolders(
+            [folder._object for folder in folders], target_folder._object
         )
 
     def relink_clips(
@@ -310,18 +326,18 @@ class MediaPool(WrapperBase):
         Returns:
             bool: True if successful, False if not
         """
-        return self._media_pool.RelinkClips(
-            [clip._media_pool_item for clip in media_pool_items], str(folder_path)
+        return self._object.RelinkClips(
+            [clip._object for clip in media_pool_items], str(folder_path)
         )
 
     def set_current_folder(self, folder: Folder) -> bool:
         """set current folder"""
-        return self._media_pool.SetCurrentFolder(folder._folder)
+        return self._object.SetCurrentFolder(folder._object)
 
     def unlink_clips(self, media_pool_items: List[MediaPoolItem]) -> bool:
         """Unlink specified media pool clips"""
-        return self._media_pool.UnlinkClips(
-            [clip._media_pool_item for clip in media_pool_items]
+        return self._object.UnlinkClips(
+            [clip._object for clip in media_pool_items]
         )
 
     ##########################################################################################################################
@@ -339,11 +355,11 @@ class MediaPool(WrapperBase):
         Version:
             Added in DaVinci Resolve 18.0.0
         """
-        return self._media_pool.RefreshFolders()
+        return self._object.RefreshFolders()
 
     def get_unique_id(self) -> str:
         """get unique id of media pool object"""
-        return self._media_pool.GetUniqueId()
+        return self._object.GetUniqueId()
 
     ##########################################################################################################################
     # Add at DR18.5.0 Beta
@@ -365,7 +381,8 @@ class MediaPool(WrapperBase):
         Version:
             Added in DaVinci Resolve 18.5.0 Beta
         """
-        return self._media_pool.ImportFolderFromFile(file_path, source_clips_path)
+        timelines_changed(self._context)
+        return self._object.ImportFolderFromFile(file_path, source_clips_path)
 
     ##########################################################################################################################
     # Add at DR18.6.4
@@ -389,10 +406,11 @@ class MediaPool(WrapperBase):
             Added in DaVinci Resolve 18.6.4
         """
         return MediaPoolItem(
-            self._media_pool.CreateStereoClip(
-                left_media_pool_item._media_pool_item,
-                right_media_pool_item._media_pool_item,
-            )
+            self._object.CreateStereoClip(
+                left_media_pool_item._object,
+                right_media_pool_item._object,
+            ),
+            self._context,
         )
 
     ##########################################################################################################################
@@ -411,8 +429,8 @@ class MediaPool(WrapperBase):
             Added in DaVinci Resolve 19.0.2
         """
         media_pool_items = list()
-        for mp_item in self._media_pool.GetSelectedClips():
-            media_pool_items.append(MediaPoolItem(mp_item))
+        for mp_item in self._object.GetSelectedClips():
+            media_pool_items.append(MediaPoolItem._wrap(mp_item, self._context))
         return media_pool_items
 
     @requires_resolve_version(added_in="19.0.2")
@@ -425,7 +443,7 @@ class MediaPool(WrapperBase):
         Returns:
             bool: Returns true if successful, false if not
         """
-        return self._media_pool.SetSelectedClip(media_pool_item._media_pool_item)
+        return self._object.SetSelectedClip(media_pool_item._object)
 
     ##########################################################################################################################
     # Add at DR19.1.0
@@ -454,4 +472,4 @@ class MediaPool(WrapperBase):
         Version:
             Added in DaVinci Resolve 19.1.0
         """
-        return self._media_pool.AutoSyncAudio(media_pool_items, audio_sync_settings)
+        return self._object.AutoSyncAudio(media_pool_items, audio_sync_settings)
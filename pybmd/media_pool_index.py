@@ -0,0 +1,210 @@
+"""Searchable index of every clip in the media pool.
+
+MediaPoolIndex walks the media pool folder tree once, reading each clip's
+unique id and clip properties (one ``GetClipProperty()`` call per clip), and
+indexes the clips by unique id, clip name, file path, reel name and any
+further clip properties asked for. Lookups are then dictionary hits instead
+of a linear walk over the media pool.
+
+`MediaPoolIndex.refresh` keeps the index current cheaply: it walks only the
+folder tree and re-reads the clips of folders that are new or report
+``GetIsFolderStale()``, then drops folders that disappeared. Staleness is
+reported for changes made by collaborators; after local edits pass the
+touched folders to ``refresh(folders=...)``.
+
+Example:
+    >>> index = MediaPoolIndex(media_pool, properties=["Scene", "Take"])
+    >>> index.find_by_file_path("/media/A001_C001.mov")
+    >>> index.find("Scene", "12")
+    >>> index.refresh()  # after collaborators changed the media pool
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from pybmd.error import APIVersionError
+from pybmd.folder import Folder
+from pybmd.media_pool import MediaPool
+from pybmd.media_pool_item import MediaPoolItem
+
+CLIP_NAME = "Clip Name"
+FILE_PATH = "File Path"
+REEL_NAME = "Reel Name"
+
+
+@dataclass
+class _FolderEntry:
+    folder: Folder
+    parent_id: Optional[str]
+    clip_ids: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _ClipEntry:
+    clip: MediaPoolItem
+    folder_id: str
+    values: Dict[str, str]
+
+
+class MediaPoolIndex(object):
+    """Index of media pool clips by unique id and clip properties.
+
+    Args:
+        media_pool (MediaPool): media pool to index
+        properties (Iterable[str], optional): clip property keys indexed in addition to "Clip Name", "File Path" and "Reel Name". Defaults to ().
+        refresh_collaboration (bool, optional): call MediaPool.refresh_folders() before re-reading stale folders, so their new content is loaded. Defaults to True.
+    """
+
+    def __init__(
+        self,
+        media_pool: MediaPool,
+        properties: Iterable[str] = (),
+        refresh_collaboration: bool = True,
+    ):
+        self._media_pool = media_pool
+        self._keys = list(dict.fromkeys([CLIP_NAME, FILE_PATH, REEL_NAME, *properties]))
+        self._refresh_collaboration = refresh_collaboration
+        self._folders: Dict[str, _FolderEntry] = {}
+        self._clips: Dict[str, _ClipEntry] = {}
+        self._lookup: Dict[str, Dict[str, Set[str]]] = {key: {} for key in self._keys}
+        self.refresh()
+
+    @property
+    def properties(self) -> List[str]:
+        """Indexed clip property keys."""
+        return list(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._clips)
+
+    def __contains__(self, unique_id: str) -> bool:
+        return unique_id in self._clips
+
+    def __iter__(self) -> Iterator[MediaPoolItem]:
+        return (entry.clip for entry in self._clips.values())
+
+    def _add_clip(self, clip: MediaPoolItem, folder_id: str) -> str:
+        unique_id = clip.get_unique_id()
+        # read past the wrapper's property cache, the index only keeps the indexed keys
+        clip_properties = clip._object.GetClipProperty() or {}
+        values = {key: clip_properties.get(key, "") for key in self._keys}
+        self._remove_clip(unique_id)
+        self._clips[unique_id] = _ClipEntry(clip, folder_id, values)
+        for key, value in values.items():
+            self._lookup[key].setdefault(value, set()).add(unique_id)
+        return unique_id
+
+    def _remove_clip(self, unique_id: str):
+        entry = self._clips.pop(unique_id, None)
+        if entry is None:
+            return
+        for key, value in entry.values.items():
+            unique_ids = self._lookup[key].get(value)
+            if unique_ids is not None:
+                unique_ids.discard(unique_id)
+                if not unique_ids:
+                    del self._lookup[key][value]
+
+    def _scan_folder(self, folder_id: str):
+        entry = self._folders[folder_id]
+        for unique_id in entry.clip_ids:
+            clip_entry = self._clips.get(unique_id)
+            # a clip moved away may already be indexed under its new folder
+            if clip_entry is not None and clip_entry.folder_id == folder_id:
+                self._remove_clip(unique_id)
+        entry.clip_ids = [
+            self._add_clip(clip, folder_id) for clip in entry.folder.get_clip_list()
+        ]
+
+    def _drop_folder(self, folder_id: str):
+        entry = self._folders.pop(folder_id)
+        for unique_id in entry.clip_ids:
+            clip_entry = self._clips.get(unique_id)
+            if clip_entry is not None and clip_entry.folder_id == folder_id:
+                self._remove_clip(unique_id)
+
+    def refresh(self, folders: Optional[Iterable[Folder]] = None) -> int:
+        """Brings the index up to date.
+
+        Walks the folder tree, re-reads the clips of new and stale folders and
+        of the given folders, and forgets removed folders.
+
+        Args:
+            folders (Iterable[Folder], optional): folders to re-read regardless of their stale state, e.g. after local edits. Defaults to None.
+
+        Returns:
+            int: number of folders whose clips were re-read
+        """
+        forced = {folder.get_unique_id() for folder in folders or ()}
+        to_scan: List[str] = []
+        seen: Set[str] = set()
+        stale_found = False
+        pending = [(self._media_pool.get_root_folder(), None)]
+        while pending:
+            folder, parent_id = pending.pop()
+            folder_id = folder.get_unique_id()
+            seen.add(folder_id)
+            entry = self._folders.get(folder_id)
+            stale = folder.get_is_folder_stale()
+            stale_found = stale_found or stale
+            if entry is None:
+                self._folders[folder_id] = _FolderEntry(folder, parent_id)
+                to_scan.append(folder_id)
+            else:
+                entry.folder, entry.parent_id = folder, parent_id
+                if stale or folder_id in forced:
+                    to_scan.append(folder_id)
+            pending.extend(
+                (sub_folder, folder_id)
+                for sub_folder in reversed(folder.get_sub_folder_list())
+            )
+
+        for folder_id in set(self._folders) - seen:
+            self._drop_folder(folder_id)
+        if stale_found and self._refresh_collaboration:
+            try:
+                self._media_pool.refresh_folders()
+            except APIVersionError:
+                pass
+        for folder_id in to_scan:
+            self._scan_folder(folder_id)
+        return len(to_scan)
+
+    def get(self, unique_id: str) -> Optional[MediaPoolItem]:
+        """Returns the clip with unique_id, None if it is not indexed."""
+        entry = self._clips.get(unique_id)
+        return entry.clip if entry else None
+
+    def get_folder(self, unique_id: str) -> Optional[Folder]:
+        """Returns the folder holding the clip with unique_id, None if it is not indexed."""
+        entry = self._clips.get(unique_id)
+        return self._folders[entry.folder_id].folder if entry else None
+
+    def get_value(self, unique_id: str, property_key: str) -> Optional[str]:
+        """Returns the indexed property_key value of the clip with unique_id, None if it is not indexed."""
+        entry = self._clips.get(unique_id)
+        return entry.values.get(property_key) if entry else None
+
+    def find(self, property_key: str, value: str) -> List[MediaPoolItem]:
+        """Returns the clips whose indexed clip property property_key equals value.
+
+        Raises:
+            KeyError: property_key is not indexed.
+        """
+        if property_key not in self._lookup:
+            raise KeyError(
+                f"Clip property {property_key!r} is not indexed, pass it in MediaPoolIndex(properties=...)"
+            )
+        return [
+            self._clips[unique_id].clip
+            for unique_id in self._lookup[property_key].get(value, ())
+        ]
+
+    def find_by_name(self, clip_name: str) -> List[MediaPoolItem]:
+        return self.find(CLIP_NAME, clip_name)
+
+    def find_by_file_path(self, file_path: str) -> List[MediaPoolItem]:
+        return self.find(FILE_PATH, str(file_path))
+
+    def find_by_reel_name(self, reel_name: str) -> List[MediaPoolItem]:
+        return self.find(REEL_NAME, reel_name)
@@ -1,23 +1,37 @@
-from typing import Any, Dict
+from typing import Any, Dict, Union
 from multimethod import multimethod
 
 from pybmd._wrapper_base import WrapperBase
 from pybmd.decorators import requires_resolve_version, minimum_resolve_version
+from pybmd.marker_store import MarkerStore
 
 
 class MediaPoolItem(WrapperBase):
-    """docstring for MediaPoolItem."""
+    """docstring for MediaPoolItem.
 
-    def __init__(self, media_pool_item):
-        super(MediaPoolItem, self).__init__(media_pool_item)
-        self._media_pool_item = self._object
+    Clip properties and metadata are read with a single GetClipProperty() /
+    GetMetadata() call on first use and cached on the wrapper. pybmd's own
+    setters invalidate the cache, call `refresh_properties` after the clip was
+    changed elsewhere.
+    """
+
+    __slots__ = ("_clip_properties", "_metadata", "_marker_store")
+    _media_pool_item = WrapperBase._handle_alias
+
+    _intern_id_api = "GetUniqueId"
+
+    def __init__(self, media_pool_item, context=None):
+        super(MediaPoolItem, self).__init__(media_pool_item, context)
+        self._clip_properties: Dict[str, Any] | None = None
+        self._metadata: Dict[str, Any] | None = None
+        self._marker_store: MarkerStore | None = None
 
     def __repr__(self) -> str:
         return f"Media Pool Item: {self.get_name()}"
 
     def add_flag(self, color: str) -> bool:
         """Add a flag to the clip."""
-        return self._media_pool_item.AddFlag(color)
+        return self._object.AddFlag(color)
 
     def add_marker(
         self,
@@ -42,16 +56,22 @@ class MediaPoolItem(WrapperBase):
         Returns:
             bool: true if success, false if fail
         """
-        return self._media_pool_item.AddMarker(
+        result = self._object.AddMarker(
             frame_id, color, name, note, duration, custom_data
         )
+        if result and self._marker_store is not None:
+            self._marker_store._marker_added(
+                frame_id, color, name, note, duration, custom_data
+            )
+        return result
 
     def clear_clip_color(self) -> bool:
         """clear clip color.
 
         :return: bool
         """
-        return self._media_pool_item.ClearClipColor()
+        self._clip_properties = None
+        return self._object.ClearClipColor()
 
     def clear_flag_color(self, color: str) -> bool:
         """Clears the flag of the given color if one exists. An "All" argument is supported and clears all flags.
@@ -61,7 +81,7 @@ class MediaPoolItem(WrapperBase):
         :return: true if success, false if fail
         :rtype: bool
         """
-        return self._media_pool_item.ClearFlagColor(color)
+        return self._object.ClearFlagColor(color)
 
     def delete_marker_at_frame(self, frame_num: int) -> bool:
         """Delete marker at frame number from the media pool item.
@@ -71,7 +91,10 @@ class MediaPoolItem(WrapperBase):
         :return: true if success, false if fail
         :rtype: bool
         """
-        return self._media_pool_item.DeleteMarkerAtFrame(frame_num)
+        result = self._object.DeleteMarkerAtFrame(frame_num)
+        if result and self._marker_store is not None:
+            self._marker_store._marker_deleted_at(frame_num)
+        return result
 
     def delete_marker_by_custom_data(self, custom_data: str) -> bool:
         """Delete first matching marker with specified customData.
@@ -82,7 +105,10 @@ class MediaPoolItem(WrapperBase):
         Returns:
             bool: true if success, false if fail
         """
-        return self._media_pool_item.DeleteMarkerByCustomData(custom_data)
+        result = self._object.DeleteMarkerByCustomData(custom_data)
+        if result and self._marker_store is not None:
+            self._marker_store._marker_deleted_by_custom_data(custom_data)
+        return result
 
     def delete_marker_by_color(self, color: str) -> bool:
         """delete all markers with the given color.
@@ -93,7 +119,10 @@ class MediaPoolItem(WrapperBase):
         Returns:
             bool: true if success, false if fail
         """
-        return self._media_pool_item.DeleteMarkerByColor(color)
+        result = self._object.DeleteMarkerByColor(color)
+        if result and self._marker_store is not None:
+            self._marker_store._markers_deleted_by_color(color)
+        return result
 
     def get_clip_color(self) -> str:
         """get clip color.
@@ -101,7 +130,7 @@ class MediaPoolItem(WrapperBase):
         Returns:
             str: color name
         """
-        return self._media_pool_item.GetClipColor()
+        return self._object.GetClipColor()
 
     # TODO property_name as data class
     def get_clip_property(self, property_name: str = "") -> str:
@@ -113,7 +142,15 @@ class MediaPoolItem(WrapperBase):
         Returns:
             str: property value,if property is empty, return a dict of all clip properties.
         """
-        return self._media_pool_item.GetClipProperty(property_name)
+        if self._clip_properties is None:
+            self._clip_properties = self._object.GetClipProperty() or {}
+        if not property_name:
+            return dict(self._clip_properties)
+        if property_name not in self._clip_properties:
+            self._clip_properties[property_name] = self._object.GetClipProperty(
+                property_name
+            )
+        return self._clip_properties[property_name]
 
     def get_flag_list(self) -> list:
         """get flag list.
@@ -121,7 +158,7 @@ class MediaPoolItem(WrapperBase):
         Returns:
             list: flag colors assigned to the item.
         """
-        return self._media_pool_item.GetFlagList()
+        return self._object.GetFlagList()
 
     def get_marker_by_custom_data(self, custom_data: str) -> dict:
         """return maker infomation of fist marker matching the custom data.
@@ -132,7 +169,7 @@ class MediaPoolItem(WrapperBase):
         Returns:
             dict: maker info
         """
-        return self._media_pool_item.GetMarkerByCustomData(custom_data)
+        return self._object.GetMarkerByCustomData(custom_data)
 
     def get_marker_custom_data(self, freamid: int) -> str:
         """return marker custom data.
@@ -143,7 +180,16 @@ class MediaPoolItem(WrapperBase):
         Returns:
             str: custom data of the marker
         """
-        return self._media_pool_item.GetMarkerCustomData(freamid)
+        return self._object.GetMarkerCustomData(freamid)
+
+    def get_marker_store(self) -> MarkerStore:
+        """Returns the interval index of the markers, read on first use.
+
+        Markers changed through this wrapper are applied to it, call MarkerStore.refresh() after changes made elsewhere.
+        """
+        if self._marker_store is None:
+            self._marker_store = MarkerStore(self)
+        return self._marker_store
 
     def get_markers(self) -> dict:
         """return a dict of all markers and dict of marker info.
@@ -151,11 +197,11 @@ class MediaPoolItem(WrapperBase):
         Returns:
             dict: maker position and info
         """
-        return self._media_pool_item.GetMarkers()
+        return self._object.GetMarkers()
 
     def get_media_id(self) -> str:
         """return media id for the clip."""
-        return self._media_pool_item.GetMediaId()
+        return self._object.GetMediaId()
 
     # TODO metadata_type as data class
     def get_metadata(self, metadata_type: str = "") -> str:
@@ -167,11 +213,18 @@ class MediaPoolItem(WrapperBase):
         Returns:
             str: metadata value If no argument is specified, a dict of all set metadata properties is returned.
         """
-        return self._media_pool_item.GetMetadata(metadata_type)
+        if self._metadata is None:
+            self._metadata = self._object.GetMetadata() or {}
+        if not metadata_type:
+            return dict(self._metadata)
+        if metadata_type not in self._metadata:
+            # unset keys are missing from the dict, ask once and remember the answer
+            self._metadata[metadata_type] = self._object.GetMetadata(metadata_type)
+        return self._metadata[metadata_type]
 
     def get_name(self) -> str:
         """return name of the clip."""
-        return self._media_pool_item.GetName()
+        return self._object.GetName()
 
     @requires_resolve_version(added_in="20.2.0")
     def set_name(self, name: str) -> bool:
@@ -189,7 +242,8 @@ class MediaPoolItem(WrapperBase):
         Version:
             Added in DaVinci Resolve 20.2.0
         """
-        return self._media_pool_item.SetName(name)
+        self._clip_properties = None
+        return self._object.SetName(name)
 
     def link_proxy_media(self, proxy_media_file_path: str) -> bool:
         """Links proxy media located at path specified by arg 'proxyMediaFilePath' with the current clip.
@@ -200,11 +254,13 @@ class MediaPoolItem(WrapperBase):
         Returns:
             bool: true if success, false if fail
         """
-        return self._media_pool_item.LinkProxyMedia(str(proxy_media_file_path))
+        self._clip_properties = None
+        return self._object.LinkProxyMedia(str(proxy_media_file_path))
 
     def replace_clip(self, file_path: str) -> bool:
         """Replaces the underlying asset and metadata of MediaPoolItem with the specified absolute clip path."""
-        return self._media_pool_item.ReplaceClip(str(file_path))
+        self.refresh_properties()
+        return self._object.ReplaceClip(str(file_path))
 
     def set_clip_color(self, color_name: str) -> bool:
         """set clip color with the given color name.
@@ -215,7 +271,8 @@ class MediaPoolItem(WrapperBase):
         Returns:
             bool: true if success, false if fail
         """
-        return self._media_pool_item.SetClipColor(color_name)
+        self._clip_properties = None
+        return self._object.SetClipColor(color_name)
 
     def set_clip_property(self, property_type: str, property_value: str) -> bool:
         """set clip property with the given property type and value.
@@ -227,24 +284,42 @@ class MediaPoolItem(WrapperBase):
         Returns:
             bool: true if success, false if fail
         """
-        return self._media_pool_item.SetClipProperty(property_type, property_value)
+        self._clip_properties = None
+        return self._object.SetClipProperty(property_type, property_value)
 
     # TODO metadata_type as data class
-    def set_metadata(self, metadata_type: str, metadata_value: str) -> bool:
+    def set_metadata(
+        self, metadata_type: Union[str, dict], metadata_value: Any = None
+    ) -> bool:
         """set metadata with the given metadata type and value.
 
+        Several values can be set with one call by passing a dict of metadata
+        type to metadata value as metadata_type.
+
         Args:
-            metadata_type (str): metadata type
-            metadata_value (str): metadata value
+            metadata_type (str | dict): metadata type, or metadata type to metadata value
+            metadata_value (str): metadata value, unused with a dict
 
         Returns:
             bool: true if success, false if fail
         """
-        return self._media_pool_item.SetMetadata(metadata_type, metadata_value)
+        self._metadata = None
+        if isinstance(metadata_type, dict):
+            return self._object.SetMetadata(metadata_type)
+        return self._object.SetMetadata(metadata_type, metadata_value)
 
     def unlink_proxy_media(self) -> bool:
         """Unlinks proxy media from the current clip."""
-        return self._media_pool_item.UnlinkProxyMedia()
+        self._clip_properties = None
+        return self._object.UnlinkProxyMedia()
+
+    def refresh_properties(self):
+        """Drops the cached clip properties and metadata, e.g. after the clip was changed outside pybmd.
+
+        They are read again on the next get_clip_property / get_metadata call.
+        """
+        self._clip_properties = None
+        self._metadata = None
 
     def updata_marker_custom_data(self, frame_id: int, custom_data: str) -> bool:
         """update marker custom data.
@@ -256,7 +331,10 @@ class MediaPoolItem(WrapperBase):
         Returns:
             bool: true if success, false if fail
         """
-        return self._media_pool_item.UpdataMarkerCustomData(frame_id, custom_data)
+        result = self._object.UpdataMarkerCustomData(frame_id, custom_data)
+        if result and self._marker_store is not None:
+            self._marker_store._custom_data_updated(frame_id, custom_data)
+        return result
 
     ###############################################################################
     # Add at DR18.0.0
@@ -264,7 +342,7 @@ class MediaPoolItem(WrapperBase):
     @minimum_resolve_version("18.0.0")
     def get_unique_id(self) -> str:
         """return unique id of the clip."""
-        return self._media_pool_item.GetUniqueId()
+        return self._object.GetUniqueId()
 
     ##############################################################################################################################
     # Add at DR18.5.0
@@ -276,7 +354,7 @@ class MediaPoolItem(WrapperBase):
         Returns:
             bool: Returns True if successful; False otherwise
         """
-        return self._media_pool_item.TranscribeAudio()
+        return self._object.TranscribeAudio()
 
     @minimum_resolve_version("18.5.0")
     def clear_transcription(self) -> bool:
@@ -285,7 +363,7 @@ class MediaPoolItem(WrapperBase):
         Returns:
             bool: Returns True if successful; False otherwise.
         """
-        return self._media_pool_item.ClearTranscription()
+        return self._object.ClearTranscription()
 
     ##############################################################################################################################
     # Add at DR 19.0.0
@@ -303,7 +381,7 @@ class MediaPoolItem(WrapperBase):
         Version:
             Added in DaVinci Resolve 19.0.0
         """
-        return self._media_pool_item.GetAudioMapping()
+        return self._object.GetAudioMapping()
 
     ##############################################################################################################################
     # Add at DR 19.0.2
@@ -324,7 +402,7 @@ class MediaPoolItem(WrapperBase):
         Version:
             Added in DaVinci Resolve 19.0.2
         """
-        return self._media_pool_item.GetThirdPartyMetadata(metadata_type)
+        return self._object.GetThirdPartyMetadata(metadata_type)
 
     @multimethod
     @requires_resolve_version(added_in="19.0.2")
@@ -338,7 +416,7 @@ class MediaPoolItem(WrapperBase):
         Returns:
             bool: Returns True if successful.
         """
-        return self._media_pool_item.SetThirdPartyMetadata(
+        return self._object.SetThirdPartyMetadata(
             metadata_type, metadata_value
         )
 
@@ -353,7 +431,7 @@ class MediaPoolItem(WrapperBase):
         Returns:
             bool: Returns True if successful.
         """
-        return self._media_pool_item.SetThirdPartyMetadata(metadata_dict)
+        return self._object.SetThirdPartyMetadata(metadata_dict)
 
     ##############################################################################################################################
     # Add at DR 19.1.0
@@ -373,7 +451,7 @@ class MediaPoolItem(WrapperBase):
         Version:
             Added in DaVinci Resolve 19.1.0
         """
-        return self._media_pool_item.GetMarkInOut()
+        return self._object.GetMarkInOut()
 
     @requires_resolve_version(added_in="19.1.0")
     def set_mark_in_out(self, mark_in: int, mark_out: int, type: str = "all") -> bool:
@@ -387,7 +465,7 @@ class MediaPoolItem(WrapperBase):
         Returns:
             bool: Returns True if successful.
         """
-        return self._media_pool_item.SetMarkInOut(mark_in, mark_out, type)
+        return self._object.SetMarkInOut(mark_in, mark_out, type)
 
     @requires_resolve_version(added_in="19.1.0")
     def clear_mark_in_out(self, type: str = "all") -> bool:
@@ -399,7 +477,7 @@ class MediaPoolItem(WrapperBase):
         Returns:
             bool: Returns True if successful.
         """
-        return self._media_pool_item.ClearMarkInOut(type)
+        return self._object.ClearMarkInOut(type)
 
     ##############################################################################################################################
     # Add at DR 20.0.0
@@ -420,7 +498,8 @@ class MediaPoolItem(WrapperBase):
         Version:
             Added in DaVinci Resolve 20.0.0
         """
-        return self._media_pool_item.LinkFullResolutionMedia(full_res_media_path)
+        self._clip_properties = None
+        return self._object.LinkFullResolutionMedia(full_res_media_path)
 
     @requires_resolve_version(added_in="20.0.0")
     def replace_clip_preserve_sub_clip(self, file_path: str) -> bool:
@@ -438,7 +517,8 @@ class MediaPoolItem(WrapperBase):
         Version:
             Added in DaVinci Resolve 20.0.0
         """
-        return self._media_pool_item.ReplaceClipPreserveSubClip(file_path)
+        self.refresh_properties()
+        return self._object.ReplaceClipPreserveSubClip(file_path)
 
     @requires_resolve_version(added_in="20.0.0")
     def monitor_growing_file(self) -> bool:
@@ -453,4 +533,4 @@ class MediaPoolItem(WrapperBase):
         Version:
             Added in DaVinci Resolve 20.0.0
         """
-        return self._media_pool_item.MonitorGrowingFile()
+        return self._object.MonitorGrowingFile()
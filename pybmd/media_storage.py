@@ -16,9 +16,11 @@ class Item_Info(BaseModel):
 class MediaStorage(WrapperBase):
     """MediaStorage."""
 
-    def __init__(self, media_storage):
-        super(MediaStorage, self).__init__(media_storage)
-        self._media_storage = self._object
+    __slots__ = ()
+    _media_storage = WrapperBase._handle_alias
+
+    def __init__(self, media_storage, context=None):
+        super(MediaStorage, self).__init__(media_storage, context)
 
     def add_clip_mattes_to_media_pool(
         self, media_pool_item: MediaPoolItem, paths: List[str], stereo_eye: str
@@ -33,7 +35,7 @@ class MediaStorage(WrapperBase):
         Returns:
             bool: True if success, False if fail
         """
-        return self._media_storage.AddClipMattesToMediaPool(
+        return self._object.AddClipMattesToMediaPool(
             media_pool_item, paths, stereo_eye
         )
 
@@ -54,17 +56,15 @@ class MediaStorage(WrapperBase):
         # return media_pool_item_list
         if all(isinstance(item, str) for item in items):
             return [
-                MediaPoolItem(media_pool_item)
-                for media_pool_item in self._media_storage.AddItemListToMediaPool(items)
+                MediaPoolItem(media_pool_item, self._context)
+                for media_pool_item in self._object.AddItemListToMediaPool(items)
             ]
         elif all(isinstance(item, Item_Info) for item in items):
             item_info_list = cast(List[Item_Info], items)
             temp_list = [item_info.model_dump() for item_info in item_info_list]
             return [
-                MediaPoolItem(media_pool_item)
-                for media_pool_item in self._media_storage.AddItemListToMediaPool(
-                    temp_list
-                )
+                MediaPoolItem(media_pool_item, self._context)
+                for media_pool_item in self._object.AddItemListToMediaPool(temp_list)
             ]
         else:
             raise ValueError("Invalid item type. Must be List[str] or List[Item_Info].")
@@ -84,10 +84,8 @@ class MediaStorage(WrapperBase):
         #     media_pool_item_list.append(MediaPoolItem(media_pool_item))
         # return media_pool_item_list
         return [
-            MediaPoolItem(media_pool_item)
-            for media_pool_item in self._media_storage.AddTimelineMattesToMediaPool(
-                paths
-            )
+            MediaPoolItem(media_pool_item, self._context)
+            for media_pool_item in self._object.AddTimelineMattesToMediaPool(paths)
         ]
 
     def get_file_list(self, folder_path: str) -> List[str]:
@@ -99,16 +97,16 @@ class MediaStorage(WrapperBase):
         Returns:
             List[str]: file listings in the given absolute folder path NOTE:media listings may be logically consolidated entries
         """
-        return self._media_storage.GetFileList(str(folder_path))
+        return self._object.GetFileList(str(folder_path))
 
     def get_mounted_volume_list(self) -> List[str]:
         """Returns list of folder paths corresponding to mounted volumes displayed in Resolve’s Media Storage."""
-        return self._media_storage.GetMountedVolumeList()
+        return self._object.GetMountedVolumeList()
 
     def get_sub_folder_list(self, folder_path: str) -> List[str]:
         """Returns list of folder paths in the given absolute folder path."""
-        return self._media_storage.GetSubFolderList(str(folder_path))
+        return self._object.GetSubFolderList(str(folder_path))
 
     def reveal_in_storage(self, path: str) -> bool:
         """Expands and displays given file/folder path in Resolve’s Media Storage."""
-        return self._media_storage.RevealInStorage(str(path))
+        return self._object.RevealInStorage(str(path))
@@ -0,0 +1,429 @@
+"""Persistent SQLite cache of media pool and timeline metadata.
+
+Reports that run every night mostly read data that has not changed since the
+last run, yet reading clip properties, metadata and markers of every clip
+costs several scripting calls per clip. MetadataCache keeps them in a SQLite
+file, keyed by project unique id and clip / timeline unique id, and re-reads
+only what may have changed:
+
+* a media pool folder is re-read when it is new, reports
+  ``GetIsFolderStale()``, holds a different number of clips than cached, or
+  its entry is older than ``max_age``; otherwise its clips come from the file
+  at the cost of one ``GetClipList()`` call; ``RefreshFolders()`` is called
+  once before the first stale folder is read,
+* a timeline is re-read (`Timeline.snapshot` columns and markers) when its
+  end frame or the item count of any track differs from the cached one.
+
+Edits that keep the clip count of a folder, e.g. a renamed clip, are not
+detected by the folder check; pass ``max_age`` or call `MetadataCache.invalidate`
+after known edits. Cached data stays readable without Resolve via `clips`,
+`get_clip` and `get_timeline_entry`.
+
+Example:
+    >>> with MetadataCache("~/.cache/pybmd/metadata.sqlite", project) as cache:
+    ...     cache.sync_media_pool(max_age=7 * 86400)
+    ...     for clip in cache.clips():
+    ...         print(clip.properties["Clip Name"], clip.metadata.get("Scene"))
+    ...     layout = cache.get_timeline(timeline)
+"""
+
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Union
+
+from pybmd.error import APIVersionError
+from pybmd.folder import Folder
+from pybmd.media_pool_item import MediaPoolItem
+from pybmd.timeline import Timeline, TrackType
+
+if TYPE_CHECKING:
+    from pybmd.project import Project
+
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS folders (
+    project_id TEXT NOT NULL,
+    folder_id TEXT NOT NULL,
+    clip_count INTEGER NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (project_id, folder_id)
+);
+CREATE TABLE IF NOT EXISTS clips (
+    project_id TEXT NOT NULL,
+    clip_id TEXT NOT NULL,
+    folder_id TEXT NOT NULL,
+    properties TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    markers TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (project_id, clip_id)
+);
+CREATE TABLE IF NOT EXISTS timelines (
+    project_id TEXT NOT NULL,
+    timeline_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    columns TEXT NOT NULL,
+    markers TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (project_id, timeline_id)
+);
+"""
+
+_TRACK_TYPES = (TrackType.VIDEO_TRACK, TrackType.AUDIO_TRACK, TrackType.SUBTITLE_TRACK)
+
+
+def _dumps(value) -> str:
+    # marker keys are float frames, JSON keeps them as strings
+    return json.dumps(value, default=str)
+
+
+def _markers(value: str) -> Dict[float, dict]:
+    return {float(frame): info for frame, info in json.loads(value).items()}
+
+
+@dataclass
+class CachedClip:
+    """Cached data of one media pool item."""
+
+    clip_id: str
+    folder_id: str
+    properties: Dict[str, Any]
+    metadata: Dict[str, Any]
+    markers: Dict[float, dict]
+    updated: float
+
+
+@dataclass
+class CachedTimeline:
+    """Cached layout of one timeline: Timeline.snapshot() columns without the item wrappers."""
+
+    timeline_id: str
+    name: str
+    columns: Dict[str, list]
+    markers: Dict[float, dict]
+    updated: float
+
+    def __len__(self) -> int:
+        return len(self.columns.get("start", ()))
+
+
+@dataclass
+class SyncStats:
+    """Outcome of MetadataCache.sync_media_pool."""
+
+    folders: int = 0
+    folders_read: int = 0
+    clips: int = 0
+    clips_read: int = 0
+    clips_removed: int = 0
+
+
+class MetadataCache(object):
+    """SQLite cache of clip and timeline metadata of one project.
+
+    Args:
+        path (str | Path): SQLite file, created if missing; ":memory:" for a throwaway cache
+        project (Project): project to cache
+        project_id (str, optional): unique id of the project. Defaults to None (project.get_unique_id()).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        project: "Project",
+        project_id: Optional[str] = None,
+    ):
+        if str(path) != ":memory:":
+            path = Path(path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(path))
+        self._migrate()
+        self._project = project
+        self.project_id = project_id or project.get_unique_id()
+
+    def _migrate(self):
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            # written by another pybmd version, it is only a cache
+            self._connection.executescript(
+                "DROP TABLE IF EXISTS folders; DROP TABLE IF EXISTS clips; "
+                "DROP TABLE IF EXISTS timelines;"
+            )
+        self._connection.executescript(_SCHEMA)
+        self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._connection.commit()
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self) -> "MetadataCache":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # media pool
+
+    def sync_media_pool(self, max_age: Optional[float] = None) -> SyncStats:
+        """Brings the cached clips of the project's media pool up to date.
+
+        Args:
+            max_age (float, optional): seconds after which a folder is re-read even if it looks unchanged. Defaults to None (no limit).
+
+        Returns:
+            SyncStats: folders and clips seen and re-read
+        """
+        stats = SyncStats()
+        now = time.time()
+        cached_folders = {
+            folder_id: (clip_count, updated)
+            for folder_id, clip_count, updated in self._connection.execute(
+                "SELECT folder_id, clip_count, updated FROM folders WHERE project_id = ?",
+                (self.project_id,),
+            )
+        }
+        seen: Set[str] = set()
+        media_pool = self._project.get_media_pool()
+        pending: List[Folder] = [media_pool.get_root_folder()]
+        refreshed = False
+        with self._connection:
+            while pending:
+                folder = pending.pop()
+                pending.extend(folder.get_sub_folder_list())
+                folder_id = folder.get_unique_id()
+                seen.add(folder_id)
+                stats.folders += 1
+                clips = folder.get_clip_list()
+                stats.clips += len(clips)
+                cached = cached_folders.get(folder_id)
+                stale = folder.get_is_folder_stale()
+                if (
+                    cached is not None
+                    and cached[0] == len(clips)
+                    and (max_age is None or now - cached[1] <= max_age)
+                    and not stale
+                ):
+                    continue
+                if stale and not refreshed:
+                    # load collaborators' changes once before reading stale folders
+                    refreshed = True
+                    try:
+                        media_pool.refresh_folders()
+                    except APIVersionError:
+                        pass
+                    clips = folder.get_clip_list()
+                stats.folders_read += 1
+                stats.clips_read += len(clips)
+                clip_ids = self._store_clips(folder_id, clips, now)
+                stats.clips_removed += self._delete_clips(
+                    folder_id, self._folder_clip_ids(folder_id) - clip_ids
+                )
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO folders VALUES (?, ?, ?, ?)",
+                    (self.project_id, folder_id, len(clip_ids), now),
+                )
+            # clips of folders deleted since the last sync
+            for (folder_id,) in self._connection.execute(
+                "SELECT DISTINCT folder_id FROM clips WHERE project_id = ?",
+                (self.project_id,),
+            ).fetchall():
+                if folder_id not in seen:
+                    stats.clips_removed += self._delete_clips(
+                        folder_id, self._folder_clip_ids(folder_id)
+                    )
+            self._connection.executemany(
+                "DELETE FROM folders WHERE project_id = ? AND folder_id = ?",
+                [
+                    (self.project_id, folder_id)
+                    for folder_id in set(cached_folders) - seen
+                ],
+            )
+        return stats
+
+    def _folder_clip_ids(self, folder_id: str) -> Set[str]:
+        return {
+            clip_id
+            for (clip_id,) in self._connection.execute(
+                "SELECT clip_id FROM clips WHERE project_id = ? AND folder_id = ?",
+                (self.project_id, folder_id),
+            )
+        }
+
+    def _store_clips(
+        self, folder_id: str, clips: List[MediaPoolItem], now: float
+    ) -> Set[str]:
+        rows = []
+        for clip in clips:
+            rows.append(
+                (
+                    self.project_id,
+                    clip.get_unique_id(),
+                    folder_id,
+                    _dumps(clip.get_clip_property()),
+                    _dumps(clip.get_metadata()),
+                    _dumps(clip.get_markers() or {}),
+                    now,
+                )
+            )
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO clips VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+        )
+        return {row[1] for row in rows}
+
+    def _delete_clips(self, folder_id: str, clip_ids: Set[str]) -> int:
+        # a clip moved to another folder is already stored under that folder
+        return self._connection.executemany(
+            "DELETE FROM clips WHERE project_id = ? AND clip_id = ? AND folder_id = ?",
+            [(self.project_id, clip_id, folder_id) for clip_id in clip_ids],
+        ).rowcount
+
+    def _clip(self, row) -> CachedClip:
+        clip_id, folder_id, properties, metadata, markers, updated = row
+        return CachedClip(
+            clip_id,
+            folder_id,
+            json.loads(properties),
+            json.loads(metadata),
+            _markers(markers),
+            updated,
+        )
+
+    def get_clip(self, clip_id: str) -> Optional[CachedClip]:
+        """Returns the cached data of a clip, None if it is not cached."""
+        row = self._connection.execute(
+            "SELECT clip_id, folder_id, properties, metadata, markers, updated "
+            "FROM clips WHERE project_id = ? AND clip_id = ?",
+            (self.project_id, clip_id),
+        ).fetchone()
+        return self._clip(row) if row else None
+
+    def clips(self) -> Iterator[CachedClip]:
+        """Yields the cached data of every clip of the project."""
+        for row in self._connection.execute(
+            "SELECT clip_id, folder_id, properties, metadata, markers, updated "
+            "FROM clips WHERE project_id = ?",
+            (self.project_id,),
+        ):
+            yield self._clip(row)
+
+    # timelines
+
+    def _timeline_signature(self, timeline: Timeline) -> list:
+        signature = [timeline.get_end_frame()]
+        for track_type in _TRACK_TYPES:
+            signature.append(
+                [
+                    len(timeline.get_item_list_in_track(track_type, track_index))
+                    for track_index in range(
+                        1, timeline.get_track_count(track_type) + 1
+                    )
+                ]
+            )
+        return signature
+
+    def get_timeline_entry(self, timeline_id: str) -> Optional[CachedTimeline]:
+        """Returns the cached layout of a timeline without revalidating it, None if it is not cached."""
+        row = self._connection.execute(
+            "SELECT timeline_id, name, columns, markers, updated FROM timelines "
+            "WHERE project_id = ? AND timeline_id = ?",
+            (self.project_id, timeline_id),
+        ).fetchone()
+        if row is None:
+            return None
+        timeline_id, name, columns, markers, updated = row
+        return CachedTimeline(
+            timeline_id, name, json.loads(columns), _markers(markers), updated
+        )
+
+    def get_timeline(self, timeline: Timeline) -> CachedTimeline:
+        """Returns the layout of timeline, re-read when its end frame or track item counts changed.
+
+        Args:
+            timeline (Timeline): timeline of the project
+
+        Returns:
+            CachedTimeline: snapshot columns and markers of the timeline
+        """
+        timeline_id = timeline.get_unique_id()
+        signature = _dumps(self._timeline_signature(timeline))
+        row = self._connection.execute(
+            "SELECT signature FROM timelines WHERE project_id = ? AND timeline_id = ?",
+            (self.project_id, timeline_id),
+        ).fetchone()
+        if row is not None and row[0] == signature:
+            return self.get_timeline_entry(timeline_id)
+
+        entry = CachedTimeline(
+            timeline_id,
+            timeline.get_name(),
+            timeline.snapshot().to_dict(),
+            timeline.get_markers() or {},
+            time.time(),
+        )
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO timelines VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.project_id,
+                    timeline_id,
+                    entry.name,
+                    signature,
+                    _dumps(entry.columns),
+                    _dumps(entry.markers),
+                    entry.updated,
+                ),
+            )
+        return entry
+
+    def sync_timelines(self) -> List[CachedTimeline]:
+        """Revalidates every timeline of the project and forgets deleted ones."""
+        project = self._project
+        entries = [
+            self.get_timeline(project.get_timeline_by_index(index))
+            for index in range(1, project.get_timeline_count() + 1)
+        ]
+        with self._connection:
+            self._connection.execute(
+                f"DELETE FROM timelines WHERE project_id = ? AND timeline_id NOT IN "
+                f"({', '.join('?' * len(entries))})",
+                (self.project_id, *(entry.timeline_id for entry in entries)),
+            )
+        return entries
+
+    def invalidate(self, clip_ids=None, folder_ids=None, timeline_ids=None):
+        """Forgets cached entries so the next sync re-reads them; all entries of the project when nothing is given.
+
+        Args:
+            clip_ids (Iterable[str], optional): clips whose folder is re-read. Defaults to None.
+            folder_ids (Iterable[str], optional): folders to re-read. Defaults to None.
+            timeline_ids (Iterable[str], optional): timelines to re-read. Defaults to None.
+        """
+        project_id = self.project_id
+        with self._connection:
+            if clip_ids is None and folder_ids is None and timeline_ids is None:
+                for table in ("folders", "clips", "timelines"):
+                    self._connection.execute(
+                        f"DELETE FROM {table} WHERE project_id = ?", (project_id,)
+                    )
+                return
+            folder_ids = set(folder_ids or ())
+            for clip_id in clip_ids or ():
+                row = self._connection.execute(
+                    "SELECT folder_id FROM clips WHERE project_id = ? AND clip_id = ?",
+                    (project_id, clip_id),
+                ).fetchone()
+                if row:
+                    folder_ids.add(row[0])
+            self._connection.executemany(
+                "DELETE FROM folders WHERE project_id = ? AND folder_id = ?",
+                [(project_id, folder_id) for folder_id in folder_ids],
+            )
+            self._connection.executemany(
+                "DELETE FROM timelines WHERE project_id = ? AND timeline_id = ?",
+                [(project_id, timeline_id) for timeline_id in timeline_ids or ()],
+            )
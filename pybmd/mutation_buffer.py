@@ -0,0 +1,307 @@
+"""Write-behind buffer for clip and timeline item mutations.
+
+Setting metadata, colors, flags and properties on thousands of clips costs
+one blocking round-trip per call, in whatever order the script issues them.
+MutationBuffer collects those writes instead and flushes them when the
+``with`` block ends:
+
+* a write overwritten later in the block is dropped, as are repeated flags
+  and values the wrapper's cache already shows as set,
+* writes are grouped per object and issued object by object in one loop, on
+  the connection's owner thread when the connection has an executor,
+* metadata and third party metadata of one clip go out as one dict-form
+  ``SetMetadata(dict)`` / ``SetThirdPartyMetadata(dict)`` call.
+
+The buffer does not flush when the block raises. `MutationBuffer.flush`
+returns a MutationReport with the outcome of every write.
+
+Example:
+    >>> with MutationBuffer() as buffer:
+    ...     for clip in clips:
+    ...         buffer.set_metadata(clip, "Scene", scenes[clip])
+    ...         buffer.set_metadata(clip, "Take", takes[clip])
+    ...         buffer.set_clip_color(clip, "Orange")
+    ...         buffer.add_flag(clip, "Blue")
+    >>> buffer.report.failures
+    []
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from pybmd.media_pool_item import MediaPoolItem
+from pybmd.timeline_item import TimelineItem
+
+Target = Union[MediaPoolItem, TimelineItem]
+
+# clip color value queued by clear_clip_color
+_CLEAR = object()
+
+
+@dataclass
+class WriteResult:
+    """Outcome of one buffered write."""
+
+    target: Target
+    operation: str
+    key: Optional[str]
+    value: Any
+    ok: bool
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class MutationReport:
+    """Outcome of a MutationBuffer flush."""
+
+    results: List[WriteResult] = field(default_factory=list)
+    dropped: int = 0
+    calls: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self.results)
+
+    @property
+    def failures(self) -> List[WriteResult]:
+        return [result for result in self.results if not result.ok]
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+
+class _Pending(object):
+    __slots__ = (
+        "target",
+        "metadata",
+        "third_party_metadata",
+        "clip_properties",
+        "properties",
+        "clip_color",
+        "flags",
+    )
+
+    def __init__(self, target: Target):
+        self.target = target
+        self.metadata: Dict[str, Any] = {}
+        self.third_party_metadata: Dict[str, Any] = {}
+        self.clip_properties: Dict[str, Any] = {}
+        self.properties: Dict[str, Any] = {}
+        self.clip_color: Any = None
+        self.flags: Dict[str, None] = {}
+
+
+class MutationBuffer(object):
+    """Collects writes to MediaPoolItem and TimelineItem wrappers and flushes them grouped per object.
+
+    Writes are keyed by wrapper; with pybmd.interning enabled all wrappers of
+    one clip are the same object and share their pending writes.
+    """
+
+    def __init__(self):
+        self._pending: Dict[int, _Pending] = {}
+        self._dropped = 0
+        self.report: Optional[MutationReport] = None
+
+    def __len__(self) -> int:
+        """Number of pending writes."""
+        return sum(
+            len(pending.metadata)
+            + len(pending.third_party_metadata)
+            + len(pending.clip_properties)
+            + len(pending.properties)
+            + (pending.clip_color is not None)
+            + len(pending.flags)
+            for pending in self._pending.values()
+        )
+
+    def __enter__(self) -> "MutationBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+        else:
+            self.discard()
+
+    def _entry(self, target: Target) -> _Pending:
+        pending = self._pending.get(id(target))
+        if pending is None:
+            pending = self._pending[id(target)] = _Pending(target)
+        return pending
+
+    def _put(self, values: Dict[str, Any], key: str, value: Any):
+        if key in values:
+            self._dropped += 1
+        values[key] = value
+
+    # media pool items
+
+    def set_metadata(self, clip: MediaPoolItem, metadata_type: str, metadata_value):
+        """Queues MediaPoolItem.set_metadata, skipped if the clip's cached metadata already holds the value."""
+        cached = clip._metadata
+        if cached is not None and cached.get(metadata_type) == metadata_value:
+            self._dropped += 1
+            return
+        self._put(self._entry(clip).metadata, metadata_type, metadata_value)
+
+    def set_third_party_metadata(
+        self, clip: MediaPoolItem, metadata_type: str, metadata_value
+    ):
+        """Queues MediaPoolItem.set_third_party_metadata."""
+        self._put(self._entry(clip).third_party_metadata, metadata_type, metadata_value)
+
+    def set_clip_property(
+        self, clip: MediaPoolItem, property_type: str, property_value
+    ):
+        """Queues MediaPoolItem.set_clip_property."""
+        self._put(self._entry(clip).clip_properties, property_type, property_value)
+
+    # timeline items
+
+    def set_property(self, item: TimelineItem, property_key: str, property_value):
+        """Queues TimelineItem.set_property."""
+        self._put(self._entry(item).properties, property_key, property_value)
+
+    # both
+
+    def set_clip_color(self, target: Target, color_name: str):
+        """Queues set_clip_color of a MediaPoolItem or TimelineItem, replacing an earlier color."""
+        if isinstance(target, MediaPoolItem) and target._clip_properties is not None:
+            if target._clip_properties.get("Clip Color") == color_name:
+                self._dropped += 1
+                return
+        pending = self._entry(target)
+        if pending.clip_color is not None:
+            self._dropped += 1
+        pending.clip_color = color_name
+
+    def clear_clip_color(self, target: Target):
+        """Queues clear_clip_color of a MediaPoolItem or TimelineItem, replacing an earlier color."""
+        pending = self._entry(target)
+        if pending.clip_color is not None:
+            self._dropped += 1
+        pending.clip_color = _CLEAR
+
+    def add_flag(self, target: Target, color: str):
+        """Queues add_flag of a MediaPoolItem or TimelineItem, once per color."""
+        flags = self._entry(target).flags
+        if color in flags:
+            self._dropped += 1
+        flags[color] = None
+
+    # flush
+
+    def discard(self):
+        """Drops all pending writes."""
+        self._pending.clear()
+        self._dropped = 0
+
+    def flush(self) -> MutationReport:
+        """Issues the pending writes object by object.
+
+        Returns:
+            MutationReport: one WriteResult per write, also kept in self.report
+        """
+        pending = list(self._pending.values())
+        report = MutationReport(dropped=self._dropped)
+        self.discard()
+        if pending:
+            context = pending[0].target._context
+            executor = context.executor if context is not None else None
+            if executor is not None:
+                # one hop to the owner thread for the whole loop
+                executor.call(self._flush, pending, report)
+            else:
+                self._flush(pending, report)
+        self.report = report
+        return report
+
+    def _write(
+        self,
+        report: MutationReport,
+        target: Target,
+        operation: str,
+        writes: Dict[Optional[str], Any],
+        call: Callable[[], Any],
+    ):
+        report.calls += 1
+        try:
+            ok, error = bool(call()), None
+        except Exception as exc:
+            ok, error = False, exc
+        report.results.extend(
+            WriteResult(target, operation, key, value, ok, error)
+            for key, value in writes.items()
+        )
+
+    def _write_dict(
+        self,
+        report: MutationReport,
+        target: MediaPoolItem,
+        operation: str,
+        values: Dict[str, Any],
+        method: Callable,
+    ):
+        if len(values) > 1:
+            self._write(report, target, operation, values, lambda: method(dict(values)))
+        else:
+            ((key, value),) = values.items()
+            self._write(report, target, operation, values, lambda: method(key, value))
+
+    def _flush(self, pending: List[_Pending], report: MutationReport):
+        for entry in pending:
+            target = entry.target
+            if entry.metadata:
+                self._write_dict(
+                    report, target, "set_metadata", entry.metadata, target.set_metadata
+                )
+            if entry.third_party_metadata:
+                self._write_dict(
+                    report,
+                    target,
+                    "set_third_party_metadata",
+                    entry.third_party_metadata,
+                    target.set_third_party_metadata,
+                )
+            for key, value in entry.clip_properties.items():
+                self._write(
+                    report,
+                    target,
+                    "set_clip_property",
+                    {key: value},
+                    lambda: target.set_clip_property(key, value),
+                )
+            for key, value in entry.properties.items():
+                self._write(
+                    report,
+                    target,
+                    "set_property",
+                    {key: value},
+                    lambda: target.set_property(key, value),
+                )
+            if entry.clip_color is _CLEAR:
+                self._write(
+                    report,
+                    target,
+                    "clear_clip_color",
+                    {None: None},
+                    target.clear_clip_color,
+                )
+            elif entry.clip_color is not None:
+                color = entry.clip_color
+                self._write(
+                    report,
+                    target,
+                    "set_clip_color",
+                    {None: color},
+                    lambda: target.set_clip_color(color),
+                )
+            for color in entry.flags:
+                self._write(
+                    report,
+                    target,
+                    "add_flag",
+                    {None: color},
+                    lambda: target.add_flag(color),
+                )
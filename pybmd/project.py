@@ -6,6 +6,7 @@ from pybmd.gallery import Gallery
 from pybmd.media_pool import MediaPool
 
 from pybmd.timeline import Timeline
+from pybmd.timeline_index import TimelineIndex
 
 if TYPE_CHECKING:
     from pybmd.settings import RenderSetting
@@ -16,15 +17,18 @@ RenderResolution = List[dict]
 class Project(WrapperBase):
     """Project Object"""
 
-    def __init__(self, project):
-        super(Project, self).__init__(project)
-        self._project = self._object
+    __slots__ = ("_timeline_index",)
+    _project = WrapperBase._handle_alias
+
+    def __init__(self, project, context=None):
+        super(Project, self).__init__(project, context)
+        self._timeline_index: TimelineIndex | None = None
 
     def __repr__(self) -> str:
         return f"Project: {self.get_name()}"
 
     def get_self_project(self):
-        return self._project
+        return self._object
 
     def add_render_job(self) -> str:
         """Adds a render job based on current render settings to the render queue.
@@ -32,47 +36,47 @@ class Project(WrapperBase):
         Returns:
             str: A unique job id (string) for the new render job.
         """
-        return self._project.AddRenderJob()
+        return self._object.AddRenderJob()
 
     def delete_all_render_jobs(self) -> bool:
         """Deletes all render jobs in the render queue."""
-        return self._project.DeleteAllRenderJobs()
+        return self._object.DeleteAllRenderJobs()
 
     def delete_render_job(self, job_id: str) -> bool:
         """Deletes render job for input job id (string)."""
-        return self._project.DeleteRenderJob(job_id)
+        return self._object.DeleteRenderJob(job_id)
 
     def get_current_render_format_and_codec(self) -> dict:
         """Returns a dict with currently selected format 'format' and render codec 'codec'."""
-        return self._project.GetCurrentRenderFormatAndCodec()
+        return self._object.GetCurrentRenderFormatAndCodec()
 
     def get_current_render_mode(self) -> int:
         """Returns the render mode: 0 - Individual clips, 1 - Single clip."""
-        return self._project.GetCurrentRenderMode()
+        return self._object.GetCurrentRenderMode()
 
     def get_current_timeline(self) -> Timeline:
         """Returns the currently loaded Timeline."""
-        current_timeline = self._project.GetCurrentTimeline()
+        current_timeline = self._object.GetCurrentTimeline()
         if current_timeline is not None:
-            return Timeline(self._project.GetCurrentTimeline())
+            return Timeline(self._object.GetCurrentTimeline(), self._context)
         else:
             raise TypeError("No current timeline,Please open a timeline")
 
     def get_gallery(self) -> Gallery:
         """Returns the Gallery object."""
-        return Gallery(self._project.GetGallery())
+        return Gallery(self._object.GetGallery(), self._context)
 
     def get_media_pool(self) -> MediaPool:
         """Returns the MediaPool object."""
-        return MediaPool(self._project.GetMediaPool())
+        return MediaPool(self._object.GetMediaPool(), self._context)
 
     def get_name(self) -> str:
         """Return project name"""
-        return self._project.GetName()
+        return self._object.GetName()
 
     def get_preset_list(self) -> list:
         """Returns a list of presets and their information."""
-        return self._project.GetPresetList()
+        return self._object.GetPresetList()
 
     def get_render_codecs(self, render_format: str) -> dict:
         """returns a dict with render codecs for a given render format.
@@ -83,23 +87,23 @@ class Project(WrapperBase):
         Returns:
             dict: codec description -> codec name
         """
-        return self._project.GetRenderCodecs(render_format)
+        return self._object.GetRenderCodecs(render_format)
 
     def get_render_formats(self) -> dict:
         """Returns a dict (format -> file extension) of available render formats."""
-        return self._project.GetRenderFormats()
+        return self._object.GetRenderFormats()
 
     def get_render_job_list(self) -> list:
         """Returns a list of render jobs and their information."""
-        return self._project.GetRenderJobList()
+        return self._object.GetRenderJobList()
 
     def get_render_job_status(self, job_id: str) -> dict:
         """Returns a dict with job status and completion percentage of the job by given jobId (string)."""
-        return self._project.GetRenderJobStatus(job_id)
+        return self._object.GetRenderJobStatus(job_id)
 
     def get_render_preset_list(self):
         """Returns a list of render presets and their information."""
-        return self._project.GetRenderPresetList()
+        return self._object.GetRenderPresetList()
 
     def get_render_resolutions(self, format: str, codec: str) -> RenderResolution:
         """Returns list of resolutions applicable for the given render format (string) and render codec (string).
@@ -112,40 +116,91 @@ class Project(WrapperBase):
             RenderResolution: Returns full list of resolutions if no argument is provided. Each element in the list is a dictionary with 2 keys "Width" and "Height".
         """
         # Sample: current_project.get_render_resolutions(format='mp4',codec='h264')
-        return self._project.GetRenderResolutions(format, codec)
+        return self._object.GetRenderResolutions(format, codec)
 
     def get_setting(self, setting_name: str = "") -> str:
         """Returns value of project setting (indicated by setting_name, string)."""
         # call *without parameters/NoneType * to get a snapshot of all queryable properties
-        return self._project.GetSetting(setting_name)
+        return self._object.GetSetting(setting_name)
 
     def get_timeline_by_index(self, idx) -> Timeline:
         """Returns Timeline at the given index, 1 <= idx <= project.get_timeline_count()"""
-        return Timeline(timeline=self._project.GetTimelineByIndex(idx))
+        return Timeline(
+            timeline=self._object.GetTimelineByIndex(idx), context=self._context
+        )
 
     def get_timeline_count(self) -> int:
         """Returns the number of timelines currently present in the project."""
-        return self._project.GetTimelineCount()
+        return self._object.GetTimelineCount()
+
+    def get_timeline_index(self) -> TimelineIndex:
+        """Returns the name index of the project's timelines, built on first use.
+
+        The index is shared by all wrappers of the project on one connection.
+        """
+        index = self._timeline_index
+        if index is None:
+            context = self._context
+            if context is None:
+                index = TimelineIndex(self)
+            else:
+                project_id = self.get_unique_id()
+                index = context.timeline_indexes.get(project_id)
+                if index is None:
+                    index = context.timeline_indexes[project_id] = TimelineIndex(self)
+                else:
+                    # look timelines up through the latest wrapper of the project
+                    index._project = self
+            self._timeline_index = index
+        return index
+
+    def get_timeline_by_name(self, timeline_name: str) -> Timeline | None:
+        """Returns the timeline named timeline_name, None if there is none.
+
+        Raises:
+            ValueError: several timelines are named timeline_name.
+        """
+        matches = self.get_timeline_index().find(timeline_name)
+        if len(matches) > 1:
+            raise ValueError(f"Timeline {timeline_name} multiple found.")
+        return matches[0] if matches else None
+
+    def get_timelines_by_name(
+        self, timeline_names: List[str]
+    ) -> Dict[str, Timeline | None]:
+        """Returns the timeline named like each of timeline_names, None for names without one.
+
+        Raises:
+            ValueError: several timelines share one of the names.
+        """
+        result = {}
+        for timeline_name, matches in (
+            self.get_timeline_index().find_many(timeline_names).items()
+        ):
+            if len(matches) > 1:
+                raise ValueError(f"Timeline {timeline_name} multiple found.")
+            result[timeline_name] = matches[0] if matches else None
+        return result
 
     def is_rendering_in_progress(self) -> bool:
         """Returns True if rendering is in progress."""
-        return self._project.IsRenderingInProgress()
+        return self._object.IsRenderingInProgress()
 
     def load_render_preset(self, preset_name) -> bool:
         """Sets a preset as current preset for rendering if preset_name (string) exists."""
-        return self._project.LoadRenderPreset(preset_name)
+        return self._object.LoadRenderPreset(preset_name)
 
     def refresh_lut_list(self) -> bool:
         """Refreshes LUT List"""
-        return self._project.RefreshLUTList()
+        return self._object.RefreshLUTList()
 
     def save_as_new_render_preset(self, preset_name) -> bool:
         """Creates new render preset by given name if preset_name(string) is unique."""
-        return self._project.SaveAsNewRenderPreset(preset_name)
+        return self._object.SaveAsNewRenderPreset(preset_name)
 
     def set_current_render_format_and_codec(self, format: str, codec: str) -> bool:
         """Sets given render format (string) and render codec (string) as options for rendering."""
-        return self._project.SetCurrentRenderFormatAndCodec(format, codec)
+        return self._object.SetCurrentRenderFormatAndCodec(format, codec)
 
     def set_current_render_mode(self, render_mode: int) -> bool:
         """Sets the render mode.
@@ -156,19 +211,19 @@ class Project(WrapperBase):
         Returns:
             bool: True if successful.
         """
-        return self._project.SetCurrentRenderMode(render_mode)
+        return self._object.SetCurrentRenderMode(render_mode)
 
     def set_current_timeline(self, timeline: Timeline) -> bool:
         """Sets given Timeline as current timeline for the project. Returns True if successful."""
-        return self._project.SetCurrentTimeline(timeline._timeline)
+        return self._object.SetCurrentTimeline(timeline._object)
 
     def set_name(self, project_name) -> bool:
         """Sets project name if given project_name (string) is unique."""
-        return self._project.SetName(project_name)
+        return self._object.SetName(project_name)
 
     def set_preset(self, preset_name: str) -> bool:
         """Sets preset by given preset_name (string) into project."""
-        return self._project.SetPreset(preset_name)
+        return self._object.SetPreset(preset_name)
 
     def set_render_settings(self, render_setting: "RenderSetting") -> bool:
         """Sets given settings for rendering.
@@ -180,9 +235,9 @@ class Project(WrapperBase):
             bool: True if successful.
         """
         if type(render_setting) is dict:
-            return self._project.SetRenderSettings(render_setting)
+            return self._object.SetRenderSettings(render_setting)
         else:
-            return self._project.SetRenderSettings(render_setting.model_dump())
+            return self._object.SetRenderSettings(render_setting.model_dump())
 
     def set_setting(self, setting_name: str, setting_value: str):
         """Sets value of project setting (indicated by setting_name, string).
@@ -194,17 +249,17 @@ class Project(WrapperBase):
         Returns:
             _type_: True if successful.
         """
-        return self._project.SetSetting(setting_name, setting_value)
+        return self._object.SetSetting(setting_name, setting_value)
 
     def start_rendering(self, job_ids: list, is_interactive_mode=False) -> bool:
         """Start rendering. Returns True if successful.
         if job_ids==None render all queued render jobs.
         """
-        return self._project.StartRendering(job_ids, is_interactive_mode)
+        return self._object.StartRendering(job_ids, is_interactive_mode)
 
     def stop_rendering(self):
         """Stops rendering."""
-        return self._project.StopRendering()
+        return self._object.StopRendering()
 
     ##############################################################################################################################
     # Add at DR18.0.0
@@ -222,7 +277,7 @@ class Project(WrapperBase):
         Version:
             Added in DaVinci Resolve 18.0.0
         """
-        return self._project.GetUniqueId()
+        return self._object.GetUniqueId()
 
     ##############################################################################################################################
     # Add at DR18.1.3
@@ -247,7 +302,7 @@ class Project(WrapperBase):
         Version:
             Added in DaVinci Resolve 18.1.3
         """
-        return self._project.InsertAudioToCurrentTrackAtPlayhead(
+        return self._object.InsertAudioToCurrentTrackAtPlayhead(
             media_path, start_offset_in_samples, duration_in_samples
         )
 
@@ -270,7 +325,7 @@ class Project(WrapperBase):
         Version:
             Added in DaVinci Resolve 18.5.0 Beta
         """
-        return self._project.LoadBurnInPreset(preset_name)
+        return self._object.LoadBurnInPreset(preset_name)
 
     ##############################################################################################################################
     # Add at DR18.5.0
@@ -291,7 +346,7 @@ class Project(WrapperBase):
         Version:
             Added in DaVinci Resolve 18.5.0
         """
-        return self._project.ExportCurrentFrameAsStill(file_path)
+        return self._object.ExportCurrentFrameAsStill(file_path)
 
     ##############################################################################################################################
     # Add at DR 19.0.0
@@ -309,8 +364,8 @@ class Project(WrapperBase):
             Added in DaVinci Resolve 19.0.0
         """
         color_group_list = list()
-        for color_group in self._project.GetColorGroupsList():
-            color_group_list.append(ColorGroup(color_group))
+        for color_group in self._object.GetColorGroupsList():
+            color_group_list.append(ColorGroup(color_group, self._context))
         return color_group_list
 
     @requires_resolve_version(added_in="19.0.0")
@@ -323,7 +378,7 @@ class Project(WrapperBase):
         Returns:
             ColorGroup: ColorGroup object if successful, otherwise None.
         """
-        return ColorGroup(self._project.AddColorGroup(group_name))
+        return ColorGroup(self._object.AddColorGroup(group_name), self._context)
 
     def delete_color_group(self, color_group: ColorGroup) -> bool:
         """Deletes the given color group and sets clips to ungrouped.
@@ -334,7 +389,7 @@ class Project(WrapperBase):
         Returns:
             bool: Return True if successful, otherwise False.
         """
-        return self._project.DeleteColorGroup(color_group._color_group)
+        return self._object.DeleteColorGroup(color_group._object)
 
     ##############################################################################################################################
     # Add at DR 19.1.0
@@ -355,14 +410,14 @@ class Project(WrapperBase):
         Version:
             Added in DaVinci Resolve 19.1.0
         """
-        return self._project.DeleteRenderPreset(preset_name)
+        return self._object.DeleteRenderPreset(preset_name)
 
     @requires_resolve_version(added_in="19.1.0")
     def get_quick_export_render_presets(self) -> List[str]:
         """
         Returns a list of names of all Quick Export render presets.
         """
-        return self._project.GetQuickExportRenderPresets()
+        return self._object.GetQuickExportRenderPresets()
 
     @requires_resolve_version(added_in="19.1.0")
     def render_with_quick_export(
@@ -378,7 +433,7 @@ class Project(WrapperBase):
         Returns:
             Dict[str, Any]: A dictionary containing the job status and render time, or an error string if the render failed or was not attempted.
         """
-        return self._project.RenderWithQuickExport(preset_name, param_dict)
+        return self._object.RenderWithQuickExport(preset_name, param_dict)
 
     ##############################################################################################################################
     # Add at DR 20.3.0
@@ -399,4 +454,4 @@ class Project(WrapperBase):
         Version:
             Added in DaVinci Resolve 20.3.0
         """
-        return self._project.ApplyFairlightPresetToCurrentTimeline(preset_name)
+        return self._object.ApplyFairlightPresetToCurrentTimeline(preset_name)
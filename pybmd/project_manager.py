@@ -12,9 +12,11 @@ DatabaseList = List[Dict]
 
 
 class ProjectManager(WrapperBase):
-    def __init__(self, project_manager):
-        super(ProjectManager, self).__init__(project_manager)
-        self._project_manager = self._object
+
+    __slots__ = ()
+    _project_manager = WrapperBase._handle_alias
+    def __init__(self, project_manager, context=None):
+        super(ProjectManager, self).__init__(project_manager, context)
 
     def close_project(self, project: Project) -> bool:
         """close project
@@ -25,7 +27,7 @@ class ProjectManager(WrapperBase):
         Returns:
             bool: true if project was closed, false otherwise
         """
-        return self._project_manager.CloseProject(project.get_self_project())
+        return self._object.CloseProject(project.get_self_project())
 
     def create_folder(self, folder_name: str) -> bool:
         """Creates a folder if folderName(string) is unique.
@@ -36,7 +38,7 @@ class ProjectManager(WrapperBase):
         Returns:
             bool: True if folder was created, False otherwise
         """
-        return self._project_manager.CreateFolder(folder_name)
+        return self._object.CreateFolder(folder_name)
 
     def create_project(
         self, project_name: str, media_location_path: str | None = None
@@ -52,11 +54,12 @@ class ProjectManager(WrapperBase):
         """
         if media_location_path is not None:
             return Project(
-                project=self._project_manager.CreateProject(
-                    project_name, media_location_path
+                project=self._object.CreateProject(project_name, media_location_path),
+                context=self._context,
                 )
+        return Project(
+            project=self._object.CreateProject(project_name), context=self._context
             )
-        return Project(project=self._project_manager.CreateProject(project_name))
 
     def delete_folder(self, folder_name: str) -> bool:
         """Deletes the specified folder if it exists
@@ -67,11 +70,11 @@ class ProjectManager(WrapperBase):
         Returns:
             bool: True if folder was deleted, False otherwise
         """
-        return self._project_manager.DeleteFolder(folder_name)
+        return self._object.DeleteFolder(folder_name)
 
     def delete_project(self, project_name: str) -> bool:
         """Delete project in the current folder if not currently loaded"""
-        return self._project_manager.DeleteProject(project_name)
+        return self._object.DeleteProject(project_name)
 
     def export_project(
         self, project_name: str, file_path: Path, with_stills_and_luts: bool = True
@@ -86,7 +89,7 @@ class ProjectManager(WrapperBase):
         Returns:
             bool: True if project was exported, False otherwise
         """
-        return self._project_manager.ExportProject(
+        return self._object.ExportProject(
             project_name, str(file_path), with_stills_and_luts
         )
 
@@ -96,53 +99,55 @@ class ProjectManager(WrapperBase):
         Returns:
             dict: database infomation with keys DbType, DbName and optional IpAddress
         """
-        return self._project_manager.GetCurrentDatabase()
+        return self._object.GetCurrentDatabase()
 
     def get_current_project(self) -> Project:
         """Returns the current project"""
-        return Project(project=self._project_manager.GetCurrentProject())
+        return Project(project=self._object.GetCurrentProject(), context=self._context)
 
     def get_database_list(self) -> DatabaseList:
         """return database list"""
-        return self._project_manager.GetDatabaseList()
+        return self._object.GetDatabaseList()
 
     def get_folder_list_in_current_folder(self) -> List[str]:
         """Returns a list of folder names in current folder."""
-        return self._project_manager.GetFolderListInCurrentFolder()
+        return self._object.GetFolderListInCurrentFolder()
 
     def get_project_list_in_current_folder(self) -> List[str]:
         """Returns a list of project names in current folder."""
-        return self._project_manager.GetProjectListInCurrentFolder()
+        return self._object.GetProjectListInCurrentFolder()
 
     def goto_parent_folder(self) -> bool:
         """Opens parent folder of current folder in database if current folder has parent."""
-        return self._project_manager.GotoParentFolder()
+        return self._object.GotoParentFolder()
 
     def goto_root_folder(self) -> bool:
         """Opens root folder in database."""
-        return self._project_manager.GotoRootFolder()
+        return self._object.GotoRootFolder()
 
     # Modified at DR18.0.0
     def import_project(self, file_path: Path, project_name: str) -> bool:
         """Imports a project from the file path provided with given project name. Returns True if successful."""
-        return self._project_manager.ImportProject(str(file_path), project_name)
+        return self._object.ImportProject(str(file_path), project_name)
 
     def load_project(self, project_name) -> "Project":
         """Loads and returns the@Project  with name = project_name (string) if there is a match found, and None if there is no matching Project."""
-        return Project(project=self._project_manager.LoadProject(project_name))
+        return Project(
+            project=self._object.LoadProject(project_name), context=self._context
+        )
 
     def open_folder(self, folder_name: str) -> bool:
         """Opens folder under given name."""
-        return self._project_manager.OpenFolder(folder_name)
+        return self._object.OpenFolder(folder_name)
 
     # Modified at DR18.0.0
     def restore_project(self, file_path: Path, project_name: str) -> bool:
         """Restores a project from the file path provided with given project name. Returns True if successful."""
-        return self._project_manager.RestoreProject(str(file_path), project_name)
+        return self._object.RestoreProject(str(file_path), project_name)
 
     def save_project(self) -> bool:
         """Saves the currently loaded project with its own name. Returns True if successful."""
-        return self._project_manager.SaveProject()
+        return self._object.SaveProject()
 
     def set_current_database(self, database_info: dict) -> bool:
         """Switches current database connection to the database specified by the keys below, and closes any open project.
@@ -153,7 +158,7 @@ class ProjectManager(WrapperBase):
         Returns:
             bool: True if database was set, False otherwise
         """
-        return self._project_manager.SetCurrentDatabase(database_info)
+        return self._object.SetCurrentDatabase(database_info)
 
     ##########################################################################################################################
     # Add at DR18.0.0
@@ -179,7 +184,7 @@ class ProjectManager(WrapperBase):
             bool: Returns true if archive project is successful; false otherwise
 
         """
-        return self._project_manager.ArchiveProject(
+        return self._object.ArchiveProject(
             project_name,
             file_path,
             is_archive_src_media,
@@ -199,7 +204,9 @@ class ProjectManager(WrapperBase):
         Returns:
             Project: returns a cloud project
         """
-        return Project(self._project_manager.CreateCloudProject(cloud_setting.model_dump()))
+        return Project(
+            self._object.CreateCloudProject(cloud_setting.model_dump()), self._context
+        )
 
     @minimum_resolve_version("18.6.4")
     def import_cloud_project(
@@ -214,7 +221,7 @@ class ProjectManager(WrapperBase):
         Returns:
             bool: Returns True if import cloud project is successful; False otherwise
         """
-        return self._project_manager.ImportCloudProject(
+        return self._object.ImportCloudProject(
             file_path, cloud_setting.model_dump()
         )
 
@@ -231,7 +238,7 @@ class ProjectManager(WrapperBase):
         Returns:
             bool: Returns True if restore cloud project is successful; False otherwise
         """
-        return self._project_manager.RestoreCloudProject(
+        return self._object.RestoreCloudProject(
             folder_path, cloud_setting.model_dump()
         )
 
@@ -247,7 +254,9 @@ class ProjectManager(WrapperBase):
         Returns:
             Project: returns a cloud project
         """
-        return Project(self._project_manager.LoadCloudProject(cloud_setting.model_dump()))
+        return Project(
+            self._object.LoadCloudProject(cloud_setting.model_dump()), self._context
+        )
 
     # More function BELOW!
 
@@ -0,0 +1,347 @@
+"""Record and replay DaVinci Resolve scripting sessions.
+
+RecordingBMDModule wraps a scripting module (fusionscript by default) and
+writes every call made on Resolve scripting objects, with its arguments,
+return value and duration, to a JSON lines file (gzip compressed for a
+``.gz`` suffix). ReplayBMDModule reads such a file back and answers the same
+calls in the same order without Resolve, optionally faster or slower than
+recorded, so slow production runs can be reproduced and pybmd's own overhead
+profiled in isolation.
+
+Scripting objects are stored as integer handles, values Resolve exposes as
+attributes (the ``EXPORT_*`` style constants) are stored per handle and are
+not part of the call sequence.
+
+Example:
+    >>> from pybmd import Resolve
+    >>> from pybmd.replay import RecordingBMDModule, ReplayBMDModule
+    >>> with RecordingBMDModule("session.jsonl.gz") as recorder:
+    ...     resolve = Resolve(bmd_module=recorder)
+    ...     resolve.get_project_manager().get_current_project().get_name()
+    >>> resolve = Resolve(bmd_module=ReplayBMDModule("session.jsonl.gz", speed=10))
+
+    ``PYBMD_RECORD=<file>`` records and ``PYBMD_REPLAY=<file>`` replays a plain
+    ``Resolve()`` session.
+"""
+
+import atexit
+import gzip
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from pybmd._proxy import ObjectProxy, unwrap
+from pybmd.error import ReplayMismatchError
+
+FORMAT_VERSION = 1
+
+_PRIMITIVES = (type(None), bool, int, float, str)
+
+
+def _open(file_path: str, mode: str):
+    if str(file_path).endswith(".gz"):
+        return gzip.open(file_path, mode + "t", encoding="utf-8")
+    return open(file_path, mode, encoding="utf-8")
+
+
+class _Recorder(object):
+    """Assigns handles to scripting objects and writes call events."""
+
+    def __init__(self, file_path: str):
+        self._file = _open(file_path, "w")
+        self._lock = threading.Lock()
+        self._handles: Dict[int, int] = {}
+        # keeps recorded objects alive so their ids are never reused
+        self._objects: List[Any] = []
+        self._seq = 0
+        self._write({"type": "header", "version": FORMAT_VERSION})
+
+    def _write(self, event: dict):
+        self._file.write(json.dumps(event, separators=(",", ":")) + "\n")
+
+    def handle_of(self, raw) -> int:
+        handle = self._handles.get(id(raw))
+        if handle is None:
+            handle = self._handles[id(raw)] = len(self._objects)
+            self._objects.append(raw)
+        return handle
+
+    def encode(self, value):
+        value = unwrap(value)
+        if isinstance(value, _PRIMITIVES):
+            return value
+        if isinstance(value, (list, tuple)):
+            return [self.encode(item) for item in value]
+        if isinstance(value, dict):
+            if all(isinstance(key, str) for key in value):
+                return {key: self.encode(item) for key, item in value.items()}
+            return {
+                "$dict": [[self.encode(k), self.encode(v)] for k, v in value.items()]
+            }
+        return {"$obj": self.handle_of(value)}
+
+    def wrap(self, value):
+        """Replaces scripting objects in a returned value by recording proxies."""
+        if isinstance(value, _PRIMITIVES):
+            return value
+        if isinstance(value, list):
+            return [self.wrap(item) for item in value]
+        if isinstance(value, tuple):
+            return tuple(self.wrap(item) for item in value)
+        if isinstance(value, dict):
+            return {key: self.wrap(item) for key, item in value.items()}
+        return RecordingObject(value, self)
+
+    def record_attr(self, raw, name: str, value):
+        with self._lock:
+            self._write(
+                {
+                    "type": "attr",
+                    "handle": self.handle_of(raw),
+                    "name": name,
+                    "value": self.encode(value),
+                }
+            )
+
+    def record_call(self, raw, name, args, kwargs, result, elapsed):
+        with self._lock:
+            self._write(
+                {
+                    "type": "call",
+                    "seq": self._seq,
+                    "handle": self.handle_of(raw),
+                    "method": name,
+                    "args": self.encode(args),
+                    "kwargs": self.encode(kwargs),
+                    "result": self.encode(result),
+                    "elapsed": round(elapsed, 7),
+                }
+            )
+            self._seq += 1
+
+    def record_scriptapp(self, app_name, ip, raw):
+        with self._lock:
+            self._write(
+                {
+                    "type": "scriptapp",
+                    "app": app_name,
+                    "ip": ip,
+                    "result": self.encode(raw),
+                }
+            )
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class RecordingObject(ObjectProxy):
+    """Proxy recording every call made on a scripting object."""
+
+    __slots__ = ("_recorder",)
+
+    def __init__(self, target, recorder: _Recorder):
+        super().__init__(target)
+        object.__setattr__(self, "_recorder", recorder)
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            self._recorder.record_attr(self._target, name, attr)
+            return attr
+
+        def method(*args, **kwargs):
+            return self._call(name, attr, args, kwargs)
+
+        return method
+
+    def _call(self, name: str, method, args: tuple, kwargs: dict):
+        args, kwargs = unwrap(args), unwrap(kwargs)
+        start = time.perf_counter()
+        result = method(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        self._recorder.record_call(self._target, name, args, kwargs, result, elapsed)
+        return self._recorder.wrap(result)
+
+
+class RecordingBMDModule(object):
+    """Scripting module recording a session to file_path.
+
+    Args:
+        file_path (str): recording file, gzip compressed for a ``.gz`` suffix
+        bmd_module (BMDModule, optional): module to record. Defaults to None (load fusionscript).
+    """
+
+    def __init__(self, file_path: str, bmd_module=None):
+        if bmd_module is None:
+            from pybmd._init_bmd import _load_fusionscript_module
+
+            bmd_module = _load_fusionscript_module()
+        self._bmd_module = bmd_module
+        self._recorder = _Recorder(file_path)
+        atexit.register(self.close)
+
+    def scriptapp(self, app_name: str, ip: str = "127.0.0.1"):
+        raw = self._bmd_module.scriptapp(app_name, ip)
+        self._recorder.record_scriptapp(app_name, ip, raw)
+        return None if raw is None else RecordingObject(raw, self._recorder)
+
+    def close(self):
+        """Flushes and closes the recording file."""
+        self._recorder.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ReplayObject(object):
+    """Stand-in for a recorded scripting object."""
+
+    __slots__ = ("_player", "_handle")
+
+    def __init__(self, player: "ReplayBMDModule", handle: int):
+        object.__setattr__(self, "_player", player)
+        object.__setattr__(self, "_handle", handle)
+
+    def __getattr__(self, name: str):
+        attrs = self._player._attrs.get(self._handle, {})
+        if name in attrs:
+            return attrs[name]
+
+        def method(*args, **kwargs):
+            return self._player._replay_call(self._handle, name, args, kwargs)
+
+        method.__name__ = name
+        return method
+
+    def __repr__(self) -> str:
+        return f"<ReplayObject #{self._handle}>"
+
+
+class ReplayBMDModule(object):
+    """Scripting module answering calls from a recorded session.
+
+    Calls must arrive in the recorded order, a diverging call raises
+    ReplayMismatchError. Side effects of Resolve outside the scripting API
+    (exported stills, rendered files) are not reproduced, register callables
+    in `side_effects` to emulate them.
+
+    Args:
+        file_path (str): recording written by RecordingBMDModule
+        speed (float, optional): replay speed factor for the recorded call durations, 0 replays without delay. Defaults to 1.0.
+        latency (float, optional): seconds added to every replayed call. Defaults to 0.0.
+        check_args (bool, optional): also compare call arguments with the recording. Defaults to True.
+        side_effects (Dict[str, Callable], optional): API name to callable invoked with the call arguments after a replayed call of that API. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        speed: float = 1.0,
+        latency: float = 0.0,
+        check_args: bool = True,
+        side_effects: Optional[Dict[str, Callable]] = None,
+    ):
+        self.speed = speed
+        self.latency = latency
+        self.check_args = check_args
+        self.side_effects = dict(side_effects or {})
+        self._lock = threading.Lock()
+        self._objects: Dict[int, ReplayObject] = {}
+        self._attrs: Dict[int, Dict[str, Any]] = {}
+        self._calls: List[dict] = []
+        self._scriptapps: Dict[tuple, Any] = {}
+        self._position = 0
+        with _open(file_path, "r") as file:
+            for line in file:
+                event = json.loads(line)
+                event_type = event["type"]
+                if event_type == "call":
+                    self._calls.append(event)
+                elif event_type == "attr":
+                    self._attrs.setdefault(event["handle"], {})[event["name"]] = (
+                        self._decode(event["value"])
+                    )
+                elif event_type == "scriptapp":
+                    self._scriptapps[(event["app"], event["ip"])] = event["result"]
+                elif event_type == "header" and event["version"] != FORMAT_VERSION:
+                    raise ValueError(
+                        f"Unsupported recording format version {event['version']}"
+                    )
+
+    @property
+    def remaining(self) -> int:
+        """Number of recorded calls not replayed yet."""
+        return len(self._calls) - self._position
+
+    def _object(self, handle: int) -> ReplayObject:
+        replay_object = self._objects.get(handle)
+        if replay_object is None:
+            replay_object = self._objects[handle] = ReplayObject(self, handle)
+        return replay_object
+
+    def _decode(self, value):
+        if isinstance(value, list):
+            return [self._decode(item) for item in value]
+        if isinstance(value, dict):
+            if "$obj" in value:
+                return self._object(value["$obj"])
+            if "$dict" in value:
+                return {self._decode(k): self._decode(v) for k, v in value["$dict"]}
+            return {key: self._decode(item) for key, item in value.items()}
+        return value
+
+    def _encode(self, value):
+        if isinstance(value, ReplayObject):
+            return {"$obj": value._handle}
+        if isinstance(value, (list, tuple)):
+            return [self._encode(item) for item in value]
+        if isinstance(value, dict):
+            if all(isinstance(key, str) for key in value):
+                return {key: self._encode(item) for key, item in value.items()}
+            return {"$dict": [[self._encode(k), self._encode(v)] for k, v in value.items()]}
+        return value
+
+    def _replay_call(self, handle: int, name: str, args: tuple, kwargs: dict):
+        args, kwargs = unwrap(args), unwrap(kwargs)
+        with self._lock:
+            seq = self._position
+            actual = f"#{handle}.{name}"
+            if seq >= len(self._calls):
+                raise ReplayMismatchError(seq, "end of recording", actual)
+            event = self._calls[seq]
+            expected = f"#{event['handle']}.{event['method']}"
+            if expected != actual:
+                raise ReplayMismatchError(seq, expected, actual)
+            if self.check_args and (
+                event["args"] != self._encode(args)
+                or event["kwargs"] != self._encode(kwargs)
+            ):
+                raise ReplayMismatchError(
+                    seq,
+                    f"{expected}(*{event['args']}, **{event['kwargs']})",
+                    f"{actual}(*{self._encode(args)}, **{self._encode(kwargs)})",
+                )
+            self._position += 1
+        delay = self.latency
+        if self.speed:
+            delay += event["elapsed"] / self.speed
+        if delay > 0:
+            time.sleep(delay)
+        if name in self.side_effects:
+            self.side_effects[name](*args, **kwargs)
+        return self._decode(event["result"])
+
+    def scriptapp(self, app_name: str, ip: str = "127.0.0.1"):
+        result = self._scriptapps.get((app_name, ip))
+        return None if result is None else self._decode(result)
+
+    def rewind(self):
+        """Restarts the replay from the first recorded call."""
+        with self._lock:
+            self._position = 0
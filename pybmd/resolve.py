@@ -1,9 +1,13 @@
 import subprocess
 import platform
-from typing import TYPE_CHECKING, List, Tuple
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, List, Tuple
 import psutil
 
+from pybmd import instrumentation
+from pybmd._context import ResolveContext, set_default_context
 from pybmd.error import ResolveInitError
+from pybmd.executor import ConnectionExecutor, marshal
 from pybmd.media_storage import MediaStorage
 from pybmd.project_manager import ProjectManager
 from pybmd.fusion import Fusion
@@ -12,6 +16,7 @@ from pybmd.version_registry import VersionRegistry
 from pybmd.decorators import minimum_resolve_version
 
 if TYPE_CHECKING:
+    from pybmd._resolve_types import BMDModule
     from pybmd.settings import KeyframeMode
 
 from . import _init_bmd
@@ -57,32 +62,46 @@ class Resolve:
     Base for everything
     """
 
-    def _initialize_resolve(self, resolve_ip: str):
+    def _initialize_resolve(self, resolve_ip: str, bmd_module=None):
         """Initialize the Resolve connection.
 
         Args:
             resolve_ip: IP address of the DaVinci Resolve instance
+            bmd_module: Scripting module to use instead of loading fusionscript
 
         Returns:
-            Resolve object
+            Tuple of the scripting module and the Resolve object
 
         Raises:
             ResolveInitError: If initialization fails
         """
-        _init_bmd._bmd_module_object = _init_bmd._init_bmd_module()
-        resolve_obj = _init_bmd._init_resolve(davinci_ip=resolve_ip)
+        if bmd_module is None:
+            bmd_module = _init_bmd._init_bmd_module()
+        resolve_obj = bmd_module.scriptapp("Resolve", resolve_ip)
 
         if resolve_obj is None:
             raise ResolveInitError
 
-        return resolve_obj
+        return bmd_module, resolve_obj
 
-    def __init__(self, resolve_ip: str = "127.0.0.1", auto_start: bool = False):
+    def __init__(
+        self,
+        resolve_ip: str = "127.0.0.1",
+        auto_start: bool = False,
+        bmd_module: "BMDModule | None" = None,
+        executor: "bool | ConnectionExecutor" = False,
+    ):
         """Init Davinci Resolve Object
 
+        Every Resolve instance keeps its own connection and version context,
+        so several instances may drive different Resolve machines (and
+        versions) from one process.
+
         Args:
             resolve_ip (str, optional): davinci resolve ip. Defaults to 127.0.0.1.
             auto_start (bool, optional): open davinci automatically if it's not running, if you want to open davinci manually, change arg to false. Defaults to True.
+            bmd_module (BMDModule, optional): scripting module providing scriptapp(), e.g. pybmd.simulator.SimulatedBMDModule. Defaults to None (load fusionscript).
+            executor (bool | ConnectionExecutor, optional): open the connection on a dedicated owner thread which runs every scripting call, see pybmd.executor. True starts a new ConnectionExecutor. Defaults to False.
 
         Raises:
             ResolveInitError: davinci resolve init failed.you need to check if davinci resolve is running.
@@ -91,15 +110,66 @@ class Resolve:
         if auto_start:
             _start_local_resolve()
 
-        self._resolve = self._initialize_resolve(resolve_ip)
+        if executor is True:
+            executor = ConnectionExecutor()
+        self._executor: "ConnectionExecutor | None" = executor or None
+        if self._executor is None:
+            bmd_module, self._resolve = self._initialize_resolve(resolve_ip, bmd_module)
+        else:
+            bmd_module, resolve_obj = self._executor.call(
+                self._initialize_resolve, resolve_ip, bmd_module
+            )
+            self._resolve = marshal(resolve_obj, self._executor)
         self._version = self._resolve.GetVersion()
 
-        # Populate the global _resolve_object so other modules can access constants
+        # Connection state handed down to every wrapper produced from this instance
+        self._context = ResolveContext(
+            bmd_module, self._resolve, self._version, self._executor
+        )
+
+        # Module level state mirrors the most recently created Resolve, for
+        # wrappers created without a context and for the constant enums
+        _init_bmd._bmd_module_object = bmd_module
         _init_bmd._resolve_object = self._resolve
+        set_default_context(self._context)
+        if instrumentation._enabled:
+            self._resolve = instrumentation.instrument(self._resolve, "Resolve")
 
         global RESOLVE_VERSION
         RESOLVE_VERSION = self._version
 
+        # Evaluate every registered API constraint once for the default version
+        VersionRegistry.resolve_version(Version.from_list(self._version))
+
+    @property
+    def executor(self) -> "ConnectionExecutor | None":
+        """Owner thread of this connection, None unless created with executor enabled."""
+        return self._executor
+
+    def submit(
+        self, fn: Callable, /, *args, coalesce: bool = False, **kwargs
+    ) -> Future:
+        """Runs fn(*args, **kwargs), typically a wrapper method, on the connection thread.
+
+        Without an executor fn runs right away and the returned future is
+        already done, so code written for the executor also runs without one.
+
+        Args:
+            fn (Callable): wrapper method or any callable using this connection
+            coalesce (bool, optional): share the result of an identical call still waiting in the queue. Defaults to False.
+
+        Returns:
+            Future: result of the call
+        """
+        if self._executor is not None:
+            return self._executor.submit(fn, *args, coalesce=coalesce, **kwargs)
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
     def delete_layout_preset(self, preset_name: str) -> bool:
         """Deletes preset named preset_name.
 
@@ -126,7 +196,7 @@ class Resolve:
     @property
     def fusion(self) -> Fusion:
         """Returns the Fusion object."""
-        return Fusion(self._resolve.Fusion())
+        return Fusion(self._resolve.Fusion(), self._context)
 
     def get_current_page(self) -> str:
         """Returns the page currently displayed in the main window
@@ -142,7 +212,7 @@ class Resolve:
         Returns:
             MediaStorage:
         """
-        return MediaStorage(self._resolve.GetMediaStorage())
+        return MediaStorage(self._resolve.GetMediaStorage(), self._context)
 
     def get_product_name(self) -> str:
         """Returns product name.
@@ -158,7 +228,7 @@ class Resolve:
         Returns:
             ProjectManager:
         """
-        return ProjectManager(self._resolve.GetProjectManager())
+        return ProjectManager(self._resolve.GetProjectManager(), self._context)
 
     def get_version(self) -> list:
         """Returns list of product version fields in [major, minor, patch, build, suffix] format.
@@ -8,9 +8,8 @@ from pydantic import (
     model_serializer,
     SerializerFunctionWrapHandler,
 )
-from pybmd._init_bmd import _resolve_object as _resolve
-if not _resolve:
-    raise ImportError("DaVinci Resolve object is not initialized.")
+from pybmd._resolve_constants import ResolveConstantEnum
+
 
 class RenderSetting(BaseModel):
     """RenderSetting Object to store render setting."""
@@ -131,20 +130,20 @@ class BaseIndexSetting(BaseModel):
         }
 
 
-class CloudSyncMode(Enum):
-    NONE = _resolve.CLOUD_SYNC_NONE
-    PROXY_ONLY = _resolve.CLOUD_SYNC_PROXY_ONLY
-    PROXY_AND_ORIG = _resolve.CLOUD_SYNC_PROXY_AND_ORIG
+class CloudSyncMode(ResolveConstantEnum):
+    NONE = "CLOUD_SYNC_NONE"
+    PROXY_ONLY = "CLOUD_SYNC_PROXY_ONLY"
+    PROXY_AND_ORIG = "CLOUD_SYNC_PROXY_AND_ORIG"
 
 
-class CloudProjectSettingIndex(Enum):
+class CloudProjectSettingIndex(ResolveConstantEnum):
     """Docstring for CloudProjectSettingEnum."""
 
-    PROJECT_NAME = _resolve.CLOUD_SETTING_PROJECT_NAME
-    PROJECT_MEDIA_PATH = _resolve.CLOUD_SETTING_PROJECT_MEDIA_PATH
-    IS_COLLAB = _resolve.CLOUD_SETTING_IS_COLLAB
-    SYNC_MODE = _resolve.CLOUD_SETTING_SYNC_MODE
-    IS_CAMERA_ACCESS = _resolve.CLOUD_SETTING_IS_CAMERA_ACCESS
+    PROJECT_NAME = "CLOUD_SETTING_PROJECT_NAME"
+    PROJECT_MEDIA_PATH = "CLOUD_SETTING_PROJECT_MEDIA_PATH"
+    IS_COLLAB = "CLOUD_SETTING_IS_COLLAB"
+    SYNC_MODE = "CLOUD_SETTING_SYNC_MODE"
+    IS_CAMERA_ACCESS = "CLOUD_SETTING_IS_CAMERA_ACCESS"
 
 
 class CloudProjectsSetting(BaseIndexSetting):
@@ -165,48 +164,48 @@ class CloudProjectsSetting(BaseIndexSetting):
     }
 
 
-class LanguageID(Enum):
+class LanguageID(ResolveConstantEnum):
     """Docstring for LanguageID."""
 
-    AUTO = _resolve.AUTO_CAPTION_AUTO
-    DANISH = _resolve.AUTO_CAPTION_DANISH
-    DUTCH = _resolve.AUTO_CAPTION_DUTCH
-    ENGLISH = _resolve.AUTO_CAPTION_ENGLISH
-    FRENCH = _resolve.AUTO_CAPTION_FRENCH
-    GERMAN = _resolve.AUTO_CAPTION_GERMAN
-    ITALIAN = _resolve.AUTO_CAPTION_ITALIAN
-    JAPANESE = _resolve.AUTO_CAPTION_JAPANESE
-    KOREAN = _resolve.AUTO_CAPTION_KOREAN
-    MANDARIN_SIMPLIFIED = _resolve.AUTO_CAPTION_MANDARIN_SIMPLIFIED
-    MANDARIN_TRADITIONAL = _resolve.AUTO_CAPTION_MANDARIN_TRADITIONAL
-    NORWEGIAN = _resolve.AUTO_CAPTION_NORWEGIAN
-    PORTUGUESE = _resolve.AUTO_CAPTION_PORTUGUESE
-    RUSSIAN = _resolve.AUTO_CAPTION_RUSSIAN
-    SPANISH = _resolve.AUTO_CAPTION_SPANISH
-    SWEDISH = _resolve.AUTO_CAPTION_SWEDISH
+    AUTO = "AUTO_CAPTION_AUTO"
+    DANISH = "AUTO_CAPTION_DANISH"
+    DUTCH = "AUTO_CAPTION_DUTCH"
+    ENGLISH = "AUTO_CAPTION_ENGLISH"
+    FRENCH = "AUTO_CAPTION_FRENCH"
+    GERMAN = "AUTO_CAPTION_GERMAN"
+    ITALIAN = "AUTO_CAPTION_ITALIAN"
+    JAPANESE = "AUTO_CAPTION_JAPANESE"
+    KOREAN = "AUTO_CAPTION_KOREAN"
+    MANDARIN_SIMPLIFIED = "AUTO_CAPTION_MANDARIN_SIMPLIFIED"
+    MANDARIN_TRADITIONAL = "AUTO_CAPTION_MANDARIN_TRADITIONAL"
+    NORWEGIAN = "AUTO_CAPTION_NORWEGIAN"
+    PORTUGUESE = "AUTO_CAPTION_PORTUGUESE"
+    RUSSIAN = "AUTO_CAPTION_RUSSIAN"
+    SPANISH = "AUTO_CAPTION_SPANISH"
+    SWEDISH = "AUTO_CAPTION_SWEDISH"
 
 
 #######################################
 # AUTO CAPTION SETTINGS
 
 
-class PresetType(Enum):
-    SUBTITLE_DEFAULT = _resolve.AUTO_CAPTION_SUBTITLE_DEFAULT
-    TELETEXT = _resolve.AUTO_CAPTION_TELETEXT
-    NETFLIX = _resolve.AUTO_CAPTION_NETFLIX
+class PresetType(ResolveConstantEnum):
+    SUBTITLE_DEFAULT = "AUTO_CAPTION_SUBTITLE_DEFAULT"
+    TELETEXT = "AUTO_CAPTION_TELETEXT"
+    NETFLIX = "AUTO_CAPTION_NETFLIX"
 
 
-class LineBreakTypes(Enum):
-    LINE_SINGLE = _resolve.AUTO_CAPTION_LINE_SINGLE
-    LINE_DOUBLE = _resolve.AUPTO_CAPTION_LINE_DOUBLE
+class LineBreakTypes(ResolveConstantEnum):
+    LINE_SINGLE = "AUTO_CAPTION_LINE_SINGLE"
+    LINE_DOUBLE = "AUTO_CAPTION_LINE_DOUBLE"
 
 
-class AutoCaptionSettingsIndex(Enum):
-    LANGUAGE = _resolve.SUBTITLE_LANGUAGE
-    CAPTION_PRESET = _resolve.SUBTITLE_CAPTION_PRESET
-    CHARS_PER_LINE = _resolve.SUBTITLE_CHARS_PER_LINE
-    LINE_BREAK = _resolve.SUBTITLE_LINE_BREAK
-    GAP = _resolve.SUBTITLE_GAP
+class AutoCaptionSettingsIndex(ResolveConstantEnum):
+    LANGUAGE = "SUBTITLE_LANGUAGE"
+    CAPTION_PRESET = "SUBTITLE_CAPTION_PRESET"
+    CHARS_PER_LINE = "SUBTITLE_CHARS_PER_LINE"
+    LINE_BREAK = "SUBTITLE_LINE_BREAK"
+    GAP = "SUBTITLE_GAP"
 
 
 class AutoCaptionSettings(BaseIndexSetting):
@@ -260,9 +259,9 @@ class CloudSyncState(Enum):
 # Audio Sync Settings
 
 
-class AudioSyncMode(Enum):
-    AUDIO_SYNC_WAVEFORM = _resolve.AUDIO_SYNC_WAVEFORM
-    AUDIO_SYNC_TIMECODE = _resolve.AUDIO_SYNC_TIMECODE
+class AudioSyncMode(ResolveConstantEnum):
+    AUDIO_SYNC_WAVEFORM = "AUDIO_SYNC_WAVEFORM"
+    AUDIO_SYNC_TIMECODE = "AUDIO_SYNC_TIMECODE"
 
 
 class AudioSyncChannel(Enum):
@@ -270,11 +269,11 @@ class AudioSyncChannel(Enum):
     AUDIO_SYNC_CHANNEL_MIX = -2
 
 
-class AudioSyncSettingIndex(Enum):
-    AUDIO_SYNC_MODE = _resolve.AUDIO_SYNC_MODE
-    AUDIO_SYNC_CHANNEL_NUMBER = _resolve.AUDIO_SYNC_CHANNEL_NUMBER
-    AUDIO_SYNC_RETAIN_EMBEDDED_AUDIO = _resolve.AUDIO_SYNC_RETAIN_EMBEDDED_AUDIO
-    AUDIO_SYNC_RETAIN_VIDEO_METADATA = _resolve.AUDIO_SYNC_RETAIN_VIDEO_METADATA
+class AudioSyncSettingIndex(ResolveConstantEnum):
+    AUDIO_SYNC_MODE = "AUDIO_SYNC_MODE"
+    AUDIO_SYNC_CHANNEL_NUMBER = "AUDIO_SYNC_CHANNEL_NUMBER"
+    AUDIO_SYNC_RETAIN_EMBEDDED_AUDIO = "AUDIO_SYNC_RETAIN_EMBEDDED_AUDIO"
+    AUDIO_SYNC_RETAIN_VIDEO_METADATA = "AUDIO_SYNC_RETAIN_VIDEO_METADATA"
 
 
 class AudioSyncSetting(BaseIndexSetting):
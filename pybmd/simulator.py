@@ -0,0 +1,1695 @@
+"""In-process simulated DaVinci Resolve scripting backend.
+
+The simulator implements the subset of the fusionscript object model that
+pybmd wraps (projects, media pool folders and clips, timelines, tracks,
+timeline items, markers, gallery albums and render jobs) entirely in memory.
+It plugs in where `_init_bmd._load_dynamic` would load fusionscript, so pybmd
+hot paths can be benchmarked and regression-tested on machines without
+DaVinci Resolve.
+
+Every scripting call counts as one round-trip and can be slowed down with a
+configurable latency, globally or per API name.
+
+Example:
+    >>> from pybmd import Resolve
+    >>> from pybmd.simulator import SimulatedBMDModule, SimulatorConfig
+    >>> bmd = SimulatedBMDModule(SimulatorConfig(latency=0.001))
+    >>> resolve = Resolve(bmd_module=bmd)
+    >>> project = resolve.get_project_manager().get_current_project()
+    >>> project.get_name()
+    'Untitled Project'
+
+    Setting the environment variable ``PYBMD_SIMULATOR=1`` makes a plain
+    ``Resolve()`` connect to a process-wide simulator instead.
+"""
+
+import functools
+import itertools
+import os
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from pybmd._resolve_types import ResolveObject
+
+SIMULATED_VERSION = [20, 2, 0, 0, ""]
+
+TRACK_TYPES = ("video", "audio", "subtitle")
+
+DEFAULT_PROJECT_SETTINGS = {
+    "timelineFrameRate": "24",
+    "timelinePlaybackFrameRate": "24",
+    "timelineResolutionWidth": "1920",
+    "timelineResolutionHeight": "1080",
+    "timelineDropFrameTimecode": "0",
+    "useCustomSettings": "0",
+}
+
+
+@dataclass
+class SimulatorConfig:
+    """Configuration of a simulated Resolve backend.
+
+    Attributes:
+        version: Value returned by GetVersion() in [major, minor, patch, build, suffix] format
+        latency: Seconds every scripting call takes
+        call_latency: Per API name latency overriding `latency` (e.g. {"GrabStill": 0.05})
+        default_clip_frames: Frame count of imported clips without explicit length
+        render_seconds: Seconds a started render job takes to complete
+        still_commit_seconds: Seconds before a grabbed still shows up in its album (GetStills, GetLabel, ExportStills)
+    """
+
+    version: List = field(default_factory=lambda: list(SIMULATED_VERSION))
+    latency: float = 0.0
+    call_latency: Dict[str, float] = field(default_factory=dict)
+    default_clip_frames: int = 240
+    render_seconds: float = 0.0
+    still_commit_seconds: float = 0.0
+
+
+def _fps_base(fps) -> int:
+    return max(1, int(round(float(fps))))
+
+
+def _timecode_to_frame(timecode: str, fps) -> int:
+    """Converts a non drop frame HH:MM:SS:FF timecode to a frame count."""
+    base = _fps_base(fps)
+    hours, minutes, seconds, frames = (
+        int(part) for part in timecode.replace(";", ":").split(":")
+    )
+    return ((hours * 60 + minutes) * 60 + seconds) * base + frames
+
+
+def _frame_to_timecode(frame: int, fps) -> str:
+    """Converts a frame count to a non drop frame HH:MM:SS:FF timecode."""
+    base = _fps_base(fps)
+    frame = int(frame)
+    frames = frame % base
+    total_seconds = frame // base
+    return (
+        f"{total_seconds // 3600:02d}:{total_seconds // 60 % 60:02d}:"
+        f"{total_seconds % 60:02d}:{frames:02d}"
+    )
+
+
+class _Simulation(object):
+    """State shared by all objects of one simulated Resolve instance."""
+
+    def __init__(self, config: SimulatorConfig):
+        self.config = config
+        self.calls: Counter = Counter()
+        self.paused = False
+        self._ids = itertools.count(1)
+
+    def new_id(self) -> str:
+        return str(uuid.UUID(int=next(self._ids))).upper()
+
+    def round_trip(self, api_name: str):
+        if self.paused:
+            return
+        self.calls[api_name] += 1
+        delay = self.config.call_latency.get(api_name, self.config.latency)
+        if delay:
+            time.sleep(delay)
+
+
+def _api_call(api_name: str, func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        self._sim.round_trip(api_name)
+        return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+class SimulatedObject(object):
+    """Base class of simulated scripting objects.
+
+    Every method whose name starts with an upper case letter is a scripting
+    API and is routed through the simulation's round-trip accounting.
+    """
+
+    def __init__(self, sim: _Simulation):
+        self._sim = sim
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, attr in list(vars(cls).items()):
+            if name[:1].isupper() and callable(attr):
+                setattr(cls, name, _api_call(name, attr))
+
+
+class _SimulatedMarkerHolder(SimulatedObject):
+    """Marker APIs shared by timelines, timeline items and media pool items."""
+
+    def __init__(self, sim: _Simulation):
+        super().__init__(sim)
+        self.markers: Dict[float, Dict[str, Any]] = {}
+
+    def AddMarker(self, frame_id, color, name, note, duration, custom_data=""):
+        frame = float(frame_id)
+        if frame in self.markers:
+            return False
+        self.markers[frame] = {
+            "color": color,
+            "duration": float(duration),
+            "note": note,
+            "name": name,
+            "customData": custom_data,
+        }
+        return True
+
+    def GetMarkers(self):
+        return {frame: dict(info) for frame, info in sorted(self.markers.items())}
+
+    def GetMarkerByCustomData(self, custom_data):
+        for frame, info in sorted(self.markers.items()):
+            if info["customData"] == custom_data:
+                return {frame: dict(info)}
+        return {}
+
+    def GetMarkerCustomData(self, frame_id):
+        info = self.markers.get(float(frame_id))
+        return info["customData"] if info else ""
+
+    def UpdateMarkerCustomData(self, frame_id, custom_data):
+        info = self.markers.get(float(frame_id))
+        if info is None:
+            return False
+        info["customData"] = custom_data
+        return True
+
+    def DeleteMarkerAtFrame(self, frame_num):
+        return self.markers.pop(float(frame_num), None) is not None
+
+    def DeleteMarkersByColor(self, color):
+        doomed = [
+            frame
+            for frame, info in self.markers.items()
+            if color == "All" or info["color"] == color
+        ]
+        for frame in doomed:
+            del self.markers[frame]
+        return bool(doomed)
+
+    # pybmd historically calls the singular spelling
+    def DeleteMarkerByColor(self, color):
+        return self.DeleteMarkersByColor(color)
+
+    def DeleteMarkerByCustomData(self, custom_data):
+        for frame, info in sorted(self.markers.items()):
+            if info["customData"] == custom_data:
+                del self.markers[frame]
+                return True
+        return False
+
+
+class SimulatedMediaPoolItem(_SimulatedMarkerHolder):
+    """Simulated MediaPoolItem."""
+
+    def __init__(self, sim: _Simulation, file_path: str, overrides: Dict[str, Any]):
+        super().__init__(sim)
+        self.unique_id = sim.new_id()
+        self.media_id = sim.new_id()
+        self.folder: Optional["SimulatedFolder"] = None
+        path = Path(file_path)
+        frames = int(overrides.pop("Frames", sim.config.default_clip_frames))
+        fps = str(overrides.pop("FPS", "24"))
+        start_tc = overrides.pop("Start TC", "00:00:00:00")
+        start = _timecode_to_frame(start_tc, fps)
+        self.properties: Dict[str, Any] = {
+            "Clip Name": path.name,
+            "File Name": path.name,
+            "File Path": str(file_path),
+            "Type": "Video",
+            "Format": path.suffix.lstrip(".").upper(),
+            "FPS": fps,
+            "Frames": str(frames),
+            "Start": "0",
+            "End": str(frames - 1),
+            "Duration": _frame_to_timecode(frames, fps),
+            "Start TC": start_tc,
+            "End TC": _frame_to_timecode(start + frames, fps),
+            "Drop frame": "0",
+            "Reel Name": path.stem,
+            "Resolution": "1920x1080",
+            "Clip Color": "",
+            "Proxy": "None",
+            "Proxy Media Path": "",
+        }
+        self.properties.update({key: str(value) for key, value in overrides.items()})
+        self.metadata: Dict[str, str] = {}
+        self.third_party_metadata: Dict[str, str] = {}
+        self.flags: List[str] = []
+        self.mark_in_out: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def frames(self) -> int:
+        return int(self.properties["Frames"])
+
+    def _touch(self):
+        if self.folder is not None:
+            self.folder.stale = True
+
+    def GetName(self):
+        return self.properties["Clip Name"]
+
+    def SetName(self, name):
+        self.properties["Clip Name"] = name
+        self._touch()
+        return True
+
+    def GetMediaId(self):
+        return self.media_id
+
+    def GetUniqueId(self):
+        return self.unique_id
+
+    def GetClipProperty(self, property_name=None):
+        if not property_name:
+            return dict(self.properties)
+        return self.properties.get(property_name, "")
+
+    def SetClipProperty(self, property_name, property_value):
+        self.properties[property_name] = str(property_value)
+        self._touch()
+        return True
+
+    def GetMetadata(self, metadata_type=None):
+        if not metadata_type:
+            return dict(self.metadata)
+        return self.metadata.get(metadata_type, "")
+
+    def SetMetadata(self, metadata_type, metadata_value=None):
+        if isinstance(metadata_type, dict):
+            self.metadata.update({k: str(v) for k, v in metadata_type.items()})
+        else:
+            self.metadata[metadata_type] = str(metadata_value)
+        self._touch()
+        return True
+
+    def GetThirdPartyMetadata(self, metadata_type=None):
+        if not metadata_type:
+            return dict(self.third_party_metadata)
+        return self.third_party_metadata.get(metadata_type, "")
+
+    def SetThirdPartyMetadata(self, metadata_type, metadata_value=None):
+        if isinstance(metadata_type, dict):
+            self.third_party_metadata.update(
+                {k: str(v) for k, v in metadata_type.items()}
+            )
+        else:
+            self.third_party_metadata[metadata_type] = str(metadata_value)
+        return True
+
+    def AddFlag(self, color):
+        if color not in self.flags:
+            self.flags.append(color)
+        return True
+
+    def GetFlagList(self):
+        return list(self.flags)
+
+    def ClearFlagColor(self, color):
+        self.flags = [] if color == "All" else [f for f in self.flags if f != color]
+        return True
+
+    def GetClipColor(self):
+        return self.properties["Clip Color"]
+
+    def SetClipColor(self, color_name):
+        self.properties["Clip Color"] = color_name
+        return True
+
+    def ClearClipColor(self):
+        self.properties["Clip Color"] = ""
+        return True
+
+    def LinkProxyMedia(self, proxy_media_file_path):
+        self.properties["Proxy"] = "1920x1080"
+        self.properties["Proxy Media Path"] = str(proxy_media_file_path)
+        return True
+
+    def UnlinkProxyMedia(self):
+        self.properties["Proxy"] = "None"
+        self.properties["Proxy Media Path"] = ""
+        return True
+
+    def ReplaceClip(self, file_path):
+        path = Path(file_path)
+        self.properties.update(
+            {"File Path": str(file_path), "File Name": path.name, "Reel Name": path.stem}
+        )
+        self._touch()
+        return True
+
+    def GetMarkInOut(self):
+        return {key: dict(value) for key, value in self.mark_in_out.items()}
+
+    def SetMarkInOut(self, mark_in, mark_out, mark_type="all"):
+        for key in ("video", "audio") if mark_type == "all" else (mark_type,):
+            self.mark_in_out[key] = {"in": int(mark_in), "out": int(mark_out)}
+        return True
+
+    def ClearMarkInOut(self, mark_type="all"):
+        for key in ("video", "audio") if mark_type == "all" else (mark_type,):
+            self.mark_in_out.pop(key, None)
+        return True
+
+    def GetAudioMapping(self):
+        return "{}"
+
+    def TranscribeAudio(self):
+        return True
+
+    def ClearTranscription(self):
+        return True
+
+
+class SimulatedFolder(SimulatedObject):
+    """Simulated media pool Folder."""
+
+    def __init__(self, sim: _Simulation, name: str, parent=None):
+        super().__init__(sim)
+        self.name = name
+        self.parent: Optional[SimulatedFolder] = parent
+        self.unique_id = sim.new_id()
+        self.clips: List[SimulatedMediaPoolItem] = []
+        self.subfolders: List[SimulatedFolder] = []
+        self.stale = False
+
+    def add_clip(self, clip: SimulatedMediaPoolItem):
+        clip.folder = self
+        self.clips.append(clip)
+        self.stale = True
+
+    def remove_clip(self, clip: SimulatedMediaPoolItem):
+        self.clips.remove(clip)
+        clip.folder = None
+        self.stale = True
+
+    def walk(self) -> Iterator["SimulatedFolder"]:
+        yield self
+        for subfolder in self.subfolders:
+            yield from subfolder.walk()
+
+    def GetClipList(self):
+        return list(self.clips)
+
+    def GetName(self):
+        return self.name
+
+    def GetSubFolderList(self):
+        return list(self.subfolders)
+
+    def GetIsFolderStale(self):
+        return self.stale
+
+    def GetUniqueId(self):
+        return self.unique_id
+
+    def Export(self, file_path):
+        return True
+
+    def TranscribeAudio(self):
+        return True
+
+    def ClearTranscription(self):
+        return True
+
+
+class SimulatedTimelineItem(_SimulatedMarkerHolder):
+    """Simulated TimelineItem."""
+
+    def __init__(
+        self,
+        sim: _Simulation,
+        timeline: "SimulatedTimeline",
+        clip: Optional[SimulatedMediaPoolItem],
+        start: int,
+        duration: int,
+        left_offset: int = 0,
+        name: Optional[str] = None,
+    ):
+        super().__init__(sim)
+        self.timeline = timeline
+        self.clip = clip
+        self.start = int(start)
+        self.duration = int(duration)
+        self.left_offset = int(left_offset)
+        self.name = name if name is not None else (clip.GetName() if clip else "")
+        self.unique_id = sim.new_id()
+        self.track_type = "video"
+        self.track_index = 1
+        self.enabled = True
+        self.clip_color = ""
+        self.flags: List[str] = []
+        self.properties: Dict[str, Any] = {
+            "Pan": 0.0,
+            "Tilt": 0.0,
+            "ZoomX": 1.0,
+            "ZoomY": 1.0,
+            "RotationAngle": 0.0,
+            "Opacity": 100.0,
+            "CompositeMode": 0,
+        }
+        self.linked: List[SimulatedTimelineItem] = []
+
+    @property
+    def end(self) -> int:
+        return self.start + self.duration
+
+    def copy(self) -> "SimulatedTimelineItem":
+        item = SimulatedTimelineItem(
+            self._sim,
+            self.timeline,
+            self.clip,
+            self.start,
+            self.duration,
+            self.left_offset,
+            self.name,
+        )
+        item.track_type, item.track_index = self.track_type, self.track_index
+        item.enabled, item.clip_color = self.enabled, self.clip_color
+        item.flags = list(self.flags)
+        item.properties = dict(self.properties)
+        item.markers = {frame: dict(info) for frame, info in self.markers.items()}
+        return item
+
+    def GetName(self):
+        return self.name
+
+    def SetName(self, name):
+        self.name = name
+        return True
+
+    def GetStart(self, subframe_precision=False):
+        return float(self.start) if subframe_precision else self.start
+
+    def GetEnd(self, subframe_precision=False):
+        return float(self.end) if subframe_precision else self.end
+
+    def GetDuration(self, subframe_precision=False):
+        return float(self.duration) if subframe_precision else self.duration
+
+    def GetLeftOffset(self, subframe_precision=False):
+        return float(self.left_offset) if subframe_precision else self.left_offset
+
+    def GetRightOffset(self, subframe_precision=False):
+        source_frames = self.clip.frames if self.clip else self.left_offset + self.duration
+        right_offset = max(0, source_frames - self.left_offset - self.duration)
+        return float(right_offset) if subframe_precision else right_offset
+
+    def GetSourceStartFrame(self):
+        return self.left_offset
+
+    def GetSourceEndFrame(self):
+        return self.left_offset + self.duration
+
+    def GetSourceStartTime(self):
+        return self.left_offset / float(self.timeline.frame_rate)
+
+    def GetSourceEndTime(self):
+        return (self.left_offset + self.duration) / float(self.timeline.frame_rate)
+
+    def GetMediaPoolItem(self):
+        return self.clip
+
+    def GetProperty(self, property_key=None):
+        if not property_key:
+            return dict(self.properties)
+        return self.properties.get(property_key)
+
+    def SetProperty(self, property_key, property_value):
+        if property_key not in self.properties:
+            return False
+        self.properties[property_key] = property_value
+        return True
+
+    def GetUniqueId(self):
+        return self.unique_id
+
+    def GetClipEnabled(self):
+        return self.enabled
+
+    def SetClipEnabled(self, bool_value):
+        self.enabled = bool(bool_value)
+        return True
+
+    def GetClipColor(self):
+        return self.clip_color
+
+    def SetClipColor(self, color_name):
+        self.clip_color = color_name
+        return True
+
+    def ClearClipColor(self):
+        self.clip_color = ""
+        return True
+
+    def AddFlag(self, color):
+        if color not in self.flags:
+            self.flags.append(color)
+        return True
+
+    def GetFlagList(self):
+        return list(self.flags)
+
+    def ClearFlags(self, color):
+        self.flags = [] if color in ("", "All") else [f for f in self.flags if f != color]
+        return True
+
+    def GetTrackTypeAndIndex(self):
+        return [self.track_type, self.track_index]
+
+    def GetLinkedItems(self):
+        return list(self.linked)
+
+    def GetTakesCount(self):
+        return 0
+
+    def GetFusionCompCount(self):
+        return 0
+
+
+class _SimulatedTrack(object):
+    """One timeline track, items are kept sorted by start frame."""
+
+    def __init__(self, name: str, sub_type: str = ""):
+        self.name = name
+        self.sub_type = sub_type
+        self.enabled = True
+        self.locked = False
+        self.items: List[SimulatedTimelineItem] = []
+
+    @property
+    def end(self) -> Optional[int]:
+        return self.items[-1].end if self.items else None
+
+    def place(self, item: SimulatedTimelineItem):
+        """Overwrite-edits item into the track."""
+        kept = []
+        for other in self.items:
+            if other.end <= item.start or other.start >= item.end:
+                kept.append(other)
+                continue
+            if other.start < item.start:
+                head = other.copy() if other.end > item.end else other
+                head.duration = item.start - other.start
+                kept.append(head)
+            if other.end > item.end:
+                cut = item.end - other.start
+                other.left_offset += cut
+                other.start = item.end
+                other.duration -= cut
+                kept.append(other)
+        kept.append(item)
+        kept.sort(key=lambda track_item: track_item.start)
+        self.items = kept
+
+
+class SimulatedGalleryStill(SimulatedObject):
+    """Simulated GalleryStill."""
+
+    def __init__(self, sim: _Simulation, label: str, timeline_id: str, frame: int):
+        super().__init__(sim)
+        self.label = label
+        self.timeline_id = timeline_id
+        self.frame = frame
+        self.committed_at = time.monotonic() + sim.config.still_commit_seconds
+
+
+class SimulatedGalleryStillAlbum(SimulatedObject):
+    """Simulated GalleryStillAlbum, also used for PowerGrade albums."""
+
+    def __init__(self, sim: _Simulation):
+        super().__init__(sim)
+        self.stills: List[SimulatedGalleryStill] = []
+        self._labels = itertools.count(1)
+
+    def add_still(self, timeline_id: str, frame: int) -> SimulatedGalleryStill:
+        still = SimulatedGalleryStill(
+            self._sim, f"1.{next(self._labels)}.1", timeline_id, frame
+        )
+        self.stills.append(still)
+        return still
+
+    def committed(self, still) -> bool:
+        return still in self.stills and time.monotonic() >= still.committed_at
+
+    def GetStills(self):
+        return [still for still in self.stills if self.committed(still)]
+
+    def GetLabel(self, still):
+        return still.label if self.committed(still) else ""
+
+    def SetLabel(self, still, label):
+        if not self.committed(still):
+            return False
+        still.label = label
+        return True
+
+    def ExportStills(self, stills, folder_path, file_prefix, format):
+        folder = Path(folder_path)
+        if not folder.is_dir():
+            return False
+        for still in stills:
+            if not self.committed(still):
+                return False
+            stem = f"{file_prefix}_{still.label}"
+            (folder / f"{stem}.{format}").write_bytes(b"")
+            (folder / f"{stem}.drx").write_bytes(b"")
+        return True
+
+    def DeleteStills(self, stills):
+        for still in stills:
+            if still in self.stills:
+                self.stills.remove(still)
+        return True
+
+    def ImportStills(self, file_paths):
+        for _ in file_paths:
+            self.add_still("", 0)
+        return True
+
+
+class SimulatedGallery(SimulatedObject):
+    """Simulated Gallery."""
+
+    def __init__(self, sim: _Simulation):
+        super().__init__(sim)
+        self.albums: List[SimulatedGalleryStillAlbum] = []
+        self.power_grade_albums: List[SimulatedGalleryStillAlbum] = []
+        self.album_names: Dict[int, str] = {}
+        self.current_album = self._new_album(self.albums, "Stills 1")
+
+    def _new_album(self, albums: list, name: str) -> SimulatedGalleryStillAlbum:
+        album = SimulatedGalleryStillAlbum(self._sim)
+        albums.append(album)
+        self.album_names[id(album)] = name
+        return album
+
+    def GetAlbumName(self, album):
+        return self.album_names.get(id(album), "")
+
+    def SetAlbumName(self, album, album_name):
+        if id(album) not in self.album_names:
+            return False
+        self.album_names[id(album)] = album_name
+        return True
+
+    def GetCurrentStillAlbum(self):
+        return self.current_album
+
+    def SetCurrentStillAlbum(self, album):
+        if album not in self.albums:
+            return False
+        self.current_album = album
+        return True
+
+    def GetGalleryStillAlbums(self):
+        return list(self.albums)
+
+    def GetGalleryPowerGradeAlbums(self):
+        return list(self.power_grade_albums)
+
+    def CreateGalleryStillAlbum(self):
+        return self._new_album(self.albums, f"Stills {len(self.albums) + 1}")
+
+    def CreateGalleryPowerGradeAlbum(self):
+        return self._new_album(
+            self.power_grade_albums, f"PowerGrade {len(self.power_grade_albums) + 1}"
+        )
+
+
+class SimulatedTimeline(_SimulatedMarkerHolder):
+    """Simulated Timeline."""
+
+    def __init__(self, sim: _Simulation, project: "SimulatedProject", name: str):
+        super().__init__(sim)
+        self.project = project
+        self.name = name
+        self.unique_id = sim.new_id()
+        self.settings: Dict[str, str] = {}
+        self.start_frame = _timecode_to_frame("01:00:00:00", self.frame_rate)
+        self.tracks: Dict[str, List[_SimulatedTrack]] = {
+            "video": [_SimulatedTrack("Video 1")],
+            "audio": [_SimulatedTrack("Audio 1", "stereo")],
+            "subtitle": [],
+        }
+        self.playhead = self.start_frame
+        self.mark_in_out: Dict[str, Dict[str, int]] = {}
+        self.media_pool_item: Optional[SimulatedMediaPoolItem] = None
+
+    @property
+    def frame_rate(self) -> str:
+        return self.settings.get(
+            "timelineFrameRate", self.project.settings["timelineFrameRate"]
+        )
+
+    def _track(self, track_type, index) -> Optional[_SimulatedTrack]:
+        tracks = self.tracks.get(track_type, [])
+        if 1 <= int(index) <= len(tracks):
+            return tracks[int(index) - 1]
+        return None
+
+    def all_items(self) -> Iterator[SimulatedTimelineItem]:
+        for tracks in self.tracks.values():
+            for track in tracks:
+                yield from track.items
+
+    def place_item(
+        self, item: SimulatedTimelineItem, track_type: str, track_index: int
+    ) -> SimulatedTimelineItem:
+        tracks = self.tracks[track_type]
+        while len(tracks) < track_index:
+            tracks.append(_SimulatedTrack(f"{track_type.title()} {len(tracks) + 1}"))
+        item.track_type, item.track_index = track_type, track_index
+        tracks[track_index - 1].place(item)
+        return item
+
+    def video_item_at(self, frame: int) -> Optional[SimulatedTimelineItem]:
+        for track in reversed(self.tracks["video"]):
+            if not track.enabled:
+                continue
+            for item in track.items:
+                if item.start <= frame < item.end and item.enabled:
+                    return item
+        return None
+
+    def GetName(self):
+        return self.name
+
+    def SetName(self, timeline_name):
+        if any(
+            timeline is not self and timeline.name == timeline_name
+            for timeline in self.project.timelines
+        ):
+            return False
+        self.name = timeline_name
+        return True
+
+    def GetUniqueId(self):
+        return self.unique_id
+
+    def GetStartFrame(self):
+        return self.start_frame
+
+    def GetEndFrame(self):
+        ends = [item.end for item in self.all_items()]
+        return max(ends) if ends else self.start_frame
+
+    def GetStartTimecode(self):
+        return _frame_to_timecode(self.start_frame, self.frame_rate)
+
+    def SetStartTimecode(self, timecode):
+        new_start = _timecode_to_frame(timecode, self.frame_rate)
+        delta = new_start - self.start_frame
+        for item in self.all_items():
+            item.start += delta
+        self.playhead += delta
+        self.start_frame = new_start
+        return True
+
+    def GetSetting(self, setting_name=""):
+        if not setting_name:
+            return {**self.project.settings, **self.settings}
+        return self.settings.get(
+            setting_name, self.project.settings.get(setting_name, "")
+        )
+
+    def SetSetting(self, setting_name, setting_value):
+        self.settings[setting_name] = str(setting_value)
+        return True
+
+    def GetTrackCount(self, track_type):
+        return len(self.tracks.get(track_type, []))
+
+    def AddTrack(self, track_type, sub_track_type=None):
+        if track_type not in self.tracks:
+            return False
+        tracks = self.tracks[track_type]
+        options = sub_track_type if isinstance(sub_track_type, dict) else {}
+        sub_type = options.get("audioType", sub_track_type if isinstance(sub_track_type, str) else "")
+        index = int(options.get("index", len(tracks) + 1))
+        tracks.insert(index - 1, _SimulatedTrack(f"{track_type.title()} {index}", sub_type))
+        for track_index, track in enumerate(tracks, start=1):
+            for item in track.items:
+                item.track_index = track_index
+        return True
+
+    def DeleteTrack(self, track_type, track_index):
+        track = self._track(track_type, track_index)
+        if track is None:
+            return False
+        tracks = self.tracks[track_type]
+        tracks.remove(track)
+        for index, remaining in enumerate(tracks, start=1):
+            for item in remaining.items:
+                item.track_index = index
+        return True
+
+    def GetTrackName(self, track_type, track_index):
+        track = self._track(track_type, track_index)
+        return track.name if track else ""
+
+    def SetTrackName(self, track_type, track_index, name):
+        track = self._track(track_type, track_index)
+        if track is None:
+            return False
+        track.name = name
+        return True
+
+    def GetTrackSubType(self, track_type, track_index):
+        track = self._track(track_type, track_index)
+        return track.sub_type if track else ""
+
+    def SetTrackEnable(self, track_type, track_index, is_enable):
+        track = self._track(track_type, track_index)
+        if track is None:
+            return False
+        track.enabled = bool(is_enable)
+        return True
+
+    def GetIsTrackEnabled(self, track_type, track_index):
+        track = self._track(track_type, track_index)
+        return bool(track and track.enabled)
+
+    def SetTrackLock(self, track_type, track_index, is_locked):
+        track = self._track(track_type, track_index)
+        if track is None:
+            return False
+        track.locked = bool(is_locked)
+        return True
+
+    def GetIsTrackLocked(self, track_type, track_index):
+        track = self._track(track_type, track_index)
+        return bool(track and track.locked)
+
+    def GetItemListInTrack(self, track_type, index):
+        track = self._track(track_type, index)
+        return list(track.items) if track else []
+
+    def DeleteClips(self, timeline_items, ripple_delete=False):
+        deleted = False
+        for item in timeline_items:
+            track = self._track(item.track_type, item.track_index)
+            if track is None or item not in track.items:
+                continue
+            track.items.remove(item)
+            deleted = True
+            if ripple_delete:
+                for later in track.items:
+                    if later.start >= item.end:
+                        later.start -= item.duration
+        return deleted
+
+    def SetClipsLinked(self, timeline_items, is_linked):
+        for item in timeline_items:
+            item.linked = (
+                [other for other in timeline_items if other is not item]
+                if is_linked
+                else []
+            )
+        return True
+
+    def GetCurrentTimecode(self):
+        return _frame_to_timecode(self.playhead, self.frame_rate)
+
+    def SetCurrentTimecode(self, timecode):
+        try:
+            self.playhead = _timecode_to_frame(timecode, self.frame_rate)
+        except ValueError:
+            return False
+        return True
+
+    def GetCurrentVideoItem(self):
+        return self.video_item_at(self.playhead)
+
+    def GrabStill(self):
+        if self.video_item_at(self.playhead) is None:
+            return None
+        album = self.project.gallery.current_album
+        return album.add_still(self.unique_id, self.playhead)
+
+    def GrabAllStills(self, still_frame_source):
+        album = self.project.gallery.current_album
+        stills = []
+        for track in self.tracks["video"]:
+            for item in track.items:
+                frame = item.start
+                if int(still_frame_source) == 2:
+                    frame += item.duration // 2
+                stills.append(album.add_still(self.unique_id, frame))
+        return stills
+
+    def DuplicateTimeline(self, timeline_name=None):
+        name = timeline_name or f"{self.name} Copy"
+        if any(timeline.name == name for timeline in self.project.timelines):
+            return None
+        duplicate = SimulatedTimeline(self._sim, self.project, name)
+        duplicate.settings = dict(self.settings)
+        duplicate.start_frame = self.start_frame
+        duplicate.markers = {f: dict(info) for f, info in self.markers.items()}
+        for track_type, tracks in self.tracks.items():
+            duplicate.tracks[track_type] = []
+            for track in tracks:
+                new_track = _SimulatedTrack(track.name, track.sub_type)
+                new_track.enabled, new_track.locked = track.enabled, track.locked
+                for item in track.items:
+                    new_item = item.copy()
+                    new_item.timeline = duplicate
+                    new_track.items.append(new_item)
+                duplicate.tracks[track_type].append(new_track)
+        self.project.timelines.append(duplicate)
+        return duplicate
+
+    def GetMediaPoolItem(self):
+        return self.media_pool_item
+
+    def GetMarkInOut(self):
+        return {key: dict(value) for key, value in self.mark_in_out.items()}
+
+    def SetMarkInOut(self, mark_in, mark_out, mark_type="all"):
+        for key in ("video", "audio") if mark_type == "all" else (mark_type,):
+            self.mark_in_out[key] = {"in": int(mark_in), "out": int(mark_out)}
+        return True
+
+    def ClearMarkInOut(self, mark_type="all"):
+        for key in ("video", "audio") if mark_type == "all" else (mark_type,):
+            self.mark_in_out.pop(key, None)
+        return True
+
+    def Export(self, file_name, export_type, export_subtype=None):
+        Path(file_name).write_text(self.name)
+        return True
+
+    def GetCurrentClipThumbnailImage(self):
+        return {}
+
+    def DetectSceneCuts(self):
+        return True
+
+    def GetNodeGraph(self):
+        return None
+
+
+class SimulatedMediaPool(SimulatedObject):
+    """Simulated MediaPool."""
+
+    def __init__(self, sim: _Simulation, project: "SimulatedProject"):
+        super().__init__(sim)
+        self.project = project
+        self.unique_id = sim.new_id()
+        self.root_folder = SimulatedFolder(sim, "Master")
+        self.current_folder = self.root_folder
+        self.selected: List[SimulatedMediaPoolItem] = []
+
+    def all_clips(self) -> Iterator[SimulatedMediaPoolItem]:
+        for folder in self.root_folder.walk():
+            yield from folder.clips
+
+    def import_clip(self, entry, folder: Optional[SimulatedFolder] = None):
+        """Creates a clip from an ImportMedia entry (path or clip info dict)."""
+        if isinstance(entry, dict):
+            overrides = dict(entry)
+            file_path = str(overrides.pop("FilePath"))
+            if "StartIndex" in overrides and "EndIndex" in overrides:
+                overrides["Frames"] = (
+                    int(overrides.pop("EndIndex")) - int(overrides.pop("StartIndex")) + 1
+                )
+        else:
+            overrides, file_path = {}, str(entry)
+        clip = SimulatedMediaPoolItem(self._sim, file_path, overrides)
+        (folder or self.current_folder).add_clip(clip)
+        return clip
+
+    def _append(self, timeline: SimulatedTimeline, entry) -> Optional[SimulatedTimelineItem]:
+        if isinstance(entry, SimulatedMediaPoolItem):
+            entry = {"mediaPoolItem": entry}
+        clip = entry.get("mediaPoolItem")
+        if clip is None:
+            return None
+        start_frame = int(entry.get("startFrame", 0))
+        end_frame = int(entry.get("endFrame", clip.frames - 1))
+        track_type = "audio" if int(entry.get("mediaType", 1)) == 2 else "video"
+        track_index = int(entry.get("trackIndex", 1))
+        tracks = timeline.tracks[track_type]
+        track_end = (
+            tracks[track_index - 1].end if track_index <= len(tracks) else None
+        )
+        record_frame = entry.get("recordFrame")
+        if record_frame is None:
+            record_frame = track_end if track_end is not None else timeline.start_frame
+        item = SimulatedTimelineItem(
+            self._sim,
+            timeline,
+            clip,
+            int(record_frame),
+            end_frame - start_frame + 1,
+            start_frame,
+        )
+        return timeline.place_item(item, track_type, track_index)
+
+    def GetRootFolder(self):
+        return self.root_folder
+
+    def GetCurrentFolder(self):
+        return self.current_folder
+
+    def SetCurrentFolder(self, folder):
+        self.current_folder = folder
+        return True
+
+    def AddSubFolder(self, folder, name):
+        subfolder = SimulatedFolder(self._sim, name, folder)
+        folder.subfolders.append(subfolder)
+        folder.stale = True
+        return subfolder
+
+    def RefreshFolders(self):
+        for folder in self.root_folder.walk():
+            folder.stale = False
+        return True
+
+    def GetUniqueId(self):
+        return self.unique_id
+
+    def ImportMedia(self, file_paths):
+        return [self.import_clip(entry) for entry in file_paths]
+
+    def CreateEmptyTimeline(self, name):
+        if any(timeline.name == name for timeline in self.project.timelines):
+            return None
+        timeline = SimulatedTimeline(self._sim, self.project, name)
+        timeline.media_pool_item = self.import_clip(
+            {"FilePath": name, "Type": "Timeline"}
+        )
+        self.project.timelines.append(timeline)
+        self.project.current_timeline = timeline
+        return timeline
+
+    def AppendToTimeline(self, clips):
+        timeline = self.project.current_timeline
+        if timeline is None:
+            return []
+        appended = [self._append(timeline, entry) for entry in clips]
+        return [item for item in appended if item is not None]
+
+    def CreateTimelineFromClips(self, name, clips):
+        timeline = self.CreateEmptyTimeline(name)
+        if timeline is not None:
+            self.AppendToTimeline(clips)
+        return timeline
+
+    def ImportTimelineFromFile(self, file_path, import_options=None):
+        options = import_options or {}
+        return self.CreateEmptyTimeline(
+            options.get("timelineName") or Path(file_path).stem
+        )
+
+    def DeleteTimelines(self, timelines):
+        for timeline in timelines:
+            if timeline in self.project.timelines:
+                self.project.timelines.remove(timeline)
+                if self.project.current_timeline is timeline:
+                    self.project.current_timeline = (
+                        self.project.timelines[0] if self.project.timelines else None
+                    )
+        return True
+
+    def DeleteClips(self, clips):
+        for clip in clips:
+            if clip.folder is not None:
+                clip.folder.remove_clip(clip)
+        return True
+
+    def DeleteFolders(self, subfolders):
+        for folder in subfolders:
+            if folder.parent is not None:
+                folder.parent.subfolders.remove(folder)
+                folder.parent.stale = True
+        return True
+
+    def MoveClips(self, clips, target_folder):
+        for clip in clips:
+            if clip.folder is not None:
+                clip.folder.remove_clip(clip)
+            target_folder.add_clip(clip)
+        return True
+
+    def MoveFolders(self, folders, target_folder):
+        for folder in folders:
+            if folder.parent is not None:
+                folder.parent.subfolders.remove(folder)
+                folder.parent.stale = True
+            folder.parent = target_folder
+            target_folder.subfolders.append(folder)
+        target_folder.stale = True
+        return True
+
+    def RelinkClips(self, media_pool_items, folder_path):
+        for clip in media_pool_items:
+            clip.ReplaceClip(str(Path(folder_path) / clip.properties["File Name"]))
+        return True
+
+    def UnlinkClips(self, media_pool_items):
+        return True
+
+    def ExportMetadata(self, file_name, clips=None):
+        Path(file_name).write_text("")
+        return True
+
+    def GetSelectedClips(self):
+        return list(self.selected)
+
+    def SetSelectedClip(self, media_pool_item):
+        self.selected = [media_pool_item]
+        return True
+
+
+class SimulatedProject(SimulatedObject):
+    """Simulated Project."""
+
+    def __init__(self, sim: _Simulation, name: str):
+        super().__init__(sim)
+        self.name = name
+        self.unique_id = sim.new_id()
+        self.settings: Dict[str, str] = dict(DEFAULT_PROJECT_SETTINGS)
+        self.media_pool = SimulatedMediaPool(sim, self)
+        self.gallery = SimulatedGallery(sim)
+        self.timelines: List[SimulatedTimeline] = []
+        self.current_timeline: Optional[SimulatedTimeline] = None
+        self.render_settings: Dict[str, Any] = {}
+        self.render_jobs: Dict[str, Dict[str, Any]] = {}
+        self.render_format_and_codec = {"format": "mov", "codec": "ProRes422HQ"}
+        self.render_mode = 1
+        self.render_presets = ["H.264 Master", "YouTube - 1080p"]
+
+    def _job_status(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        started = job.get("_started")
+        if job.get("_cancelled"):
+            return {"JobStatus": "Cancelled", "CompletionPercentage": 0}
+        if started is None:
+            return {"JobStatus": "Ready", "CompletionPercentage": 0}
+        render_seconds = self._sim.config.render_seconds
+        elapsed = time.monotonic() - started
+        if render_seconds <= 0 or elapsed >= render_seconds:
+            return {"JobStatus": "Complete", "CompletionPercentage": 100}
+        return {
+            "JobStatus": "Rendering",
+            "CompletionPercentage": int(100 * elapsed / render_seconds),
+        }
+
+    def GetName(self):
+        return self.name
+
+    def SetName(self, project_name):
+        self.name = project_name
+        return True
+
+    def GetUniqueId(self):
+        return self.unique_id
+
+    def GetMediaPool(self):
+        return self.media_pool
+
+    def GetGallery(self):
+        return self.gallery
+
+    def GetTimelineCount(self):
+        return len(self.timelines)
+
+    def GetTimelineByIndex(self, idx):
+        if 1 <= int(idx) <= len(self.timelines):
+            return self.timelines[int(idx) - 1]
+        return None
+
+    def GetCurrentTimeline(self):
+        return self.current_timeline
+
+    def SetCurrentTimeline(self, timeline):
+        if timeline not in self.timelines:
+            return False
+        self.current_timeline = timeline
+        return True
+
+    def GetSetting(self, setting_name=""):
+        if not setting_name:
+            return dict(self.settings)
+        return self.settings.get(setting_name, "")
+
+    def SetSetting(self, setting_name, setting_value):
+        self.settings[setting_name] = str(setting_value)
+        return True
+
+    def GetPresetList(self):
+        return [{"Name": "Default"}]
+
+    def SetPreset(self, preset_name):
+        return True
+
+    def SetRenderSettings(self, render_settings):
+        self.render_settings.update(render_settings)
+        return True
+
+    def GetRenderFormats(self):
+        return {"QuickTime": "mov", "MP4": "mp4", "TIFF": "tif"}
+
+    def GetRenderCodecs(self, render_format):
+        return {"Apple ProRes 422 HQ": "ProRes422HQ", "H.264": "H264"}
+
+    def GetRenderResolutions(self, format=None, codec=None):
+        return [{"Width": 1920, "Height": 1080}, {"Width": 3840, "Height": 2160}]
+
+    def GetCurrentRenderFormatAndCodec(self):
+        return dict(self.render_format_and_codec)
+
+    def SetCurrentRenderFormatAndCodec(self, format, codec):
+        self.render_format_and_codec = {"format": format, "codec": codec}
+        return True
+
+    def GetCurrentRenderMode(self):
+        return self.render_mode
+
+    def SetCurrentRenderMode(self, render_mode):
+        self.render_mode = int(render_mode)
+        return True
+
+    def GetRenderPresetList(self):
+        return list(self.render_presets)
+
+    def LoadRenderPreset(self, preset_name):
+        return preset_name in self.render_presets
+
+    def SaveAsNewRenderPreset(self, preset_name):
+        if preset_name in self.render_presets:
+            return False
+        self.render_presets.append(preset_name)
+        return True
+
+    def DeleteRenderPreset(self, preset_name):
+        if preset_name not in self.render_presets:
+            return False
+        self.render_presets.remove(preset_name)
+        return True
+
+    def AddRenderJob(self):
+        if self.current_timeline is None:
+            return ""
+        job_id = self._sim.new_id()
+        self.render_jobs[job_id] = {
+            "JobId": job_id,
+            "TimelineName": self.current_timeline.name,
+            "TargetDir": self.render_settings.get("TargetDir", ""),
+            "OutputFilename": self.render_settings.get(
+                "CustomName", self.current_timeline.name
+            ),
+            "RenderMode": "Single clip" if self.render_mode == 1 else "Individual clips",
+        }
+        return job_id
+
+    def DeleteRenderJob(self, job_id):
+        return self.render_jobs.pop(job_id, None) is not None
+
+    def DeleteAllRenderJobs(self):
+        self.render_jobs.clear()
+        return True
+
+    def GetRenderJobList(self):
+        return [
+            {key: value for key, value in job.items() if not key.startswith("_")}
+            for job in self.render_jobs.values()
+        ]
+
+    def GetRenderJobStatus(self, job_id):
+        job = self.render_jobs.get(job_id)
+        return self._job_status(job) if job else {}
+
+    def StartRendering(self, *args):
+        job_ids = [arg for arg in args if isinstance(arg, str)]
+        for arg in args:
+            if isinstance(arg, (list, tuple)):
+                job_ids.extend(arg)
+        jobs = (
+            [self.render_jobs[job_id] for job_id in job_ids if job_id in self.render_jobs]
+            if job_ids
+            else list(self.render_jobs.values())
+        )
+        started = time.monotonic()
+        for job in jobs:
+            job["_started"] = started
+            job.pop("_cancelled", None)
+        return bool(jobs)
+
+    def StopRendering(self):
+        for job in self.render_jobs.values():
+            if self._job_status(job)["JobStatus"] == "Rendering":
+                job["_cancelled"] = True
+        return True
+
+    def IsRenderingInProgress(self):
+        return any(
+            self._job_status(job)["JobStatus"] == "Rendering"
+            for job in self.render_jobs.values()
+        )
+
+    def RefreshLUTList(self):
+        return True
+
+
+class SimulatedProjectManager(SimulatedObject):
+    """Simulated ProjectManager with a flat project folder."""
+
+    def __init__(self, sim: _Simulation):
+        super().__init__(sim)
+        self.projects: Dict[str, SimulatedProject] = {}
+        self.folders: List[str] = []
+        self.database = {"DbType": "Disk", "DbName": "Local Database"}
+        self.current_project = self._create("Untitled Project")
+
+    def _create(self, project_name: str) -> SimulatedProject:
+        project = SimulatedProject(self._sim, project_name)
+        self.projects[project_name] = project
+        return project
+
+    def CreateProject(self, project_name, media_location_path=None):
+        if project_name in self.projects:
+            return None
+        self.current_project = self._create(project_name)
+        return self.current_project
+
+    def LoadProject(self, project_name):
+        project = self.projects.get(project_name)
+        if project is not None:
+            self.current_project = project
+        return project
+
+    def GetCurrentProject(self):
+        return self.current_project
+
+    def CloseProject(self, project):
+        if project is not self.current_project:
+            return False
+        self.current_project = self.projects.get("Untitled Project") or self._create(
+            "Untitled Project"
+        )
+        return True
+
+    def SaveProject(self):
+        return self.current_project is not None
+
+    def DeleteProject(self, project_name):
+        project = self.projects.get(project_name)
+        if project is None or project is self.current_project:
+            return False
+        del self.projects[project_name]
+        return True
+
+    def GetProjectListInCurrentFolder(self):
+        return list(self.projects)
+
+    def GetFolderListInCurrentFolder(self):
+        return list(self.folders)
+
+    def CreateFolder(self, folder_name):
+        if folder_name in self.folders:
+            return False
+        self.folders.append(folder_name)
+        return True
+
+    def DeleteFolder(self, folder_name):
+        if folder_name not in self.folders:
+            return False
+        self.folders.remove(folder_name)
+        return True
+
+    def OpenFolder(self, folder_name):
+        return folder_name in self.folders
+
+    def GotoRootFolder(self):
+        return True
+
+    def GotoParentFolder(self):
+        return True
+
+    def GetCurrentDatabase(self):
+        return dict(self.database)
+
+    def GetDatabaseList(self):
+        return [dict(self.database)]
+
+    def SetCurrentDatabase(self, database_info):
+        self.database = dict(database_info)
+        return True
+
+    def ExportProject(self, project_name, file_path, with_stills_and_luts=True):
+        return project_name in self.projects
+
+    def ImportProject(self, file_path, project_name=None):
+        name = project_name or Path(file_path).stem
+        if name in self.projects:
+            return False
+        self._create(name)
+        return True
+
+    def RestoreProject(self, file_path, project_name=None):
+        return self.ImportProject(file_path, project_name)
+
+    def ArchiveProject(self, project_name, file_path, *args):
+        return project_name in self.projects
+
+
+class SimulatedMediaStorage(SimulatedObject):
+    """Simulated MediaStorage backed by the local file system."""
+
+    def __init__(self, sim: _Simulation, resolve: "SimulatedResolve"):
+        super().__init__(sim)
+        self.resolve = resolve
+
+    def _media_pool(self) -> SimulatedMediaPool:
+        return self.resolve.project_manager.current_project.media_pool
+
+    def GetMountedVolumeList(self):
+        return [str(Path.home())]
+
+    def GetSubFolderList(self, folder_path):
+        path = Path(folder_path)
+        return [str(p) for p in sorted(path.iterdir()) if p.is_dir()] if path.is_dir() else []
+
+    def GetFileList(self, folder_path):
+        path = Path(folder_path)
+        return [str(p) for p in sorted(path.iterdir()) if p.is_file()] if path.is_dir() else []
+
+    def RevealInStorage(self, path):
+        return Path(path).exists()
+
+    def AddItemListToMediaPool(self, items):
+        media_pool = self._media_pool()
+        clips = []
+        for item in items:
+            if isinstance(item, dict):
+                entry = {"FilePath": item["media"]}
+                if "startFrame" in item and "endFrame" in item:
+                    entry["Frames"] = int(item["endFrame"]) - int(item["startFrame"]) + 1
+                item = entry
+            clips.append(media_pool.import_clip(item))
+        return clips
+
+    def AddClipMattesToMediaPool(self, media_pool_item, paths, stereo_eye=None):
+        return True
+
+    def AddTimelineMattesToMediaPool(self, paths):
+        return [self._media_pool().import_clip(path) for path in paths]
+
+
+class SimulatedResolve(SimulatedObject):
+    """Simulated top level Resolve scripting object."""
+
+    def __init__(self, config: SimulatorConfig):
+        super().__init__(_Simulation(config))
+        for index, constant in enumerate(ResolveObject.__annotations__, start=1):
+            setattr(self, constant, index)
+        self.project_manager = SimulatedProjectManager(self._sim)
+        self.media_storage = SimulatedMediaStorage(self._sim, self)
+        self.page = "edit"
+        self.layout_presets: List[str] = []
+        self.keyframe_mode = 0
+
+    @property
+    def calls(self) -> Counter:
+        """Round-trip count per API name."""
+        return self._sim.calls
+
+    def GetVersion(self):
+        return list(self._sim.config.version)
+
+    def GetVersionString(self):
+        major, minor, patch, build, suffix = (list(self._sim.config.version) + [0, ""])[:5]
+        return f"{major}.{minor}.{patch}{suffix}.{build}"
+
+    def GetProductName(self):
+        return "DaVinci Resolve Studio"
+
+    def GetProjectManager(self):
+        return self.project_manager
+
+    def GetMediaStorage(self):
+        return self.media_storage
+
+    def Fusion(self):
+        return None
+
+    def GetCurrentPage(self):
+        return self.page
+
+    def OpenPage(self, page_name):
+        if page_name not in ("media", "cut", "edit", "fusion", "color", "fairlight", "deliver"):
+            return False
+        self.page = page_name
+        return True
+
+    def SaveLayoutPreset(self, preset_name):
+        if preset_name in self.layout_presets:
+            return False
+        self.layout_presets.append(preset_name)
+        return True
+
+    def UpdateLayoutPreset(self, preset_name):
+        return preset_name in self.layout_presets
+
+    def LoadLayoutPreset(self, preset_name):
+        return preset_name in self.layout_presets
+
+    def DeleteLayoutPreset(self, preset_name):
+        if preset_name not in self.layout_presets:
+            return False
+        self.layout_presets.remove(preset_name)
+        return True
+
+    def ExportLayoutPreset(self, preset_name, preset_file_path):
+        return preset_name in self.layout_presets
+
+    def ImportLayoutPreset(self, preset_file_path, preset_name=None):
+        return self.SaveLayoutPreset(preset_name or Path(preset_file_path).stem)
+
+    def ImportRenderPreset(self, preset_path):
+        return True
+
+    def ExportRenderPreset(self, preset_name, export_path):
+        return True
+
+    def ImportBurnInPreset(self, preset_path):
+        return True
+
+    def ExportBurnInPreset(self, preset_name, export_path):
+        return True
+
+    def GetKeyframeMode(self):
+        return self.keyframe_mode
+
+    def SetKeyframeMode(self, key_frame_mode):
+        self.keyframe_mode = int(key_frame_mode)
+        return True
+
+    def GetFairlightPresets(self):
+        return []
+
+    def Quit(self):
+        return None
+
+
+class SimulatedBMDModule(object):
+    """Drop-in replacement for the fusionscript module.
+
+    ``scriptapp("Resolve", ip)`` returns one SimulatedResolve per ip, so
+    several connections can be simulated in one process.
+    """
+
+    def __init__(self, config: Optional[SimulatorConfig] = None):
+        self.config = config or SimulatorConfig()
+        self.instances: Dict[str, SimulatedResolve] = {}
+
+    def scriptapp(self, app_name: str, ip: str = "127.0.0.1"):
+        if app_name != "Resolve":
+            return None
+        if ip not in self.instances:
+            self.instances[ip] = SimulatedResolve(self.config)
+        return self.instances[ip]
+
+    @contextmanager
+    def offline(self):
+        """Temporarily disables latency and call counting, e.g. to seed data."""
+        sims = [instance._sim for instance in self.instances.values()]
+        previous = [sim.paused for sim in sims]
+        for sim in sims:
+            sim.paused = True
+        try:
+            yield self
+        finally:
+            for sim, paused in zip(sims, previous):
+                sim.paused = paused
+
+
+def populate_project(
+    project: SimulatedProject,
+    clip_count: int = 100,
+    folder_count: int = 1,
+    timeline_name: Optional[str] = "Timeline 1",
+    marker_every: int = 0,
+    clip_frames: Optional[int] = None,
+) -> Optional[SimulatedTimeline]:
+    """Seeds a simulated project with clips, folders, a timeline and markers.
+
+    Clips are distributed over `folder_count` sub folders of the root folder,
+    every clip is appended once to the timeline on V1. With `marker_every`
+    set, a timeline marker is added every that many frames.
+
+    Returns:
+        SimulatedTimeline: the created timeline, None if `timeline_name` is None
+    """
+    sim = project._sim
+    paused, sim.paused = sim.paused, True
+    try:
+        media_pool = project.media_pool
+        folders = [
+            media_pool.AddSubFolder(media_pool.root_folder, f"Bin {index + 1}")
+            for index in range(max(1, folder_count))
+        ]
+        clips = []
+        for index in range(clip_count):
+            entry: Dict[str, Any] = {"FilePath": f"/media/A{index:03d}_C{index:03d}.mov"}
+            if clip_frames is not None:
+                entry["Frames"] = clip_frames
+            entry["Start TC"] = _frame_to_timecode(3600 * 24 + index * 1000, 24)
+            clips.append(media_pool.import_clip(entry, folders[index % len(folders)]))
+        media_pool.RefreshFolders()
+        if timeline_name is None:
+            return None
+        timeline = media_pool.CreateEmptyTimeline(timeline_name)
+        media_pool.AppendToTimeline(clips)
+        if marker_every:
+            for offset in range(0, timeline.GetEndFrame() - timeline.start_frame, marker_every):
+                timeline.AddMarker(offset, "Blue", f"Marker {offset}", "", 1, "")
+        return timeline
+    finally:
+        sim.paused = paused
+
+
+_default_module: Optional[SimulatedBMDModule] = None
+
+
+def default_module() -> SimulatedBMDModule:
+    """Returns the process-wide simulator used when ``PYBMD_SIMULATOR`` is set.
+
+    ``PYBMD_SIMULATOR_LATENCY`` sets the per-call latency in seconds.
+    """
+    global _default_module
+    if _default_module is None:
+        latency = float(os.environ.get("PYBMD_SIMULATOR_LATENCY", "0") or 0)
+        _default_module = SimulatedBMDModule(SimulatorConfig(latency=latency))
+    return _default_module
@@ -0,0 +1,140 @@
+"""Resumable journal of StillManager grabs and exports.
+
+A StillJournal is an append-only JSON lines file next to a still export. Every
+still grabbed by `StillManager.grab_still_from_timeline_markers` /
+`StillManager.grab_all_still` and every export by `StillManager.export_stills`
+adds a line, flushed right away:
+
+    {"event": "grab", "key": "<timeline id>:<frame>", "timeline": "...", "frame": 86424, "label": "1.3.1"}
+    {"event": "export", "key": "<timeline id>:<frame>", "target": "A001_00086424.tif", "status": "exported"}
+
+When a long export dies halfway, a rerun with the same journal reuses the
+stills already in the album by label instead of grabbing them again, and skips
+the exports already done. A line cut short by the crash is ignored.
+
+Example:
+    >>> with StillManager(project, journal_path="/exports/day1.stills.jsonl") as manager:
+    ...     manager.grab_still_from_timeline_markers()
+    ...     manager.export_stills("/exports/day1")
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+GRAB = "grab"
+EXPORT = "export"
+EXPORTED = "exported"
+FAILED = "failed"
+
+
+def still_key(timeline_id: str, frame: int) -> str:
+    """Journal key of the still at a timeline frame."""
+    return f"{timeline_id}:{int(frame)}"
+
+
+class StillJournal(object):
+    """Append-only JSON lines journal of still grabs and exports.
+
+    Args:
+        path (str | Path): journal file, created on the first record
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+        self.grabs: Dict[str, dict] = {}
+        self.exports: Dict[Tuple[str, str], str] = {}
+        self._timelines = set()
+        self._exported_keys = set()
+        self._file = None
+        if self.path.is_file():
+            self._load()
+
+    def __repr__(self) -> str:
+        return (
+            f"StillJournal({str(self.path)!r}, {len(self.grabs)} grabs, "
+            f"{len(self.exports)} exports)"
+        )
+
+    def __enter__(self) -> "StillJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _load(self):
+        with self.path.open("r", encoding="utf-8") as journal_file:
+            for line_number, line in enumerate(journal_file, 1):
+                try:
+                    self._apply(json.loads(line))
+                except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+                    logger.warning(
+                        "Ignoring unreadable line %d of still journal %s",
+                        line_number,
+                        self.path,
+                    )
+
+    def _apply(self, record: dict):
+        event = record.get("event")
+        if event == GRAB:
+            self.grabs[record["key"]] = record
+            self._timelines.add(record.get("timeline"))
+        elif event == EXPORT:
+            self.exports[(record["key"], record["target"])] = record["status"]
+            if record["status"] == EXPORTED:
+                self._exported_keys.add(record["key"])
+
+    def _append(self, record: dict):
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("a+", encoding="utf-8")
+            # end a line cut short by a crash before appending
+            if self._file.tell():
+                self._file.seek(self._file.tell() - 1)
+                if self._file.read(1) != "\n":
+                    self._file.write("\n")
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        self._apply(record)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # grabs
+
+    def record_grab(self, key: str, timeline_id: str, frame: int, label: str):
+        """Records a still committed to the album under label."""
+        self._append(
+            {
+                "event": GRAB,
+                "key": key,
+                "timeline": timeline_id,
+                "frame": int(frame),
+                "label": label,
+            }
+        )
+
+    def grab(self, key: str) -> Optional[dict]:
+        """Returns the grab record of key, None if it was not grabbed."""
+        return self.grabs.get(key)
+
+    def has_timeline(self, timeline_id: str) -> bool:
+        """Whether any still of the timeline was grabbed."""
+        return timeline_id in self._timelines
+
+    # exports
+
+    def record_export(self, key: str, target: str, status: str):
+        """Records the outcome of exporting the still of key to target."""
+        self._append({"event": EXPORT, "key": key, "target": target, "status": status})
+
+    def exported(self, key: str, target: Optional[str] = None) -> bool:
+        """Whether the still of key was exported, to target or to any file name."""
+        if target is not None:
+            return self.exports.get((key, target)) == EXPORTED
+        return key in self._exported_keys
@@ -1,17 +1,21 @@
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, List
-
+from typing import TYPE_CHECKING, Dict, Iterable, List
 
 if TYPE_CHECKING:
     from pybmd.export_type import Timeline_Export_Subtype, Timeline_Export_Type
     from pybmd.settings import AutoCaptionSettings
+    from pybmd.interval_index import TimelineIntervalIndex
+    from pybmd.timeline_diff import ClipSpec, TimelinePlan, TimelineSpec
+    from pybmd.timeline_snapshot import TimelineSnapshot
 
 
+from pybmd._context import timelines_changed
 from pybmd._wrapper_base import WrapperBase
 from pybmd.decorators import requires_resolve_version, minimum_resolve_version
 from pybmd.media_pool_item import MediaPoolItem
 from pybmd.gallery_still import GalleryStill
 from pybmd.graph import Graph
+from pybmd.marker_store import MarkerStore
 
 from pybmd.timeline_item import TimelineItem
 
@@ -100,7 +104,7 @@ def timeline_item_class_list_transfer(timeline_item_list: List[TimelineItem]) ->
     timeline_item_trans_list = []
 
     for timeline_item in timeline_item_list:
-        timeline_item_trans_list.append(timeline_item._timeline_item)
+        timeline_item_trans_list.append(timeline_item._object)
 
     return timeline_item_trans_list
 
@@ -108,9 +112,12 @@ def timeline_item_class_list_transfer(timeline_item_list: List[TimelineItem]) ->
 class Timeline(WrapperBase):
     """Timeline Object"""
 
-    def __init__(self, timeline):
-        super(Timeline, self).__init__(timeline)
-        self._timeline = self._object
+    __slots__ = ("_marker_store",)
+    _timeline = WrapperBase._handle_alias
+
+    def __init__(self, timeline, context=None):
+        super(Timeline, self).__init__(timeline, context)
+        self._marker_store: MarkerStore | None = None
 
     def __repr__(self) -> str:
         return f"Timeline: {self.get_name()}"
@@ -137,9 +144,14 @@ class Timeline(WrapperBase):
         Returns:
             bool: True if successful, False otherwise.
         """
-        return self._timeline.AddMarker(
+        result = self._object.AddMarker(
             frame_id, color, name, note, duration, custom_data
         )
+        if result and self._marker_store is not None:
+            self._marker_store._marker_added(
+                frame_id, color, name, note, duration, custom_data
+            )
+        return result
 
     # REMOVE at DR19.1.0
     # def apply_grade_from_drx(
@@ -155,7 +167,7 @@ class Timeline(WrapperBase):
     #     Returns:
     #         bool: True if successful, False otherwise.
     #     """
-    #     return self._timeline.ApplyGradeFromDRX(str(path), grade_mode, timeline_items)
+    #     return self._object.ApplyGradeFromDRX(str(path), grade_mode, timeline_items)
 
     def create_compound_clip(
         self, timeline_items: List[TimelineItem], clipinfo: dict
@@ -170,9 +182,10 @@ class Timeline(WrapperBase):
             TimelineItem: created timeline item.
         """
         return TimelineItem(
-            timeline_item=self._timeline.CreateCompoundClip(
+            timeline_item=self._object.CreateCompoundClip(
                 timeline_item_class_list_transfer(timeline_items), clipinfo
-            )
+            ),
+            context=self._context,
         )
 
     def create_fusion_clip(self, timeline_items: List[TimelineItem]) -> TimelineItem:
@@ -185,36 +198,50 @@ class Timeline(WrapperBase):
             TimelineItem: created timeline item.
         """
         return TimelineItem(
-            timeline_item=self._timeline.CreateFusionClip(
+            timeline_item=self._object.CreateFusionClip(
                 timeline_item_class_list_transfer(timeline_items)
-            )
+            ),
+            context=self._context,
         )
 
     def delete_marker_at_frame(self, frame_num: int) -> bool:
         """Deletes the timeline marker at the given frame number."""
-        return self._timeline.DeleteMarkerAtFrame(frame_num)
+        result = self._object.DeleteMarkerAtFrame(frame_num)
+        if result and self._marker_store is not None:
+            self._marker_store._marker_deleted_at(frame_num)
+        return result
 
     def delete_marker_by_custom_data(self, custom_data: str) -> bool:
         """Delete first matching marker with specified custom_data."""
-        return self._timeline.DeleteMarkerByCustomData(custom_data)
+        result = self._object.DeleteMarkerByCustomData(custom_data)
+        if result and self._marker_store is not None:
+            self._marker_store._marker_deleted_by_custom_data(custom_data)
+        return result
 
     def delete_marker_by_color(self, color: str) -> bool:
         """Deletes all timeline markers of the specified color.
         An "All" argument is supported and deletes all timeline markers.
         """
-        return self._timeline.DeleteMarkerByColor(color)
+        result = self._object.DeleteMarkerByColor(color)
+        if result and self._marker_store is not None:
+            self._marker_store._markers_deleted_by_color(color)
+        return result
 
     def duplicate_timeline(self, timeline_name: str) -> "Timeline":
         """Duplicates the timeline and returns the created timeline,
         with the (optional) timelineName, on success.
         """
-        return Timeline(timeline=self._timeline.DuplicateTimeline(timeline_name))
+        timelines_changed(self._context)
+        return Timeline(
+            timeline=self._object.DuplicateTimeline(timeline_name),
+            context=self._context,
+        )
 
     def export(
         self,
         file_name: str,
         export_type: "Timeline_Export_Type",
-        export_subtype: "Timeline_Export_Subtype" | None = None,
+        export_subtype: "Timeline_Export_Subtype | None" = None,
     ) -> bool:
         """Exports timeline to 'fileName' as per input exportType & exportSubtype format.
 
@@ -225,28 +252,28 @@ class Timeline(WrapperBase):
         #     timeline.export(file_path,LOCAL_RESOLVE.EXPORT_DRT)
         """
         if export_subtype is None:
-            return self._timeline.Export(file_name, export_type.value)
-        return self._timeline.Export(file_name, export_type.value, export_subtype.value)
+            return self._object.Export(file_name, export_type.value)
+        return self._object.Export(file_name, export_type.value, export_subtype.value)
 
     def get_current_clip_thumbnail_image(self) -> dict:
         """Returns a dict (keys "width", "height", "format" and "data") with data containing raw thumbnail image data
         (RGB 8-bit image data encoded in base64 format) for current media in the Color Page.
         """
-        return self._timeline.GetCurrentClipThumbnailImage()
+        return self._object.GetCurrentClipThumbnailImage()
 
     def get_current_timecode(self) -> str:
         """Returns a string timecode representation for the current playhead position,
         while on Cut, Edit, Color, Fairlight and Deliver pages.
         """
-        return self._timeline.GetCurrentTimecode()
+        return self._object.GetCurrentTimecode()
 
     def get_current_video_item(self) -> TimelineItem:
         """Returns the current video timeline item."""
-        return TimelineItem(self._timeline.GetCurrentVideoItem())
+        return TimelineItem._wrap(self._object.GetCurrentVideoItem(), self._context)
 
     def get_end_frame(self) -> int:
         """Returns the frame number at the end of timeline."""
-        return self._timeline.GetEndFrame()
+        return self._object.GetEndFrame()
 
     def get_item_list_in_track(
         self, track_type: TrackType, index: int
@@ -261,40 +288,103 @@ class Timeline(WrapperBase):
             List[TimelineItem]: timeline items on that track.
         """
         timeline_items_list = []
-        for timeline_item in self._timeline.GetItemListInTrack(track_type.value, index):
-            timeline_items_list.append(TimelineItem(timeline_item))
+        for timeline_item in self._object.GetItemListInTrack(track_type.value, index):
+            timeline_items_list.append(TimelineItem._wrap(timeline_item, self._context))
         return timeline_items_list
 
+    def snapshot(
+        self,
+        track_types: Iterable[TrackType] | None = None,
+        subframe_precision: bool = False,
+    ) -> "TimelineSnapshot":
+        """Reads every item of the timeline in one sweep into NumPy columns.
+
+        Args:
+            track_types (Iterable[TrackType], optional): track types to sweep. Defaults to None (video, audio and subtitle).
+            subframe_precision (bool, optional): read record frames and offsets as float. Defaults to False.
+
+        Returns:
+            TimelineSnapshot: columns start, end, duration, offsets, source frames, track, enabled, clip color, media id and name of every item
+        """
+        from pybmd.timeline_snapshot import take_snapshot
+
+        return take_snapshot(self, track_types, subframe_precision)
+
+    def diff(
+        self, target: "TimelineSnapshot | TimelineSpec | Iterable[ClipSpec]"
+    ) -> "TimelinePlan":
+        """Computes the minimal operations conforming this timeline to a target cut, see pybmd.timeline_diff.
+
+        Args:
+            target (TimelineSnapshot | TimelineSpec | Iterable[ClipSpec]): target cut, markers are compared when a TimelineSpec has them
+
+        Returns:
+            TimelinePlan: operations to run with plan.apply(project, timeline, media_pool_items)
+        """
+        from pybmd.timeline_diff import TimelineSpec, diff_timeline
+
+        current = self.snapshot((TrackType.VIDEO_TRACK, TrackType.AUDIO_TRACK))
+        markers = (
+            self.get_markers()
+            if isinstance(target, TimelineSpec) and target.markers is not None
+            else None
+        )
+        return diff_timeline(current, target, markers)
+
+    def interval_index(
+        self, track_types: Iterable[TrackType] | None = None
+    ) -> "TimelineIntervalIndex":
+        """Reads start and end of every item once to answer frame to item lookups locally, without moving the playhead.
+
+        Args:
+            track_types (Iterable[TrackType], optional): track types to index. Defaults to None (video).
+
+        Returns:
+            TimelineIntervalIndex: interval index of the items
+        """
+        from pybmd.interval_index import TimelineIntervalIndex
+
+        return TimelineIntervalIndex.from_timeline(self, track_types)
+
     def get_marker_by_custom_data(self, custom_data: str) -> dict:
         """Returns marker {information} for the first matching marker with specified customData."""
-        return self._timeline.GetMarkerByCustomData(custom_data)
+        return self._object.GetMarkerByCustomData(custom_data)
 
     def get_marker_custom_data(self, frame_id: int) -> str:
         """Returns customData string for the marker at given frameId position."""
-        return self._timeline.GetMarkerCustomData(frame_id)
+        return self._object.GetMarkerCustomData(frame_id)
+
+    def get_marker_store(self) -> MarkerStore:
+        """Returns the interval index of the markers, read on first use.
+
+        Markers changed through this wrapper are applied to it, call MarkerStore.refresh() after changes made elsewhere.
+        """
+        if self._marker_store is None:
+            self._marker_store = MarkerStore(self)
+        return self._marker_store
 
     def get_markers(self) -> dict:
         """Returns a dict (frameId -> {information}) of all markers and dicts with their information.
         Example: a value of {96.0: {'color': 'Green', 'duration': 1.0, 'note': '', 'name': 'Marker 1', 'customData': ''}, ...}
         indicates a single green marker at timeline offset 96
         """
-        return self._timeline.GetMarkers()
+        return self._object.GetMarkers()
 
     def get_name(self) -> str:
         """Returns the name of the timeline."""
-        return self._timeline.GetName()
+        return self._object.GetName()
 
     def get_setting(self, setting_name: str = "") -> str:
         """Returns value of timeline setting (indicated by settingName : string)."""
-        return self._timeline.GetSetting(setting_name)
+        return self._object.GetSetting(setting_name)
 
     def get_start_frame(self) -> int:
         """Returns the frame number at the start of timeline."""
-        return self._timeline.GetStartFrame()
+        return self._object.GetStartFrame()
 
     def get_track_count(self, track_type: TrackType) -> int:
         """Returns the number of tracks for the given trackType ("audio", "video" or "subtitle")."""
-        return self._timeline.GetTrackCount(track_type.value)
+        return self._object.GetTrackCount(track_type.value)
 
     def get_track_name(self, track_type: TrackType, track_index: int) -> str:
         """Returns the track name for track indicated by trackType ("audio", "video" or "subtitle") and trackIndex.
@@ -307,7 +397,7 @@ class Timeline(WrapperBase):
             str: track name.
         """
 
-        return self._timeline.GetTrackName(track_type.value, track_index)
+        return self._object.GetTrackName(track_type.value, track_index)
 
     def grab_all_stills(self, still_frame_source: int) -> List[GalleryStill]:
         """Grabs stills from all the clips of the timeline and returns a list of GalleryStill objects.
@@ -320,13 +410,13 @@ class Timeline(WrapperBase):
         """
 
         return [
-            GalleryStill(gallery_still)
-            for gallery_still in self._timeline.GrabAllStills(still_frame_source)
+            GalleryStill(gallery_still, self._context)
+            for gallery_still in self._object.GrabAllStills(still_frame_source)
         ]
 
     def grab_still(self) -> GalleryStill:
         """Grabs still from the current video clip. Returns a GalleryStill object."""
-        return GalleryStill(self._timeline.GrabStill())
+        return GalleryStill(self._object.GrabStill(), self._context)
 
     # TODO test this
     def import_into_timeline(
@@ -341,41 +431,50 @@ class Timeline(WrapperBase):
         Returns:
             bool: true if successful, false otherwise.
         """
-        return self._timeline.ImportIntoTimeline(file_path, asdict(import_options))
+        return self._object.ImportIntoTimeline(file_path, asdict(import_options))
 
     def insert_fusion_generator_into_timeline(
         self, generator_name: str
     ) -> TimelineItem:
         """Inserts a Fusion generator (indicated by generatorName : string) into the timeline."""
         return TimelineItem(
-            self._timeline.InsertFusionGeneratorIntoTimeline(generator_name)
+            self._object.InsertFusionGeneratorIntoTimeline(generator_name),
+            self._context,
         )
 
     def insert_fusion_title_into_timeline(self, title_name: str) -> TimelineItem:
         """Inserts a Fusion title (indicated by titleName : string) into the timeline."""
-        return TimelineItem(self._timeline.InsertFusionTitleIntoTimeline(title_name))
+        return TimelineItem(
+            self._object.InsertFusionTitleIntoTimeline(title_name), self._context
+        )
 
     def insert_generator_into_timeline(self, generator_name: str) -> TimelineItem:
         """Inserts a generator (indicated by generatorName : string) into the timeline."""
-        return TimelineItem(self._timeline.InsertGeneratorIntoTimeline(generator_name))
+        return TimelineItem(
+            self._object.InsertGeneratorIntoTimeline(generator_name), self._context
+        )
 
     def insert_oFX_generator_into_timeline(self, generator_name: str) -> TimelineItem:
         """Inserts an OFX generator (indicated by generatorName : string) into the timeline."""
         return TimelineItem(
-            self._timeline.InsertOFXGeneratorIntoTimeline(generator_name)
+            self._object.InsertOFXGeneratorIntoTimeline(generator_name),
+            self._context,
         )
 
     def insert_title_into_timeline(self, title_name: str) -> TimelineItem:
         """Inserts a title (indicated by titleName : string) into the timeline."""
-        return TimelineItem(self._timeline.InsertTitleIntoTimeline(title_name))
+        return TimelineItem(
+            self._object.InsertTitleIntoTimeline(title_name), self._context
+        )
 
     def set_current_timecode(self, tiemcode: str) -> bool:
         """Sets current playhead position from input timecode for Cut, Edit, Color, Fairlight and Deliver pages."""
-        return self._timeline.SetCurrentTimecode(tiemcode)
+        return self._object.SetCurrentTimecode(tiemcode)
 
     def set_name(self, timeline_name) -> bool:
         """Sets the timeline name if timelineName (string) is unique. Returns True if successful."""
-        return self._timeline.SetName(timeline_name)
+        timelines_changed(self._context)
+        return self._object.SetName(timeline_name)
 
     # TODO setting_name to data class
     def set_setting(self, setting_name: str, setting_value: str) -> bool:
@@ -388,7 +487,7 @@ class Timeline(WrapperBase):
         Returns:
             bool: True if successful, False otherwise.
         """
-        return self._timeline.SetSetting(setting_name, setting_value)
+        return self._object.SetSetting(setting_name, setting_value)
 
     def set_track_name(
         self, track_type: TrackType, track_index: int, name: str
@@ -403,35 +502,40 @@ class Timeline(WrapperBase):
         Returns:
             bool: True if successful, False otherwise.
         """
-        return self._timeline.SetTrackName(track_type.value, track_index, name)
+        return self._object.SetTrackName(track_type.value, track_index, name)
 
     def update_marker_custom_data(self, frame_id: int, custom_data: str) -> bool:
         """Updates customData (string) for the marker at given frameId position.
         CustomData is not exposed via UI and is useful for scripting developer to attach any user specific data to markers.
         """
-        return self._timeline.UpdateMarkerCustomData(frame_id, custom_data)
+        result = self._object.UpdateMarkerCustomData(frame_id, custom_data)
+        if result and self._marker_store is not None:
+            self._marker_store._custom_data_updated(frame_id, custom_data)
+        return result
 
     #######################################################################################################################
     # Add at DR18.0.0
     @minimum_resolve_version("18.0.0")
     def set_start_timecode(self, timecode: str) -> bool:
         """Set the start timecode of the timeline to the string 'timecode'. Returns true when the change is successful, false otherwise."""
-        return self._timeline.SetStartTimecode(timecode)
+        return self._object.SetStartTimecode(timecode)
 
     @minimum_resolve_version("18.0.0")
     def get_start_timecode(self) -> str:
         """Returns the start timecode for the timeline."""
-        return self._timeline.GetStartTimecode()
+        return self._object.GetStartTimecode()
 
     @minimum_resolve_version("18.0.0")
     def insert_fusion_composition_into_timeline(self) -> TimelineItem:
         """Inserts a Fusion composition into the timeline.Returns a TimelineItem object."""
-        return TimelineItem(self._timeline.InsertFusionCompositionIntoTimeline())
+        return TimelineItem(
+            self._object.InsertFusionCompositionIntoTimeline(), self._context
+        )
 
     @minimum_resolve_version("18.0.0")
     def get_unique_id(self) -> str:
         """Returns a unique ID for the timeline"""
-        return self._timeline.GetUniqueId()
+        return self._object.GetUniqueId()
 
     ##############################################################################################################################
     # Add at DR18.5.0
@@ -450,9 +554,9 @@ class Timeline(WrapperBase):
             bool: True if successful, False otherwise.
         """
         if isinstance(track_options, OptionalSubTrackType):
-            return self._timeline.AddTrack(track_type.value, track_options.value)
+            return self._object.AddTrack(track_type.value, track_options.value)
         elif isinstance(track_options, dict):
-            return self._timeline.AddTrack(track_type.value, track_options)
+            return self._object.AddTrack(track_type.value, track_options)
 
     @minimum_resolve_version("18.5.0")
     def delete_track(self, track_type: TrackType, track_index: int) -> bool:
@@ -466,7 +570,7 @@ class Timeline(WrapperBase):
         Returns:
             bool: True if successful, False otherwise.
         """
-        return self._timeline.DeleteTrack(track_type.value, track_index)
+        return self._object.DeleteTrack(track_type.value, track_index)
 
     @minimum_resolve_version("18.5.0")
     def set_track_enable(
@@ -484,7 +588,7 @@ class Timeline(WrapperBase):
         Returns:
             bool: True if successful, False otherwise.
         """
-        return self._timeline.SetTrackEnable(track_type.value, track_index, is_enable)
+        return self._object.SetTrackEnable(track_type.value, track_index, is_enable)
 
     @minimum_resolve_version("18.5.0")
     def get_is_track_enabled(self, track_type, track_index) -> bool:
@@ -497,7 +601,7 @@ class Timeline(WrapperBase):
         Returns:
             bool: Returns True if track with given trackType and trackIndex is enabled and False otherwise.
         """
-        return self._timeline.GetIsTrackEnabled(track_type, track_index)
+        return self._object.GetIsTrackEnabled(track_type, track_index)
 
     @minimum_resolve_version("18.5.0")
     def set_track_lock(
@@ -513,7 +617,7 @@ class Timeline(WrapperBase):
         Returns:
             bool: True if successful, False otherwise.
         """
-        return self._timeline.SetTrackLock(track_type, track_index, is_locked)
+        return self._object.SetTrackLock(track_type, track_index, is_locked)
 
     @minimum_resolve_version("18.5.0")
     def get_is_track_locked(self, track_type: TrackType, track_index: int) -> bool:
@@ -527,7 +631,7 @@ class Timeline(WrapperBase):
         Returns:
             bool: Returns True if track with given trackType and trackIndex is locked and False otherwise.
         """
-        return self._timeline.GetIsTrackLocked(track_type, track_index)
+        return self._object.GetIsTrackLocked(track_type, track_index)
 
     @minimum_resolve_version("18.5.0")
     def delete_clips(
@@ -542,8 +646,8 @@ class Timeline(WrapperBase):
         Returns:
             bool: True if successful, False otherwise.
         """
-        return self._timeline.DeleteClips(
-            [timeline_item._timeline_item for timeline_item in timeline_items],
+        return self._object.DeleteClips(
+            [timeline_item._object for timeline_item in timeline_items],
             ripple_delete,
         )
 
@@ -560,8 +664,8 @@ class Timeline(WrapperBase):
         Returns:
             bool: True if successful, False otherwise.
         """
-        return self._timeline.SetClipsLinked(
-            [timeline_item._timeline_item for timeline_item in timeline_items],
+        return self._object.SetClipsLinked(
+            [timeline_item._object for timeline_item in timeline_items],
             is_linked,
         )
 
@@ -582,7 +686,7 @@ class Timeline(WrapperBase):
         Version:
             Modified in DaVinci Resolve 18.6.4
         """
-        return self._timeline.CreateSubtitlesFromAudio(
+        return self._object.CreateSubtitlesFromAudio(
             auto_caption_settings.model_dump()
         )
 
@@ -593,7 +697,7 @@ class Timeline(WrapperBase):
         Returns:
             bool: Returns True if successful, False otherwise.
         """
-        return self._timeline.DetectSceneCuts()
+        return self._object.DetectSceneCuts()
 
     ##############################################################################################################################
     # Add at DR18.6.4
@@ -604,7 +708,7 @@ class Timeline(WrapperBase):
         Returns:
             bool: Returns True if successful; False otherwise.
         """
-        return self._timeline.ConvertTimelineToStereo()
+        return self._object.ConvertTimelineToStereo()
 
     ##############################################################################################################################
     # Add at DR 19.0.0
@@ -622,7 +726,7 @@ class Timeline(WrapperBase):
         Version:
             Added in DaVinci Resolve 19.0.0
         """
-        return Graph(self._timeline.GetNodeGraph())
+        return Graph(self._object.GetNodeGraph(), self._context)
 
     @requires_resolve_version(added_in="19.0.0")
     def analyze_dolby_vision(
@@ -637,7 +741,7 @@ class Timeline(WrapperBase):
         Returns:
             bool: Returns True if analysis start is successful; False otherwise.
         """
-        return self._timeline.AnalyzeDolbyVision(timeline_item_list, analysis_type)
+        return self._object.AnalyzeDolbyVision(timeline_item_list, analysis_type)
 
     ##############################################################################################################################
     # Add at DR 19.0.1
@@ -658,7 +762,7 @@ class Timeline(WrapperBase):
         Version:
             Added in DaVinci Resolve 19.0.1
         """
-        return self._timeline.GetTrackSubType(track_type, track_index)
+        return self._object.GetTrackSubType(track_type, track_index)
 
     ##############################################################################################################################
     # Add at DR 19.1.0
@@ -674,7 +778,7 @@ class Timeline(WrapperBase):
         Version:
             Added in DaVinci Resolve 19.1.0
         """
-        return MediaPoolItem(self._timeline.GetMediaPoolItem())
+        return MediaPoolItem._wrap(self._object.GetMediaPoolItem(), self._context)
 
     @requires_resolve_version(added_in="19.1.0")
     def get_mark_in_out(self) -> dict:
@@ -688,7 +792,7 @@ class Timeline(WrapperBase):
                 }
                 Keys are omitted if marks are not set.
         """
-        return self._timeline.GetMarkInOut()
+        return self._object.GetMarkInOut()
 
     @requires_resolve_version(added_in="19.1.0")
     def set_mark_in_out(
@@ -704,7 +808,7 @@ class Timeline(WrapperBase):
         Returns:
             bool: True if successful, False otherwise
         """
-        return self._timeline.SetMarkInOut(mark_in, mark_out, mark_type)
+        return self._object.SetMarkInOut(mark_in, mark_out, mark_type)
 
     @requires_resolve_version(added_in="19.1.0")
     def clear_mark_in_out(self, mark_type: str = "all") -> bool:
@@ -716,7 +820,7 @@ class Timeline(WrapperBase):
         Returns:
             bool: True if successful, False otherwise
         """
-        return self._timeline.ClearMarkInOut(mark_type)
+        return self._object.ClearMarkInOut(mark_type)
 
     ##############################################################################################################################
     # Add at DR 20.1.0
@@ -738,7 +842,7 @@ class Timeline(WrapperBase):
         Version:
             Added in DaVinci Resolve 20.1.0
         """
-        return self._timeline.GetVoiceIsolationState(track_index)
+        return self._object.GetVoiceIsolationState(track_index)
 
     @requires_resolve_version(added_in="20.1.0")
     def set_voice_isolation_state(
@@ -760,4 +864,4 @@ class Timeline(WrapperBase):
         Version:
             Added in DaVinci Resolve 20.1.0
         """
-        return self._timeline.SetVoiceIsolationState(track_index, voice_isolation_state)
+        return self._object.SetVoiceIsolationState(track_index, voice_isolation_state)
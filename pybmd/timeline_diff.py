@@ -0,0 +1,349 @@
+"""Diff of a timeline against a target cut, as a minimal mutation plan.
+
+Conforming a new cut onto a graded timeline by rebuilding it is slow and
+loses the grades. `diff_timeline` compares a TimelineSnapshot of the
+existing timeline with the target, given as another TimelineSnapshot or as an
+EDL/OTIO-like list of ClipSpec, and returns a TimelinePlan holding only the
+operations needed to get there:
+
+* ``Timeline.delete_clips`` for items not in the target,
+* ``MediaPool.append_to_timeline`` with ClipInfo for target clips not on the timeline,
+* ``TimelineItem.set_property`` for kept items whose properties differ,
+* ``Timeline.add_marker`` / ``Timeline.delete_marker_at_frame`` for changed markers.
+
+Items are matched by track, record frame, media id and source range. Items
+whose media and source range match but which sit elsewhere in the target
+cannot be moved through the scripting API; they are deleted and appended
+again and listed in `TimelinePlan.relocated`, since their grades do not
+survive. Everything else matched keeps its grade.
+
+Source ranges are ``[source_start, source_end)`` in source frames, as
+returned by ``GetSourceStartFrame()`` / ``GetSourceEndFrame()``; before
+DR 19.0.2 the snapshot falls back to the left offset and duration.
+
+Example:
+    >>> target = [ClipSpec("3f2c...", 100, 148, record_frame=86400), ...]
+    >>> plan = timeline.diff(TimelineSpec(target, markers={0.0: {"color": "Red", ...}}))
+    >>> print(plan.summary())
+    >>> plan.apply(project, timeline, MediaPoolIndex(project.get_media_pool()))
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from pybmd.media_pool import ClipInfo
+from pybmd.media_pool_item import MediaPoolItem
+from pybmd.timeline_snapshot import TimelineSnapshot
+
+if TYPE_CHECKING:
+    from pybmd.project import Project
+    from pybmd.timeline import Timeline
+    from pybmd.timeline_item import TimelineItem
+
+# ClipInfo mediaType per track type
+MEDIA_TYPES = {"video": 1, "audio": 2}
+
+
+@dataclass
+class ClipSpec:
+    """One item of the target cut.
+
+    Args:
+        media_pool_item_id (str): unique id (``GetUniqueId()``) of the media pool item
+        source_start (int): first source frame
+        source_end (int): source frame after the last one
+        record_frame (int): timeline frame of the first frame, including the timeline start frame
+        track_index (int, optional): 1-based track index. Defaults to 1.
+        track_type (str, optional): "video" or "audio". Defaults to "video".
+        properties (Dict[str, Any], optional): timeline item properties to enforce, e.g. {"ZoomX": 1.2}. Defaults to {}.
+    """
+
+    media_pool_item_id: str
+    source_start: int
+    source_end: int
+    record_frame: int
+    track_index: int = 1
+    track_type: str = "video"
+    properties: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def media_key(self) -> Tuple[str, str, int, int]:
+        return (
+            self.track_type,
+            self.media_pool_item_id,
+            self.source_start,
+            self.source_end,
+        )
+
+    @property
+    def key(self) -> Tuple[str, int, int, str, int, int]:
+        return (
+            self.track_type,
+            self.track_index,
+            self.record_frame,
+            self.media_pool_item_id,
+            self.source_start,
+            self.source_end,
+        )
+
+    def to_clip_info(self, media_pool_item: MediaPoolItem) -> ClipInfo:
+        # ClipInfo endFrame is the last source frame
+        return ClipInfo(
+            media_pool_item,
+            self.source_start,
+            self.source_end - 1,
+            MEDIA_TYPES[self.track_type],
+            self.track_index,
+            self.record_frame,
+        )
+
+
+@dataclass
+class TimelineSpec:
+    """Target cut: clips and, optionally, timeline markers.
+
+    Args:
+        clips (List[ClipSpec]): target items
+        markers (Dict[float, dict], optional): timeline markers in get_markers() format. Defaults to None (markers are left alone).
+    """
+
+    clips: List[ClipSpec]
+    markers: Optional[Dict[float, dict]] = None
+
+    @classmethod
+    def from_snapshot(
+        cls, snapshot: TimelineSnapshot, markers: Optional[Dict[float, dict]] = None
+    ) -> "TimelineSpec":
+        """Describes the video and audio items of a snapshot, e.g. of the new cut."""
+        return cls([spec for spec, _ in _snapshot_specs(snapshot)], markers)
+
+
+@dataclass
+class PropertyChange:
+    item: "TimelineItem"
+    property_key: str
+    value: Any
+    previous: Any = None
+
+
+@dataclass
+class MarkerChange:
+    frame: float
+    info: Dict[str, Any]
+
+
+@dataclass
+class TimelinePlan:
+    """Operations turning a timeline into the target cut, see diff_timeline."""
+
+    delete: List["TimelineItem"] = field(default_factory=list)
+    append: List[ClipSpec] = field(default_factory=list)
+    set_properties: List[PropertyChange] = field(default_factory=list)
+    delete_markers: List[float] = field(default_factory=list)
+    add_markers: List[MarkerChange] = field(default_factory=list)
+    kept: List[Tuple["TimelineItem", ClipSpec]] = field(default_factory=list)
+    relocated: List[Tuple["TimelineItem", ClipSpec]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Number of operations, kept items excluded."""
+        return (
+            len(self.delete)
+            + len(self.append)
+            + len(self.set_properties)
+            + len(self.delete_markers)
+            + len(self.add_markers)
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self) == 0
+
+    def summary(self) -> str:
+        return (
+            f"keep {len(self.kept)}, delete {len(self.delete)}, append {len(self.append)} "
+            f"({len(self.relocated)} relocated), set {len(self.set_properties)} properties, "
+            f"delete {len(self.delete_markers)} / add {len(self.add_markers)} markers"
+        )
+
+    def apply(
+        self,
+        project: "Project",
+        timeline: "Timeline",
+        media_pool_items: Mapping[str, MediaPoolItem],
+    ) -> List["TimelineItem"]:
+        """Runs the plan: one delete_clips call, one append_to_timeline call, then properties and markers.
+
+        Args:
+            project (Project): project of the timeline
+            timeline (Timeline): timeline the plan was made for, made the current timeline to append to it
+            media_pool_items (Mapping[str, MediaPoolItem]): media pool items by unique id, e.g. a MediaPoolIndex or a dict
+
+        Raises:
+            KeyError: a clip to append is not in media_pool_items.
+            RuntimeError: deleting or appending failed.
+
+        Returns:
+            List[TimelineItem]: appended timeline items
+        """
+        clips = []
+        for spec in self.append:
+            media_pool_item = media_pool_items.get(spec.media_pool_item_id)
+            if media_pool_item is None:
+                raise KeyError(f"Media pool item {spec.media_pool_item_id!r} not found")
+            clips.append(spec.to_clip_info(media_pool_item))
+
+        if self.delete and not timeline.delete_clips(self.delete):
+            raise RuntimeError(f"Failed to delete {len(self.delete)} timeline items")
+        for frame in self.delete_markers:
+            timeline.delete_marker_at_frame(frame)
+
+        appended: List["TimelineItem"] = []
+        if clips:
+            # AppendToTimeline appends to the current timeline
+            project.set_current_timeline(timeline)
+            appended = project.get_media_pool().append_to_timeline(clips)
+            if len(appended) != len(clips):
+                raise RuntimeError(
+                    f"Appended {len(appended)} of {len(clips)} clips to the timeline"
+                )
+            for item, spec in zip(appended, self.append):
+                for property_key, value in spec.properties.items():
+                    item.set_property(property_key, value)
+
+        for change in self.set_properties:
+            change.item.set_property(change.property_key, change.value)
+        for change in self.add_markers:
+            info = change.info
+            timeline.add_marker(
+                change.frame,
+                info.get("color", "Blue"),
+                info.get("name", ""),
+                info.get("note", ""),
+                info.get("duration", 1),
+                info.get("customData", ""),
+            )
+        return appended
+
+
+def _snapshot_specs(
+    snapshot: TimelineSnapshot,
+) -> List[Tuple[ClipSpec, "TimelineItem"]]:
+    rows = np.flatnonzero(np.isin(snapshot["track_type"], list(MEDIA_TYPES)))
+    source_start = snapshot["source_start"]
+    source_end = snapshot["source_end"]
+    # no source range before DR 19.0.2, the left offset starts the source range
+    missing = np.isnan(source_start)
+    source_start = np.where(missing, snapshot["left_offset"], source_start)
+    source_end = np.where(
+        missing, snapshot["left_offset"] + snapshot["duration"], source_end
+    )
+    return [
+        (
+            ClipSpec(
+                str(snapshot["media_pool_item_id"][row]),
+                int(round(source_start[row])),
+                int(round(source_end[row])),
+                int(round(snapshot["start"][row])),
+                int(snapshot["track_index"][row]),
+                str(snapshot["track_type"][row]),
+            ),
+            snapshot.items[row],
+        )
+        for row in rows
+    ]
+
+
+def _marker_info(info: dict) -> dict:
+    return {
+        "color": info.get("color", ""),
+        "name": info.get("name", ""),
+        "note": info.get("note", ""),
+        "duration": float(info.get("duration", 1)),
+        "customData": info.get("customData", ""),
+    }
+
+
+def diff_timeline(
+    current: TimelineSnapshot,
+    target: Union[TimelineSnapshot, TimelineSpec, Iterable[ClipSpec]],
+    current_markers: Optional[Dict[float, dict]] = None,
+) -> TimelinePlan:
+    """Computes the operations turning the current timeline into target.
+
+    Args:
+        current (TimelineSnapshot): snapshot of the timeline to conform
+        target (TimelineSnapshot | TimelineSpec | Iterable[ClipSpec]): target cut
+        current_markers (Dict[float, dict], optional): get_markers() of the timeline, needed when target has markers. Defaults to None.
+
+    Returns:
+        TimelinePlan: operations, matched items in plan.kept
+    """
+    if isinstance(target, TimelineSnapshot):
+        target = TimelineSpec.from_snapshot(target)
+    elif not isinstance(target, TimelineSpec):
+        target = TimelineSpec(list(target))
+
+    plan = TimelinePlan()
+    existing: Dict[tuple, List["TimelineItem"]] = defaultdict(list)
+    for spec, item in _snapshot_specs(current):
+        existing[spec.key].append(item)
+
+    unmatched: List[ClipSpec] = []
+    for spec in target.clips:
+        items = existing.get(spec.key)
+        if items:
+            plan.kept.append((items.pop(0), spec))
+        else:
+            unmatched.append(spec)
+
+    # whatever is left on the timeline goes; same media elsewhere is a relocation
+    leftover: Dict[tuple, List["TimelineItem"]] = defaultdict(list)
+    for key, items in existing.items():
+        plan.delete.extend(items)
+        leftover[(key[0],) + key[3:]].extend(items)
+    for spec in unmatched:
+        items = leftover.get(spec.media_key)
+        if items:
+            plan.relocated.append((items.pop(0), spec))
+        plan.append.append(spec)
+
+    for item, spec in plan.kept:
+        if not spec.properties:
+            continue
+        properties = item.get_property() or {}
+        for property_key, value in spec.properties.items():
+            if properties.get(property_key) != value:
+                plan.set_properties.append(
+                    PropertyChange(
+                        item, property_key, value, properties.get(property_key)
+                    )
+                )
+
+    if target.markers is not None:
+        current_markers = {
+            float(frame): _marker_info(info)
+            for frame, info in (current_markers or {}).items()
+        }
+        target_markers = {
+            float(frame): _marker_info(info) for frame, info in target.markers.items()
+        }
+        for frame, info in current_markers.items():
+            if target_markers.get(frame) != info:
+                plan.delete_markers.append(frame)
+        for frame, info in target_markers.items():
+            if current_markers.get(frame) != info:
+                plan.add_markers.append(MarkerChange(frame, info))
+    return plan
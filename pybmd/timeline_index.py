@@ -0,0 +1,122 @@
+"""Name index of the timelines of a project.
+
+Finding a timeline by name through the scripting API means fetching and
+naming every timeline of the project. TimelineIndex does that once and then
+answers lookups from a dictionary. Each hit is confirmed with one
+``GetName()`` call.
+
+`Project.get_timeline_index` keeps one index per project on the connection,
+shared by every wrapper of the project. The index is rebuilt on the next
+lookup after pybmd creates, duplicates, imports, renames or deletes a
+timeline through any wrapper of the same connection. For edits made in the
+Resolve UI, a miss triggers one ``GetTimelineCount()`` call and the index is
+rebuilt when the count changed. Call `refresh` after other external changes.
+
+Example:
+    >>> timeline = project.get_timeline_by_name("Reel 3 Conform")
+    >>> timelines = project.get_timelines_by_name(["Reel 1", "Reel 2", "Reel 3"])
+"""
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from pybmd.project import Project
+    from pybmd.timeline import Timeline
+
+
+class TimelineIndex(object):
+    """Timelines of a project by name and unique id.
+
+    Args:
+        project (Project): project whose timelines are indexed
+    """
+
+    def __init__(self, project: "Project"):
+        self._project = project
+        self._generation: Optional[int] = None
+        self._timelines: List["Timeline"] = []
+        self._by_name: Dict[str, List[int]] = {}
+        self._by_unique_id: Dict[str, int] = {}
+        self._unique_ids: List[str] = []
+
+    def _connection_generation(self) -> int:
+        context = self._project._context
+        return context.timeline_generation if context is not None else 0
+
+    def refresh(self):
+        """Re-reads the name and unique id of every timeline of the project."""
+        generation = self._connection_generation()
+        project = self._project
+        self._timelines = [
+            project.get_timeline_by_index(index)
+            for index in range(1, project.get_timeline_count() + 1)
+        ]
+        self._by_name = {}
+        self._unique_ids = [timeline.get_unique_id() for timeline in self._timelines]
+        self._by_unique_id = {
+            unique_id: position for position, unique_id in enumerate(self._unique_ids)
+        }
+        for position, timeline in enumerate(self._timelines):
+            self._by_name.setdefault(timeline.get_name(), []).append(position)
+        self._generation = generation
+
+    def _ensure_current(self):
+        if self._generation != self._connection_generation():
+            self.refresh()
+
+    def _lookup(self, name: str) -> List["Timeline"]:
+        matches = [
+            self._timelines[position] for position in self._by_name.get(name, ())
+        ]
+        if not matches:
+            if self._project.get_timeline_count() != len(self._timelines):
+                self.refresh()
+                return [
+                    self._timelines[position]
+                    for position in self._by_name.get(name, ())
+                ]
+            return []
+        if all(timeline.get_name() == name for timeline in matches):
+            return matches
+        # renamed outside pybmd since the index was built
+        self.refresh()
+        return [self._timelines[position] for position in self._by_name.get(name, ())]
+
+    def find(self, name: str) -> List["Timeline"]:
+        """Returns every timeline named name, in project order."""
+        self._ensure_current()
+        return self._lookup(name)
+
+    def find_many(self, names: Iterable[str]) -> Dict[str, List["Timeline"]]:
+        """Returns the timelines named like each of names."""
+        self._ensure_current()
+        return {name: self._lookup(name) for name in names}
+
+    def get_by_unique_id(self, unique_id: str) -> Optional["Timeline"]:
+        """Returns the timeline with unique_id, None if the index has none."""
+        self._ensure_current()
+        position = self._by_unique_id.get(unique_id)
+        return None if position is None else self._timelines[position]
+
+    def get_unique_id(self, name: str) -> Optional[str]:
+        """Returns the unique id of the timeline named name, None if there is none."""
+        self._ensure_current()
+        if not self._lookup(name):
+            return None
+        return self._unique_ids[self._by_name[name][0]]
+
+    def get_index(self, name: str) -> Optional[int]:
+        """Returns the 1-based project index of the first timeline named name, None if there is none."""
+        self._ensure_current()
+        if not self._lookup(name):
+            return None
+        return self._by_name[name][0] + 1
+
+    def names(self) -> List[str]:
+        """Returns the names of all timelines."""
+        self._ensure_current()
+        return list(self._by_name)
+
+    def __len__(self) -> int:
+        self._ensure_current()
+        return len(self._timelines)
@@ -11,6 +11,7 @@ from pybmd.decorators import requires_resolve_version, minimum_resolve_version
 
 from pybmd.fusion_comp import FusionComp
 from pybmd.graph import Graph
+from pybmd.marker_store import MarkerStore
 from pybmd.media_pool_item import MediaPoolItem
 
 from enum import Enum
@@ -46,27 +47,41 @@ class MagicMask_Mode:
 class TimelineItem(WrapperBase):
     """TimelineItem Object"""
 
-    def __init__(self, timeline_item):
-        super(TimelineItem, self).__init__(timeline_item)
-        self._timeline_item = self._object
+    __slots__ = ("_marker_store",)
+    _timeline_item = WrapperBase._handle_alias
+
+    _intern_id_api = "GetUniqueId"
+
+    def __init__(self, timeline_item, context=None):
+        super(TimelineItem, self).__init__(timeline_item, context)
+        self._marker_store: MarkerStore | None = None
 
     def __repr__(self) -> str:
         return f"Timeline Item: {self.get_name()}"
 
+    def get_marker_store(self) -> MarkerStore:
+        """Returns the interval index of the markers, read on first use.
+
+        Markers changed through this wrapper are applied to it, call MarkerStore.refresh() after changes made elsewhere.
+        """
+        if self._marker_store is None:
+            self._marker_store = MarkerStore(self)
+        return self._marker_store
+
     def get_markers(self) -> dict:
         """Returns a dict (frameId -> {information}) of all markers and dicts with their information.
         Example: a value of {96.0: {'color': 'Green', 'duration': 1.0, 'note': '', 'name': 'Marker 1', 'customData': ''}, ...}
         indicates a single green marker at clip offset 96
         """
-        return self._timeline_item.GetMarkers()
+        return self._object.GetMarkers()
 
     def add_flag(self, color: str) -> bool:
         """Adds a flag with given color (string)."""
-        return self._timeline_item.AddFlag(color)
+        return self._object.AddFlag(color)
 
     def add_fusion_comp(self) -> "FusionComp":
         """Adds a new Fusion composition associated with the timeline item."""
-        return FusionComp(self._timeline_item.AddFusionComp())
+        return FusionComp(self._object.AddFusionComp(), self._context)
 
     def add_marker(
         self,
@@ -90,9 +105,14 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: True if successful, False otherwise.
         """
-        return self._timeline_item.AddMarker(
+        result = self._object.AddMarker(
             frame_id, color, name, note, duration, custom_data
         )
+        if result and self._marker_store is not None:
+            self._marker_store._marker_added(
+                frame_id, color, name, note, duration, custom_data
+            )
+        return result
 
     def add_take(
         self, media_pool_item: MediaPoolItem, start_frame: int, end_frame: int
@@ -107,8 +127,8 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: True if successful, False otherwise.
         """
-        return self._timeline_item.AddTake(
-            media_pool_item._media_pool_item, start_frame, end_frame
+        return self._object.AddTake(
+            media_pool_item._object, start_frame, end_frame
         )
 
     def add_version(self, version_name: str, version_type: VersionType) -> bool:
@@ -121,15 +141,15 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: True if successful, False otherwise.
         """
-        return self._timeline_item.AddVersion(version_name, version_type.value)
+        return self._object.AddVersion(version_name, version_type.value)
 
     def clear_clip_color(self) -> bool:
         """Clears the item color."""
-        return self._timeline_item.ClearClipColor()
+        return self._object.ClearClipColor()
 
     def clear_flags(self, color) -> bool:
         """Clears all flags of a given color.if color is empty, all flags are cleared."""
-        return self._timeline_item.ClearFlags(color)
+        return self._object.ClearFlags(color)
 
     def copy_grades(self, target_timeline_items: List["TimelineItem"]) -> bool:
         """
@@ -138,31 +158,40 @@ class TimelineItem(WrapperBase):
         """
         timeline_item_list = []
         for timeline_item in target_timeline_items:
-            timeline_item_list.append(timeline_item._timeline_item)
-        return self._timeline_item.CopyGrades(timeline_item_list)
+            timeline_item_list.append(timeline_item._object)
+        return self._object.CopyGrades(timeline_item_list)
 
     def delete_fusion_comp_by_name(self, comp_name: str) -> bool:
         """Deletes the named Fusion composition."""
-        return self._timeline_item.DeleteFusionCompByName(comp_name)
+        return self._object.DeleteFusionCompByName(comp_name)
 
     def delete_marker_at_frame(self, frame_num: int) -> bool:
         """Delete marker at frame_num from the timeline item."""
-        return self._timeline_item.DeleteMarkerAtFrame(frame_num)
+        result = self._object.DeleteMarkerAtFrame(frame_num)
+        if result and self._marker_store is not None:
+            self._marker_store._marker_deleted_at(frame_num)
+        return result
 
     def delete_marker_by_custom_data(self, custom_data) -> bool:
         """Delete first matching marker with specified customData."""
-        return self._timeline_item.DeleteMarkerByCustomData(custom_data)
+        result = self._object.DeleteMarkerByCustomData(custom_data)
+        if result and self._marker_store is not None:
+            self._marker_store._marker_deleted_by_custom_data(custom_data)
+        return result
 
     def delete_marker_by_color(self, color: str) -> bool:
         """
         Delete all markers of the specified color from the timeline item.
         "All" as argument deletes all color markers.
         """
-        return self._timeline_item.DeleteMarkerByColor(color)
+        result = self._object.DeleteMarkerByColor(color)
+        if result and self._marker_store is not None:
+            self._marker_store._markers_deleted_by_color(color)
+        return result
 
     def delete_take_by_index(self, index: int) -> bool:
         """Deletes a take by index, 1 <= idx <= number of takes."""
-        return self._timeline_item.DeleteTakeByIndex(index)
+        return self._object.DeleteTakeByIndex(index)
 
     def delete_version_by_name(
         self, version_name: str, version_type: VersionType
@@ -176,69 +205,69 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: true if successful, false otherwise.
         """
-        return self._timeline_item.DeleteVersionByName(version_name, version_type.value)
+        return self._object.DeleteVersionByName(version_name, version_type.value)
 
     def export_fusion_comp(self, path: str, comp_index: int) -> bool:
         """Exports the Fusion composition based on given compIndex to the path provided."""
-        return self._timeline_item.ExportFusionComp(str(path), comp_index)
+        return self._object.ExportFusionComp(str(path), comp_index)
 
     def finalize_take(self) -> bool:
         """Finalizes take selection."""
-        return self._timeline_item.FinalizeTake()
+        return self._object.FinalizeTake()
 
     def get_clip_color(self) -> str:
         """Returns the item color."""
-        return self._timeline_item.GetClipColor()
+        return self._object.GetClipColor()
 
     def get_current_version(self) -> dict:
         """returns the current version of the timeline item"""
-        return self._timeline_item.GetCurrentVersion()
+        return self._object.GetCurrentVersion()
 
     def get_duration(self, subframe_precision: bool = False) -> int | float:
         # Change at 19.0.2
         """Returns the item duration."""
-        return self._timeline_item.GetDuration(subframe_precision)
+        return self._object.GetDuration(subframe_precision)
 
     def get_end(self, subframe_precision: bool = False) -> int | float:
         # Change at 19.0.2
         """Returns the end frame position on the timeline."""
-        return self._timeline_item.GetEnd(subframe_precision)
+        return self._object.GetEnd(subframe_precision)
 
     def get_flag_list(self) -> list:
         """Returns the end frame position on the timeline."""
-        return self._timeline_item.GetFlagList()
+        return self._object.GetFlagList()
 
     def get_fusion_comp_by_index(self, comp_index: int) -> "FusionComp":
         """
         Returns the Fusion composition object based on given compIndex.
         1 <= compIndex <= timelineItem.get_fusion_comp_count()
         """
-        return FusionComp(self._timeline_item.GetFusionCompByIndex(comp_index))
+        return FusionComp(self._object.GetFusionCompByIndex(comp_index), self._context)
 
     def get_fusion_comp_by_name(self, comp_name: str) -> "FusionComp":
         """Returns the Fusion composition object based on given comp_name."""
-        return FusionComp(self._timeline_item.GetFusionCompByName(comp_name))
+        return FusionComp(self._object.GetFusionCompByName(comp_name), self._context)
 
     def get_fusion_comp_count(self) -> int:
         """Returns number of Fusion compositions associated with the timeline item."""
-        return self._timeline_item.GetFusionCompCount()
+        return self._object.GetFusionCompCount()
 
     def get_fusion_comp_name_list(self) -> list:
         """Returns a list of Fusion composition names associated with the timeline item."""
-        return self._timeline_item.GetFusionCompNameList()
+        return self._object.GetFusionCompNameList()
 
     def get_left_offset(self, subframe_precision: bool = False) -> int | float:
         ### Change at 19.0.2
         """Returns the maximum extension by frame for clip from left side."""
-        return self._timeline_item.GetLeftOffset(subframe_precision)
+        return self._object.GetLeftOffset(subframe_precision)
 
     def get_marker_by_custom_data(self, custom_data: str) -> dict:
         """Returns marker {information} for the first matching marker with specified customData."""
-        return self._timeline_item.GetMarkerByCustomData(custom_data)
+        return self._object.GetMarkerByCustomData(custom_data)
 
     def get_marker_custom_data(self, frame_id: int) -> str:
         """Returns customData string for the marker at given frameId position."""
-        return self._timeline_item.GetMarkerCustomData(frame_id)
+        return self._object.GetMarkerCustomData(frame_id)
 
     def get_media_pool_item(self) -> "MediaPoolItem":
         """Returns the media pool item corresponding to the timeline item if one exists.
@@ -246,11 +275,11 @@ class TimelineItem(WrapperBase):
         Returns:
             MediaPoolItem: media pool item object
         """
-        return MediaPoolItem(self._timeline_item.GetMediaPoolItem())
+        return MediaPoolItem._wrap(self._object.GetMediaPoolItem(), self._context)
 
     def get_name(self) -> str:
         """Returns the item name."""
-        return self._timeline_item.GetName()
+        return self._object.GetName()
 
     @requires_resolve_version(added_in="20.2.0")
     def set_name(self, name: str) -> bool:
@@ -268,50 +297,50 @@ class TimelineItem(WrapperBase):
         Version:
             Added in DaVinci Resolve 20.2.0
         """
-        return self._timeline_item.SetName(name)
+        return self._object.SetName(name)
 
     def get_property(self, property_key: str | None = None):
         """returns the value of the specified key.
 
         if no key is specified, the method returns a dictionary(python) or table(lua) for all supported keys
         """
-        return self._timeline_item.GetProperty(property_key)
+        return self._object.GetProperty(property_key)
 
     def get_right_offset(self, subframe_precision: bool = False) -> int | float:
         ### Change at 19.0.2
         """Returns the maximum extension by frame for clip from right side."""
-        return self._timeline_item.GetRightOffset(subframe_precision)
+        return self._object.GetRightOffset(subframe_precision)
 
     def get_selected_take_index(self) -> int:
         """Returns the index of the currently selected take, or 0 if the clip is not a take selector."""
-        return self._timeline_item.GetSelectedTakeIndex()
+        return self._object.GetSelectedTakeIndex()
 
     def get_start(self, subframe_precision: bool = False) -> int | float:
         ### Change at 19.0.2
         """Returns the start frame position on the timeline."""
-        return self._timeline_item.GetStart(subframe_precision)
+        return self._object.GetStart(subframe_precision)
 
     def get_stereo_convergence_values(self) -> dict:
         """Returns a dict (offset -> value) of keyframe offsets and respective convergence values."""
-        return self._timeline_item.GetStereoConvergenceValues()
+        return self._object.GetStereoConvergenceValues()
 
     def get_stereo_left_floating_window_params(self) -> dict:
         """For the LEFT eye -> returns a dict (offset -> dict) of keyframe offsets and respective floating window params.
         Value at particular offset includes the left, right, top and bottom floating window values."""
-        return self._timeline_item.GetStereoLeftFloatingWindowParams()
+        return self._object.GetStereoLeftFloatingWindowParams()
 
     def get_stereo_right_floating_window_params(self) -> dict:
         """For the RIGHT eye -> returns a dict (offset -> dict) of keyframe offsets and respective floating window params.
         Value at particular offset includes the left, right, top and bottom floating window values."""
-        return self._timeline_item.GetStereoRightFloatingWindowParams()
+        return self._object.GetStereoRightFloatingWindowParams()
 
     def get_take_by_index(self, index) -> dict:
         """Returns a dict (keys "startFrame", "endFrame" and "mediaPoolItem") with take info for specified index."""
-        return self._timeline_item.GetTakeByIndex(index)
+        return self._object.GetTakeByIndex(index)
 
     def get_takes_count(self) -> int:
         """Returns the number of takes in take selector, or 0 if the clip is not a take selector."""
-        return self._timeline_item.GetTakesCount()
+        return self._object.GetTakesCount()
 
     def get_version_name_list(self, version_type: VersionType) -> list:
         """Returns a list of all color versions for the given versionType.
@@ -322,7 +351,7 @@ class TimelineItem(WrapperBase):
         Returns:
             list: list of version names
         """
-        return self._timeline_item.GetVersionNameList(version_type.value)
+        return self._object.GetVersionNameList(version_type.value)
 
     def import_fusion_comp(self, path: str) -> "FusionComp":
         """Imports a Fusion composition from given file path by creating and adding a new composition for the item.
@@ -333,11 +362,11 @@ class TimelineItem(WrapperBase):
         Returns:
             FusionComp: Fusion composition object
         """
-        return FusionComp(self._timeline_item.ImportFusionComp(str(path)))
+        return FusionComp(self._object.ImportFusionComp(str(path)), self._context)
 
     def load_fusion_comp_by_name(self, comp_name: str) -> "FusionComp":
         """Loads the named Fusion composition as the active composition."""
-        return FusionComp(self._timeline_item.LoadFusionCompByName(comp_name))
+        return FusionComp(self._object.LoadFusionCompByName(comp_name), self._context)
 
     def load_version_by_name(
         self, version_name: str, version_type: VersionType
@@ -351,23 +380,23 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: True if successful, False otherwise
         """
-        return self._timeline_item.LoadVersionByName(version_name, version_type.value)
+        return self._object.LoadVersionByName(version_name, version_type.value)
 
     def rename_fusion_comp_by_name(self, old_name: str, new_name: str) -> bool:
         """Renames the Fusion composition identified by oldName."""
-        return self._timeline_item.RenameFusionCompByName(old_name, new_name)
+        return self._object.RenameFusionCompByName(old_name, new_name)
 
     def rename_version_by_name(
         self, old_name: str, new_name: str, version_type: VersionType
     ) -> bool:
         """Renames the color version identified by oldName and versionType"""
-        return self._timeline_item.RenameVersionByName(
+        return self._object.RenameVersionByName(
             old_name, new_name, version_type.value
         )
 
     def select_take_by_index(self, index: int) -> bool:
         """Selects a take by index, 1 <= idx <= number of takes."""
-        return self._timeline_item.SelectTakeByIndex(index)
+        return self._object.SelectTakeByIndex(index)
 
     def set_cdl(self, cdl_map: CDL_Map) -> bool:
         """Sets the color correction lookup (CDL) for the timeline item.
@@ -378,11 +407,11 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: True if successful, False otherwise
         """
-        return self._timeline_item.SetCdl(asdict(cdl_map))
+        return self._object.SetCdl(asdict(cdl_map))
 
     def set_clip_color(self, color_name: str) -> bool:
         """Sets the item color based on the colorName (string)."""
-        return self._timeline_item.SetClipColor(color_name)
+        return self._object.SetClipColor(color_name)
 
     # Remove at DR 19.0.0
     @requires_resolve_version(removed_in="19.0.0")
@@ -396,7 +425,7 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: True if successful, False otherwise
         """
-        return self._timeline_item.SetLUT(node_index, str(lutpath))
+        return self._object.SetLUT(node_index, str(lutpath))
 
     ####################################################################################################################
     # add in davinci resolve 17.4.6
@@ -404,7 +433,7 @@ class TimelineItem(WrapperBase):
     @requires_resolve_version(added_in="17.4.6", removed_in="19.0.0")
     def get_num_node(self) -> int:
         """Returns the number of nodes in the current graph for the timeline item"""
-        return self._timeline_item.GetNumNode()
+        return self._object.GetNumNode()
 
     @requires_resolve_version(added_in="17.4.6", removed_in="19.0.0")
     def get_lut(self, node_index: int) -> str:
@@ -416,7 +445,7 @@ class TimelineItem(WrapperBase):
         Returns:
             str: lut path
         """
-        return self._timeline_item.GetLUT(node_index)
+        return self._object.GetLUT(node_index)
 
     ##########################################################################################################################
     # Add at DR18.0.0
@@ -424,12 +453,12 @@ class TimelineItem(WrapperBase):
     @requires_resolve_version(added_in="18.0.0")
     def update_sidecar(self) -> bool:
         """Updates sidecar file for BRAW clips or RMD file for R3D clips."""
-        return self._timeline_item.UpdateSidecar()
+        return self._object.UpdateSidecar()
 
     @requires_resolve_version(added_in="18.0.0")
     def get_unique_id(self) -> str:
         """Returns a unique ID for the timeline item"""
-        return self._timeline_item.GetUniqueId()
+        return self._object.GetUniqueId()
 
     ##########################################################################################################################
     # Add at DR18.5.0 Beta
@@ -442,7 +471,7 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: Returns True if successful, False otherwise.
         """
-        return self._timeline_item.ApplyArriCdlLut()
+        return self._object.ApplyArriCdlLut()
 
     @minimum_resolve_version("18.5.0")
     def set_clip_enabled(self, bool_value: bool) -> bool:
@@ -454,7 +483,7 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: True for clip is enabled
         """
-        return self._timeline_item.SetClipEnabled(bool_value)
+        return self._object.SetClipEnabled(bool_value)
 
     @minimum_resolve_version("18.5.0")
     def get_clip_enabled(self) -> bool:
@@ -463,7 +492,7 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: clip enabled status
         """
-        return self._timeline_item.GetClipEnabled()
+        return self._object.GetClipEnabled()
 
     @minimum_resolve_version("18.5.0")
     def load_burn_in_preset(self, preset_name: str) -> bool:
@@ -475,7 +504,7 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: Returns true if successful
         """
-        return self._timeline_item.LoadBurnInPreset(preset_name)
+        return self._object.LoadBurnInPreset(preset_name)
 
     # Remove at DR 19.0.0
     @requires_resolve_version(added_in="18.5.0", removed_in="19.0.0")
@@ -488,7 +517,7 @@ class TimelineItem(WrapperBase):
         Returns:
             str: node label
         """
-        return self._timeline_item.GetNodeLabel(node_index)
+        return self._object.GetNodeLabel(node_index)
 
     ##############################################################################################################################
     # Add at DR18.5.0
@@ -503,7 +532,7 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: Returns True if magic mask was created successfully, False otherwise.
         """
-        return self._timeline_item.CreateMagicMask(mode)
+        return self._object.CreateMagicMask(mode)
 
     @minimum_resolve_version("18.5.0")
     def regenerate_magic_mask(self) -> bool:
@@ -512,7 +541,7 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: Returns True if magic mask was regenerated successfully, False otherwise.
         """
-        return self._timeline_item.RegenerateMagicMask()
+        return self._object.RegenerateMagicMask()
 
     @minimum_resolve_version("18.5.0")
     def stabilize(self) -> bool:
@@ -521,7 +550,7 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: Returns True if stabilization was successful, False otherwise
         """
-        return self._timeline_item.Stabilize()
+        return self._object.Stabilize()
 
     @minimum_resolve_version("18.5.0")
     def smart_reframe(self) -> bool:
@@ -530,7 +559,7 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: _descriReturns True if successful, False otherwise.
         """
-        return self._timeline_item.SmartReframe()
+        return self._object.SmartReframe()
 
     ##############################################################################################################################
     # Add at DR 19.0.0
@@ -551,7 +580,7 @@ class TimelineItem(WrapperBase):
         Version:
             Added in DaVinci Resolve 19.0.0
         """
-        return Graph(self._timeline_item.GetNodeGraph(layer_index))
+        return Graph(self._object.GetNodeGraph(layer_index), self._context)
 
     @minimum_resolve_version("19.0.0")
     def get_color_group(self) -> "ColorGroup":
@@ -560,7 +589,7 @@ class TimelineItem(WrapperBase):
         Returns:
             ColorGroup: the clip's color group
         """
-        return ColorGroup(self._timeline_item.GetColorGroup())
+        return ColorGroup(self._object.GetColorGroup(), self._context)
 
     @minimum_resolve_version("19.0.0")
     def assign_to_color_group(self, color_group: ColorGroup) -> bool:
@@ -572,7 +601,7 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: Returns True if TiItem to successfully assigned to given ColorGroup.
         """
-        return self._timeline_item.AssignToColorGroup(color_group._object)
+        return self._object.AssignToColorGroup(color_group._object)
 
     @minimum_resolve_version("19.0.0")
     def remove_from_color_group(self) -> bool:
@@ -581,7 +610,7 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: Returns True if the TiItem is successfully removed from the ColorGroup it is in.
         """
-        return self._timeline_item.RemoveFromColorGroup()
+        return self._object.RemoveFromColorGroup()
 
     @minimum_resolve_version("19.0.0")
     def export_LUT(self, export_type: "LUT_Export_Type", export_path: str) -> bool:
@@ -595,7 +624,7 @@ class TimelineItem(WrapperBase):
             bool: Returns True if successful, False otherwise.
         """
 
-        return self._timeline_item.ExportLUT(export_type.value, export_path)
+        return self._object.ExportLUT(export_type.value, export_path)
 
     @minimum_resolve_version("19.0.0")
     def set_property(self, property_key: str, property_value) -> bool:
@@ -610,7 +639,7 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: True if successful, False otherwise
         """
-        return self._timeline_item.SetProperty(property_key, property_value)
+        return self._object.SetProperty(property_key, property_value)
 
     @minimum_resolve_version("19.0.0")
     def get_linked_items(self) -> List["TimelineItem"]:
@@ -620,8 +649,8 @@ class TimelineItem(WrapperBase):
             List[TimelineItem]: a list of linked timeline items.
         """
         timeline_item_list = list()
-        for value in self._timeline_item.GetLinkedItems():
-            timeline_item_list.append(TimelineItem(value))
+        for value in self._object.GetLinkedItems():
+            timeline_item_list.append(TimelineItem._wrap(value, self._context))
         return timeline_item_list
 
     @minimum_resolve_version("19.0.0")
@@ -632,7 +661,7 @@ class TimelineItem(WrapperBase):
             Tuple[str,int]: trackType is one of {"audio", "video", "subtitle"},1 <= trackIndex <= Timeline.GetTrackCount(trackType)
 
         """
-        return tuple(self._timeline_item.GetTrackTypeAndIndex())
+        return tuple(self._object.GetTrackTypeAndIndex())
 
     ##############################################################################################################################
     # Add at DR 19.0.1
@@ -650,7 +679,7 @@ class TimelineItem(WrapperBase):
         Version:
             Added in DaVinci Resolve 19.0.1
         """
-        return self._timeline_item.GetSourceAudioChannelMapping()
+        return self._object.GetSourceAudioChannelMapping()
 
     ##############################################################################################################################
     # Add at DR 19.0.2
@@ -668,7 +697,7 @@ class TimelineItem(WrapperBase):
         Version:
             Added in DaVinci Resolve 19.0.2
         """
-        return self._timeline_item.GetSourceEndFrame()
+        return self._object.GetSourceEndFrame()
 
     @requires_resolve_version(added_in="19.0.2")
     def get_source_end_time(self) -> float:
@@ -677,7 +706,7 @@ class TimelineItem(WrapperBase):
         Returns:
             float: end time position of the media pool clip
         """
-        return self._timeline_item.GetSourceEndTime()
+        return self._object.GetSourceEndTime()
 
     @requires_resolve_version(added_in="19.0.2")
     def get_source_start_frame(self) -> int:
@@ -686,7 +715,7 @@ class TimelineItem(WrapperBase):
         Returns:
             int: start frame position of the media pool clip
         """
-        return self._timeline_item.GetSourceStartFrame()
+        return self._object.GetSourceStartFrame()
 
     @requires_resolve_version(added_in="19.0.2")
     def get_source_start_time(self) -> float:
@@ -695,7 +724,7 @@ class TimelineItem(WrapperBase):
         Returns:
             float: start time position of the media pool clip
         """
-        return self._timeline_item.GetSourceStartTime()
+        return self._object.GetSourceStartTime()
 
     ##############################################################################################################################
     # Add at DR 19.1.0
@@ -706,7 +735,7 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: True if color output cache is enabled, False otherwise
         """
-        return self._timeline_item.GetIsColorOutputCacheEnabled()
+        return self._object.GetIsColorOutputCacheEnabled()
 
     @minimum_resolve_version("19.1.0")
     def get_fusion_output_cache_enabled(self) -> bool:
@@ -715,7 +744,7 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: True if fusion output cache is enabled or auto, False otherwise
         """
-        return self._timeline_item.GetIsFusionOutputCacheEnabled()
+        return self._object.GetIsFusionOutputCacheEnabled()
 
     @requires_resolve_version(added_in="19.1.0")
     def set_color_output_cache(self, cache_value: str) -> bool:
@@ -727,7 +756,7 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: True if successful, False otherwise
         """
-        return self._timeline_item.SetColorOutputCache(cache_value)
+        return self._object.SetColorOutputCache(cache_value)
 
     @requires_resolve_version(added_in="19.1.0")
     def set_fusion_output_cache(self, cache_value: str) -> bool:
@@ -739,7 +768,7 @@ class TimelineItem(WrapperBase):
         Returns:
             bool: True if successful, False otherwise
         """
-        return self._timeline_item.SetFusionOutputCache(cache_value)
+        return self._object.SetFusionOutputCache(cache_value)
 
     ##############################################################################################################################
     # Add at DR 20.1.0
@@ -758,7 +787,7 @@ class TimelineItem(WrapperBase):
         Version:
             Added in DaVinci Resolve 20.1.0
         """
-        return self._timeline_item.GetVoiceIsolationState()
+        return self._object.GetVoiceIsolationState()
 
     @requires_resolve_version(added_in="20.1.0")
     def set_voice_isolation_state(self, voice_isolation_state: dict) -> bool:
@@ -777,7 +806,7 @@ class TimelineItem(WrapperBase):
         Version:
             Added in DaVinci Resolve 20.1.0
         """
-        return self._timeline_item.SetVoiceIsolationState(voice_isolation_state)
+        return self._object.SetVoiceIsolationState(voice_isolation_state)
 
     ##############################################################################################################################
     # Add at DR 20.2.0
@@ -800,4 +829,4 @@ class TimelineItem(WrapperBase):
             Added in DaVinci Resolve 20.2.0
             Note: Currently non-functional due to API issues
         """
-        return self._timeline_item.ResetAllNodeColors()
+        return self._object.ResetAllNodeColors()
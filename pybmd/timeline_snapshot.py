@@ -0,0 +1,203 @@
+"""Columnar snapshot of every item of a timeline.
+
+`Timeline.snapshot()` sweeps all tracks once and materializes position,
+source range, state and identity of every timeline item into NumPy arrays,
+one row per item. Reports and QC checks then run vectorized on the arrays
+instead of issuing scattered per-item scripting calls again. ``to_pandas()``
+exports the snapshot as a DataFrame when pandas is installed.
+
+Columns:
+    track_type (str): "video", "audio" or "subtitle"
+    track_index (int): 1-based track index
+    item_index (int): 0-based position of the item in its track
+    start, end, duration (int): record frames
+    left_offset, right_offset (int): trimmed source frames
+    source_start, source_end (float): source frame range, NaN before DR 19.0.2
+    enabled (bool): clip enabled, always True before DR 18.5.0
+    clip_color (str): clip color, "" if none
+    media_pool_item_id (str): unique id (``GetUniqueId()``) of the item's media
+        pool item, not its ``GetMediaId()``, "" if none
+    name (str): item name
+
+``float`` replaces ``int`` for record and offset columns with
+``subframe_precision=True``.
+
+Example:
+    >>> snapshot = timeline.snapshot()
+    >>> disabled = snapshot.select(~snapshot["enabled"])
+    >>> gaps = snapshot["start"][1:] - snapshot["end"][:-1]
+    >>> snapshot.to_pandas().groupby("media_pool_item_id").size()
+"""
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from pybmd.error import APIVersionError
+
+if TYPE_CHECKING:
+    from pybmd.timeline import Timeline, TrackType
+    from pybmd.timeline_item import TimelineItem
+
+COLUMNS: Tuple[str, ...] = (
+    "track_type",
+    "track_index",
+    "item_index",
+    "start",
+    "end",
+    "duration",
+    "left_offset",
+    "right_offset",
+    "source_start",
+    "source_end",
+    "enabled",
+    "clip_color",
+    "media_pool_item_id",
+    "name",
+)
+
+
+class TimelineSnapshot(object):
+    """Columnar table of timeline items, one NumPy array per column.
+
+    Args:
+        columns (Dict[str, np.ndarray]): column name to array, all of the same length
+        items (np.ndarray): TimelineItem wrapper of every row
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], items: np.ndarray):
+        self._columns = columns
+        self.items = items
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return tuple(self._columns)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self._columns[column]
+
+    def __repr__(self) -> str:
+        return f"<TimelineSnapshot {len(self)} items>"
+
+    def select(self, mask) -> "TimelineSnapshot":
+        """Returns the rows selected by a boolean mask or an index array."""
+        return TimelineSnapshot(
+            {name: values[mask] for name, values in self._columns.items()},
+            self.items[mask],
+        )
+
+    def track(self, track_type: "TrackType", track_index: int) -> "TimelineSnapshot":
+        """Returns the rows of one track."""
+        return self.select(
+            (self._columns["track_type"] == track_type.value)
+            & (self._columns["track_index"] == track_index)
+        )
+
+    def to_dict(self) -> Dict[str, list]:
+        """Returns the columns as lists of Python values."""
+        return {name: values.tolist() for name, values in self._columns.items()}
+
+    def to_pandas(self, include_items: bool = False):
+        """Returns the snapshot as a pandas DataFrame.
+
+        Args:
+            include_items (bool, optional): add an "item" column with the TimelineItem wrappers. Defaults to False.
+
+        Raises:
+            ImportError: pandas is not installed.
+        """
+        try:
+            import pandas as pd
+        except ImportError as error:
+            raise ImportError(
+                "TimelineSnapshot.to_pandas() requires pandas, install it with 'pip install pandas'"
+            ) from error
+        frame = pd.DataFrame(self._columns)
+        if include_items:
+            frame["item"] = self.items
+        return frame
+
+
+def _source_range(item: "TimelineItem") -> Optional[Tuple[float, float]]:
+    try:
+        return item.get_source_start_frame(), item.get_source_end_frame()
+    except APIVersionError:
+        return None
+
+
+def _clip_enabled(item: "TimelineItem") -> Optional[bool]:
+    try:
+        return item.get_clip_enabled()
+    except APIVersionError:
+        return None
+
+
+def take_snapshot(
+    timeline: "Timeline",
+    track_types: Optional[Iterable["TrackType"]] = None,
+    subframe_precision: bool = False,
+) -> TimelineSnapshot:
+    """Sweeps every track of timeline once, see Timeline.snapshot."""
+    from pybmd.timeline import TrackType
+
+    if track_types is None:
+        track_types = (
+            TrackType.VIDEO_TRACK,
+            TrackType.AUDIO_TRACK,
+            TrackType.SUBTITLE_TRACK,
+        )
+    rows: Dict[str, list] = {name: [] for name in COLUMNS}
+    items: List["TimelineItem"] = []
+    has_source_range = has_clip_enabled = True
+    for track_type in track_types:
+        for track_index in range(1, timeline.get_track_count(track_type) + 1):
+            track_items = timeline.get_item_list_in_track(track_type, track_index)
+            for item_index, item in enumerate(track_items):
+                source_range = _source_range(item) if has_source_range else None
+                has_source_range = source_range is not None
+                enabled = _clip_enabled(item) if has_clip_enabled else None
+                has_clip_enabled = enabled is not None
+                media_pool_item = item._object.GetMediaPoolItem()
+
+                rows["track_type"].append(track_type.value)
+                rows["track_index"].append(track_index)
+                rows["item_index"].append(item_index)
+                rows["start"].append(item.get_start(subframe_precision))
+                rows["end"].append(item.get_end(subframe_precision))
+                rows["duration"].append(item.get_duration(subframe_precision))
+                rows["left_offset"].append(item.get_left_offset(subframe_precision))
+                rows["right_offset"].append(item.get_right_offset(subframe_precision))
+                rows["source_start"].append(source_range[0] if source_range else np.nan)
+                rows["source_end"].append(source_range[1] if source_range else np.nan)
+                rows["enabled"].append(True if enabled is None else enabled)
+                rows["clip_color"].append(item.get_clip_color() or "")
+                rows["media_pool_item_id"].append(
+                    media_pool_item.GetUniqueId() if media_pool_item else ""
+                )
+                rows["name"].append(item.get_name())
+                items.append(item)
+
+    frame_type = np.float64 if subframe_precision else np.int64
+    dtypes = {
+        "track_type": str,
+        "track_index": np.int32,
+        "item_index": np.int32,
+        "start": frame_type,
+        "end": frame_type,
+        "duration": frame_type,
+        "left_offset": frame_type,
+        "right_offset": frame_type,
+        "source_start": np.float64,
+        "source_end": np.float64,
+        "enabled": np.bool_,
+        "clip_color": str,
+        "media_pool_item_id": str,
+        "name": str,
+    }
+    columns = {name: np.array(rows[name], dtype=dtypes[name]) for name in COLUMNS}
+    item_array = np.empty(len(items), dtype=object)
+    item_array[:] = items
+    return TimelineSnapshot(columns, item_array)
@@ -1,19 +1,24 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 import os
 from pathlib import Path
+import statistics
 import time
 import re
-from typing import Dict, Iterable, List, Optional
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from pybmd.gallery_still import GalleryStill
 from pybmd.gallery_still_album import GalleryStillAlbum, StillFormat
 from pybmd.folder import Folder
 from pybmd.media_pool_item import MediaPoolItem
 from pybmd.project import Project
+from pybmd.still_journal import EXPORTED, FAILED, StillJournal, still_key
 from pybmd.timeline import Timeline, TrackType
+from pybmd.timeline_item import TimelineItem
 from pybmd.media_pool import MediaPool
-from dftt_timecode import DfttTimecode
+from pybmd.timecode import Timecode, get_converter
 
 
 def change_timeline_resolution(timeline: Timeline, width, height) -> bool:
@@ -54,21 +59,17 @@ def get_timeline(project: Project, timeline_name: str) -> Timeline:
         timeline_name (str): timeline name
 
     Returns:
-        Timeline: timeline object matching the name, None if not found.
-    """
-    if all_timeline := get_all_timeline(project):
-        matched_timeline = [
-            timeline
-            for timeline in all_timeline
-            if timeline.get_name() == timeline_name
-        ]
+        Timeline: timeline object matching the name.
 
-        if matched_timeline and len(matched_timeline) == 1:
-            return matched_timeline[0]
-        else:
-            raise ValueError(f"Timeline {timeline_name} multiple found.")
-    else:
+    Raises:
+        ValueError: project has no timeline, no or several timelines match the name.
+    """
+    timeline = project.get_timeline_by_name(timeline_name)
+    if timeline is not None:
+        return timeline
+    if project.get_timeline_count() == 0:
         raise ValueError("Project has no timeline.")
+    raise ValueError(f"Timeline {timeline_name} not found.")
 
 
 # TODO get_folder_by_path(check path before get ,if folder not exist,create or raise error)
@@ -109,9 +110,13 @@ def add_subfolders(media_pool: MediaPool, folder: Folder, subfolder_path: str) -
 class MarkerStill(object):
     still_obj: GalleryStill
     clip_obj: MediaPoolItem
-    marker_record_tc: DfttTimecode
-    marker_source_tc: DfttTimecode
+    marker_record_tc: Timecode
+    marker_source_tc: Timecode
     marker_info: Dict
+    # album label of the still, known once it was seen committed
+    still_label: str = ""
+    # StillJournal key, set when the manager keeps a journal
+    journal_key: str = ""
 
     def get_property(self):
         return [
@@ -126,8 +131,123 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 
+@dataclass
+class _StillExport(object):
+    """Export folder and file naming shared by the batches of one export."""
+
+    path: Path
+    file_name_template: str
+    wildcard_matches: List[str]
+    format: StillFormat
+    # target file names taken by earlier batches of the export
+    claimed_files: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class StillCommitStats(object):
+    """Observed still commit latencies of a StillCommitWaiter, in seconds.
+
+    Latencies run from the end of the grab to the poll that found the still
+    committed, so they overestimate by at most one poll interval.
+    """
+
+    latencies: List[float] = field(default_factory=list)
+    polls: int = 0
+    timeouts: int = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.latencies) if self.latencies else 0.0
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.latencies) if self.latencies else 0.0
+
+    @property
+    def max(self) -> float:
+        return max(self.latencies, default=0.0)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.count} stills committed, latency mean {self.mean * 1e3:.1f} ms, "
+            f"median {self.median * 1e3:.1f} ms, max {self.max * 1e3:.1f} ms, "
+            f"{self.polls} polls, {self.timeouts} timeouts"
+        )
+
+
+class StillCommitWaiter(object):
+    """Waits until Resolve has committed a grabbed still to its album.
+
+    GrabStill returns before the still is written to the album. Instead of
+    sleeping a fixed time after every grab, the waiter polls the still's label,
+    which stays empty until the still is committed, with exponential backoff
+    from `floor` to `max_interval`. Once latencies have been observed, the
+    first poll waits for the shortest recent one.
+
+    Args:
+        floor (float, optional): shortest sleep between polls. Defaults to 0.005.
+        max_interval (float, optional): longest sleep between polls. Defaults to 0.25.
+        timeout (float, optional): seconds to wait for one still. Defaults to 5.0.
+        backoff (float, optional): growth factor of the sleep between polls. Defaults to 2.0.
+    """
+
+    _RECENT = 16
+
+    def __init__(
+        self,
+        floor: float = 0.005,
+        max_interval: float = 0.25,
+        timeout: float = 5.0,
+        backoff: float = 2.0,
+    ):
+        self.floor = floor
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self.backoff = backoff
+        self.stats = StillCommitStats()
+
+    def _first_sleep(self) -> float:
+        recent = self.stats.latencies[-self._RECENT :]
+        if len(recent) < 3:
+            return 0.0
+        expected = min(recent)
+        return min(expected, self.max_interval) if expected > self.floor else 0.0
+
+    def wait(self, album: GalleryStillAlbum, still: GalleryStill) -> str:
+        """Blocks until still is committed to album or the timeout passes.
+
+        Returns:
+            str: label of the committed still, empty if the timeout passed.
+        """
+        start = time.perf_counter()
+        interval = self.floor
+        time.sleep(self._first_sleep())
+        while True:
+            self.stats.polls += 1
+            label = album.get_label(still)
+            if label:
+                self.stats.latencies.append(time.perf_counter() - start)
+                return label
+            remaining = self.timeout - (time.perf_counter() - start)
+            if remaining <= 0:
+                self.stats.timeouts += 1
+                return ""
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, self.max_interval)
+
+
 class StillManager(object):
-    """all about stills from timeline"""
+    """all about stills from timeline
+
+    Args:
+        project (Project): project whose current timeline is used
+        timeline_framerate (int, optional): frame rate used when the timeline does not report one. Defaults to 24.
+        journal_path (str, optional): StillJournal file, e.g. next to the export folder. Reruns with the same journal reuse the manager's still album and skip grabs and exports already done. Closed by close() or at the end of a with block. Defaults to None.
+    """
 
     STILL_NAME_WILDCARD_MAPPING = {
         "file_name": "File Name",
@@ -135,7 +255,15 @@ class StillManager(object):
         "frames": "Frames",
     }
 
-    def __init__(self, project: Project, timeline_framerate=24):
+    # still_position -> Timeline.grab_all_stills still_frame_source
+    NATIVE_STILL_FRAME_SOURCES = {0.0: 1, 0.5: 2}
+
+    def __init__(
+        self,
+        project: Project,
+        timeline_framerate=24,
+        journal_path: Optional[str] = None,
+    ):
         super(StillManager, self).__init__()
         self._project: Project = project
         self._timeline: Timeline = self._project.get_current_timeline()
@@ -146,9 +274,14 @@ class StillManager(object):
         if self._gallery is None:
             raise ValueError("Project does not have an available gallery.")
 
+        self._journal = StillJournal(journal_path) if journal_path else None
+        self._journal_stills: Optional[Dict[str, GalleryStill]] = None
+
         timeline_name = self._timeline.get_name() or "Timeline"
         album_label = f"StillManager_{timeline_name}"
-        self._still_album = self._initialize_still_album(album_label)
+        self._still_album = self._initialize_still_album(
+            album_label, reuse=self._journal is not None
+        )
 
         timeline_fps_setting = self._timeline.get_setting("timelineFrameRate")
         if timeline_fps_setting:
@@ -166,6 +299,7 @@ class StillManager(object):
             bool(int(drop_frame_setting)) if drop_frame_setting else False
         )
         self.marker_still_list: List[MarkerStill] = []
+        self.still_commit = StillCommitWaiter()
 
     def __repr__(self):
         temp_list = [
@@ -173,6 +307,17 @@ class StillManager(object):
         ]
         return str(temp_list)
 
+    def __enter__(self) -> "StillManager":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Closes the still journal, if any."""
+        if self._journal is not None:
+            self._journal.close()
+
     @staticmethod
     def _clamp(value: float, minimum: float = 0.0, maximum: float = 1.0) -> float:
         return max(minimum, min(value, maximum))
@@ -213,8 +358,26 @@ class StillManager(object):
             return default
         return value
 
-    def _initialize_still_album(self, album_name: str) -> GalleryStillAlbum:
+    def _clip_start_timecode(self, clip: MediaPoolItem) -> Optional[Timecode]:
+        clip_start_tc = self._safe_clip_property(clip, "Start TC")
+        if clip_start_tc is None:
+            return None
+        clip_timecode = get_converter(
+            self._coerce_float(clip.get_clip_property("FPS"), self._timeline_framerate),
+            self._coerce_bool(clip.get_clip_property("Drop frame")),
+        )
+        return Timecode.parse(clip_start_tc, clip_timecode)
+
+    def _initialize_still_album(
+        self, album_name: str, reuse: bool = False
+    ) -> GalleryStillAlbum:
         """Create (if supported) or reuse a still album for this manager."""
+        if reuse:
+            for album in self._gallery.get_gallery_still_albums():
+                if self._gallery.get_album_name(album) == album_name:
+                    self._set_current_still_album(album)
+                    logger.info("Reusing still album %s.", album_name)
+                    return album
         create_album = getattr(self._gallery, "create_gallery_still_album", None)
         if callable(create_album):
             try:
@@ -244,6 +407,96 @@ class StillManager(object):
             raise ValueError("Project gallery does not have an active still album.")
         return fallback_album
 
+    def _after_grab(self, still: GalleryStill, grab_sleep_time: Optional[float]) -> str:
+        """Sleeps or waits for the still to be committed, returns its label if seen."""
+        if grab_sleep_time is not None:
+            if grab_sleep_time > 0:
+                time.sleep(grab_sleep_time)
+            return ""
+        label = self.still_commit.wait(self._still_album, still)
+        if not label:
+            logger.warning(
+                "Still not committed to the album after %.1f s.",
+                self.still_commit.timeout,
+            )
+        return label
+
+    def _album_stills(self) -> Dict[str, GalleryStill]:
+        """Stills of the album by label, read once to resume journaled grabs."""
+        if self._journal_stills is None:
+            self._journal_stills = {
+                self._still_album.get_label(still): still
+                for still in self._still_album.get_stills()
+            }
+        return self._journal_stills
+
+    def _resume_grab(self, key: str) -> Tuple[bool, Optional[GalleryStill], str]:
+        """Looks up the journaled grab of key.
+
+        Returns:
+            Tuple[bool, Optional[GalleryStill], str]: whether to skip the grab, the still found in the album and its label.
+        """
+        if self._journal is None:
+            return False, None, ""
+        record = self._journal.grab(key)
+        if record is None:
+            return False, None, ""
+        label = record["label"]
+        still = self._album_stills().get(label)
+        if still is None and not self._journal.exported(key):
+            # removed from the album before it was exported, grab it again
+            return False, None, ""
+        return True, still, label
+
+    def _journal_grab(self, marker_still: MarkerStill, timeline_id: str):
+        if self._journal is None:
+            return
+        label = marker_still.still_label or self._still_album.get_label(
+            marker_still.still_obj
+        )
+        if not label:
+            return
+        marker_still.still_label = label
+        self._journal.record_grab(
+            marker_still.journal_key,
+            timeline_id,
+            marker_still.marker_record_tc.frame,
+            label,
+        )
+        if self._journal_stills is not None:
+            self._journal_stills[label] = marker_still.still_obj
+
+    def _grab_all_stills_native(
+        self,
+        timeline: Timeline,
+        timelineitem_list: List[TimelineItem],
+        still_frame_source: int,
+    ) -> Optional[List[GalleryStill]]:
+        """Grabs the stills of all items on V1 with one GrabAllStills call.
+
+        GrabAllStills covers every video track, so it is only used when V1 is
+        the only video track holding items. Returns None if it cannot be used.
+        """
+        track_count = timeline.get_track_count(TrackType.VIDEO_TRACK) or 1
+        for track_index in range(2, track_count + 1):
+            if timeline.get_item_list_in_track(TrackType.VIDEO_TRACK, track_index):
+                logger.info(
+                    "Video track %d holds items; grabbing stills item by item.",
+                    track_index,
+                )
+                return None
+        stills = timeline.grab_all_stills(still_frame_source)
+        if len(stills) != len(timelineitem_list):
+            logger.warning(
+                "GrabAllStills returned %d stills for %d items; grabbing stills item by item.",
+                len(stills),
+                len(timelineitem_list),
+            )
+            if stills:
+                self._still_album.delete_stills(stills)
+            return None
+        return stills
+
     def _set_current_still_album(self, album: GalleryStillAlbum) -> bool:
         try:
             result = self._gallery.set_current_still_album(album)
@@ -253,47 +506,80 @@ class StillManager(object):
         return bool(result)
 
     def grab_still_from_timeline_markers(
-        self, timeline: Timeline | None = None, grab_sleep_time: float = 0.5
+        self, timeline: Timeline | None = None, grab_sleep_time: float | None = None
     ) -> List[MarkerStill]:
         """Grab stills at each marker location on the requested timeline.
 
         Args:
             timeline (Timeline, optional): Timeline to evaluate. Defaults to the manager timeline.
-            grab_sleep_time (float, optional): Seconds to sleep between grabs, allowing Resolve to update the gallery.
+            grab_sleep_time (float, optional): Fixed seconds to sleep after each grab. Defaults to None, waiting until the still is committed (see still_commit).
 
         Returns:
             List[MarkerStill]: Still metadata accumulated so far.
         """
+        self.marker_still_list.extend(
+            self.iter_marker_stills(timeline, grab_sleep_time)
+        )
+        return self.marker_still_list
+
+    def iter_marker_stills(
+        self, timeline: Timeline | None = None, grab_sleep_time: float | None = None
+    ) -> Iterator[MarkerStill]:
+        """Grab stills at each marker location, yielding each MarkerStill as soon as it is grabbed.
+
+        Unlike grab_still_from_timeline_markers the stills are not kept in
+        marker_still_list, so export or upload can run while grabbing.
+
+        Args:
+            timeline (Timeline, optional): Timeline to evaluate. Defaults to the manager timeline.
+            grab_sleep_time (float, optional): Fixed seconds to sleep after each grab. Defaults to None, waiting until the still is committed (see still_commit).
+
+        Yields:
+            MarkerStill: still and metadata of one marker
+        """
         timeline = self._resolve_timeline(timeline)
         marker_list = timeline.get_markers() or {}
         logger.info("Timeline Marker Count:%d", len(marker_list))
 
         if not marker_list:
-            return self.marker_still_list
+            return
 
-        timeline_start_timecode = DfttTimecode(
-            timeline.get_start_timecode(),
-            "auto",
-            self._timeline_framerate,
-            drop_frame=self._timeline_df_flag,
+        timeline_timecode = get_converter(
+            self._timeline_framerate, self._timeline_df_flag
         )
-        logger.debug("timeline_start_timecode: %s", timeline_start_timecode)
-
-        sleep_interval = max(0.0, grab_sleep_time or 0.0)
+        timeline_start_frame = timeline_timecode.frames(timeline.get_start_timecode())
+        logger.debug("timeline_start_frame: %s", timeline_start_frame)
+        timeline_id = timeline.get_unique_id() if self._journal is not None else ""
+
+        # find the clip under every marker locally instead of moving the
+        # playhead and asking get_current_video_item for each marker;
+        # marker positions come back as float frame offsets
+        sorted_markers = sorted(marker_list.items())
+        marker_frames = [
+            timeline_start_frame + int(frame_id) for frame_id, _ in sorted_markers
+        ]
+        marker_spans = timeline.interval_index().spans_at_frames(marker_frames)
 
-        for marker_frameid, marker_info in sorted(marker_list.items()):
-            marker_record_tc: DfttTimecode = timeline_start_timecode + marker_frameid
-            timeline.set_current_timecode(marker_record_tc.timecode_output())
-            timeline_item = timeline.get_current_video_item()
-            if timeline_item is None:
+        item_clips: Dict[int, MediaPoolItem] = {}
+        item_source_in: Dict[int, int] = {}
+        for (marker_frameid, marker_info), marker_frame, marker_span in zip(
+            sorted_markers, marker_frames, marker_spans
+        ):
+            marker_frameid = int(marker_frameid)
+            if marker_span is None:
                 logger.warning(
                     "No timeline item available at marker frame %s. Skipping.",
                     marker_frameid,
                 )
                 continue
+            timeline_item = marker_span.item
 
-            # get source tc for the marker
-            clip = timeline_item.get_media_pool_item()
+            # get source tc for the marker, markers on the same item share its clip
+            clip = item_clips.get(id(timeline_item))
+            if clip is None:
+                clip = item_clips[id(timeline_item)] = (
+                    timeline_item.get_media_pool_item()
+                )
             if clip is None:
                 logger.warning(
                     "Timeline item at frame %s has no media pool item. Skipping.",
@@ -301,13 +587,8 @@ class StillManager(object):
                 )
                 continue
 
-            clip_df_flag = self._coerce_bool(clip.get_clip_property("Drop frame"))
-            clip_fps = self._coerce_float(
-                clip.get_clip_property("FPS"), self._timeline_framerate
-            )
-
-            clip_start_tc = self._safe_clip_property(clip, "Start TC")
-            if clip_start_tc is None:
+            clip_start_timecode = self._clip_start_timecode(clip)
+            if clip_start_timecode is None:
                 logger.warning(
                     "Clip %s has no Start TC metadata; skipping marker %s.",
                     clip.get_name(),
@@ -315,28 +596,30 @@ class StillManager(object):
                 )
                 continue
 
-            clip_start_timecode = DfttTimecode(
-                clip_start_tc,
-                "auto",
-                clip_fps,
-                drop_frame=clip_df_flag,
-            )
-            clip_tc_frame_offset = (
-                int(timeline_start_timecode.timecode_output("frame"))
-                + marker_frameid
-                - timeline_item.get_start()
+            # the item starts at its source in-point, left_offset frames into the clip
+            source_in = item_source_in.get(id(timeline_item))
+            if source_in is None:
+                source_in = item_source_in[id(timeline_item)] = int(
+                    timeline_item.get_left_offset()
+                )
+            marker_source_tc = clip_start_timecode + (
+                source_in + marker_frame - int(marker_span.start)
             )
 
-            marker_source_tc = clip_start_timecode + clip_tc_frame_offset
-
-            still = timeline.grab_still()
-            if still is None:
-                logger.warning(
-                    "Failed to grab still for clip %s at marker %s.",
-                    clip.get_name(),
-                    marker_frameid,
-                )
-                continue
+            # stills are grabbed at the playhead, move it only for clips we keep
+            marker_record_tc = Timecode(marker_frame, timeline_timecode)
+            journal_key = still_key(timeline_id, marker_frame) if timeline_id else ""
+            resumed, still, still_label = self._resume_grab(journal_key)
+            if not resumed:
+                timeline.set_current_timecode(marker_record_tc.smpte)
+                still = timeline.grab_still()
+                if still is None:
+                    logger.warning(
+                        "Failed to grab still for clip %s at marker %s.",
+                        clip.get_name(),
+                        marker_frameid,
+                    )
+                    continue
 
             marker_still = MarkerStill(
                 still,
@@ -344,25 +627,26 @@ class StillManager(object):
                 marker_record_tc,
                 marker_source_tc,
                 marker_info,
+                still_label,
+                journal_key,
             )
-            self.marker_still_list.append(marker_still)
-            if sleep_interval:
-                time.sleep(sleep_interval)
-
-        return self.marker_still_list
+            if not resumed:
+                marker_still.still_label = self._after_grab(still, grab_sleep_time)
+                self._journal_grab(marker_still, timeline_id)
+            yield marker_still
 
     def grab_all_still(
         self,
         timeline: Timeline | None = None,
-        grab_sleep_time: float = 0.5,
+        grab_sleep_time: float | None = None,
         still_position: float = 0.5,
     ):
         """Grab a still for each clip in the first video track and store metadata.
 
         Args:
             timeline (Timeline, optional): Timeline to scan; defaults to the manager's current timeline.
-            grab_sleep_time (float, optional): Delay inserted after each grab so Resolve can finish writing the still.
-            still_position (float, optional): Normalized position within each clip (0=start, 1=end); values outside the range are clamped.
+            grab_sleep_time (float, optional): Fixed seconds to sleep after each grab. Defaults to None, waiting until the still is committed (see still_commit).
+            still_position (float, optional): Normalized position within each clip (0=start, 1=end); values outside the range are clamped. 0 and 0.5 grab all stills with one Timeline.grab_all_stills call when V1 is the only video track with items.
 
         Returns:
             List[MarkerStill]: Still metadata accumulated so far.
@@ -386,69 +670,79 @@ class StillManager(object):
             logger.info("No clips found on VIDEO_TRACK 1; nothing to grab.")
             return self.marker_still_list
 
-        timeline_start_timecode = DfttTimecode(
-            timeline.get_start_timecode(),
-            "auto",
-            self._timeline_framerate,
-            drop_frame=self._timeline_df_flag,
+        timeline_timecode = get_converter(
+            self._timeline_framerate, self._timeline_df_flag
         )
 
-        sleep_interval = max(0.0, grab_sleep_time or 0.0)
+        timeline_id = timeline.get_unique_id() if self._journal is not None else ""
+
+        # first and middle frames come from one GrabAllStills call, matched
+        # to the items by position; other positions move the playhead per item,
+        # as do timelines with journaled grabs
+        native_stills = None
+        still_frame_source = self.NATIVE_STILL_FRAME_SOURCES.get(still_position)
+        if still_frame_source is not None and not (
+            timeline_id and self._journal.has_timeline(timeline_id)
+        ):
+            native_stills = self._grab_all_stills_native(
+                timeline, timelineitem_list, still_frame_source
+            )
+        unused_stills: List[GalleryStill] = []
+        grabbed: List[MarkerStill] = []
 
-        for timeline_item in timelineitem_list:
+        for item_index, timeline_item in enumerate(timelineitem_list):
             clip = timeline_item.get_media_pool_item()
             if clip is None:
                 logger.warning("Timeline item has no media pool clip; skipping.")
+                if native_stills is not None:
+                    unused_stills.append(native_stills[item_index])
                 continue
 
-            timelineitem_start_timecode = DfttTimecode(
-                timeline_item.get_start(),
-                "auto",
-                self._timeline_framerate,
-                drop_frame=self._timeline_df_flag,
-            )
             still_position_frame_offset = int(
                 timeline_item.get_duration() * still_position
             )
 
-            timelineitem_still_timecode = (
-                timelineitem_start_timecode + still_position_frame_offset
-            )
-            timeline.set_current_timecode(
-                timelineitem_still_timecode.timecode_output("smpte")
+            timelineitem_still_timecode = Timecode(
+                timeline_item.get_start() + still_position_frame_offset,
+                timeline_timecode,
             )
-            logger.debug(
-                f"Set timeline TC to {timelineitem_still_timecode.timecode_output('smpte')} for clip {clip.get_name()}"
+            journal_key = (
+                still_key(timeline_id, timelineitem_still_timecode.frame)
+                if timeline_id
+                else ""
             )
-            clip_df_flag = self._coerce_bool(clip.get_clip_property("Drop frame"))
-            clip_fps = self._coerce_float(
-                clip.get_clip_property("FPS"), self._timeline_framerate
+            resumed, resumed_still, still_label = (
+                self._resume_grab(journal_key)
+                if native_stills is None
+                else (False, None, "")
             )
-            clip_start_tc = self._safe_clip_property(clip, "Start TC")
-            if clip_start_tc is None:
+            if native_stills is None and not resumed:
+                timeline.set_current_timecode(timelineitem_still_timecode.smpte)
+                logger.debug(
+                    f"Set timeline TC to {timelineitem_still_timecode.smpte} for clip {clip.get_name()}"
+                )
+            clip_start_timecode = self._clip_start_timecode(clip)
+            if clip_start_timecode is None:
                 logger.warning(
                     "Clip %s is missing Start TC metadata; skipping.", clip.get_name()
                 )
+                if native_stills is not None:
+                    unused_stills.append(native_stills[item_index])
                 continue
 
-            clip_start_timecode = DfttTimecode(
-                clip_start_tc,
-                "auto",
-                clip_fps,
-                drop_frame=clip_df_flag,
-            )
-            clip_tc_frame_offset = (
-                int(timeline_start_timecode.timecode_output("frame"))
-                + int(timelineitem_still_timecode.timecode_output("frame"))
-                - timeline_item.get_start()
+            marker_source_tc = clip_start_timecode + (
+                int(timeline_item.get_left_offset()) + still_position_frame_offset
             )
 
-            marker_source_tc = clip_start_timecode + clip_tc_frame_offset
-
             # grab still
-            still = timeline.grab_still()
+            if native_stills is not None:
+                still = native_stills[item_index]
+            elif resumed:
+                still = resumed_still
+            else:
+                still = timeline.grab_still()
 
-            if still is None:
+            if still is None and not resumed:
                 logger.warning("Failed to grab still for clip %s.", clip.get_name())
                 continue
 
@@ -458,10 +752,30 @@ class StillManager(object):
                 timelineitem_still_timecode,
                 marker_source_tc,
                 {},
+                still_label,
+                journal_key,
             )
             self.marker_still_list.append(marker_still)
-            if sleep_interval:
-                time.sleep(sleep_interval)
+            if native_stills is not None:
+                grabbed.append(marker_still)
+            elif not resumed:
+                marker_still.still_label = self._after_grab(still, grab_sleep_time)
+                self._journal_grab(marker_still, timeline_id)
+
+        if native_stills is not None:
+            if grab_sleep_time is not None:
+                self._after_grab(native_stills[-1], grab_sleep_time)
+            else:
+                labels = {
+                    id(still): self._after_grab(still, None) for still in native_stills
+                }
+                for marker_still in grabbed:
+                    marker_still.still_label = labels[id(marker_still.still_obj)]
+            for marker_still in grabbed:
+                self._journal_grab(marker_still, timeline_id)
+            # stills of skipped items only go once they are committed
+            if unused_stills:
+                self._still_album.delete_stills(unused_stills)
 
         return self.marker_still_list
 
@@ -469,9 +783,7 @@ class StillManager(object):
         """Resolve wildcard placeholders used while formatting filenames."""
 
         handlers = {
-            "clip_frame_tc": lambda: (
-                f"{int(marker_still.marker_source_tc.timecode_output('frame')):08d}"
-            ),
+            "clip_frame_tc": lambda: (f"{marker_still.marker_source_tc.frame:08d}"),
             "reel_number": lambda: self._extract_reel_number(marker_still),
             "marker_note": lambda: marker_still.marker_info.get("note", ""),
             "marker_name": lambda: marker_still.marker_info.get("name", ""),
@@ -510,9 +822,13 @@ class StillManager(object):
         clean_still_album: bool = False,
         use_subfolder: bool = False,
         subfolder: str = "",
+        file_workers: int = 8,
     ):
         """export stills to given path
 
+        All stills are exported with one ExportStills call under a temporary
+        file prefix, then renamed to their target names locally.
+
         Args:
             export_path (str): stills export path
             file_name_format (str, optional): file name format. accept $file_name$,$reel_name$,$reel_number$,$frames$,$clip_frame_tc$ and all clip property keys show at Davinci Resolve GUI as wildcard. Defaults to "$file_name$_$clip_frame_tc$".
@@ -521,8 +837,104 @@ class StillManager(object):
             clean_still_album (bool, optional): clean still album after stills exported. Defaults to True.
             use_subfolder (bool, optional): use subfolder to export stills. Defaults to False.
             subfolder (str, optional): subfolder name to export stills. Defaults to "".
+            file_workers (int, optional): threads renaming and deleting exported files. Defaults to 8.
         """
+        export = self._prepare_export(
+            export_base_path, file_name_format, format, use_subfolder, subfolder
+        )
+        export_result, batch, exported = self._export_marker_stills(
+            self.marker_still_list, export, clean_drx, file_workers
+        )
+
+        # clear album
+        if clean_still_album:
+            stills = self._still_album.get_stills()
+            self._still_album.delete_stills(stills)
+
+        if batch and not exported:
+            logger.warning(
+                f"No stills exported to folder {export.path}. Please check if you open the [gallery] in color page or not"
+            )
+            return
 
+        return export_result
+
+    def iter_export_marker_stills(
+        self,
+        export_base_path: str,
+        window: int = 50,
+        timeline: Timeline | None = None,
+        grab_sleep_time: float | None = None,
+        file_name_format: str = "$file_name$_$clip_frame_tc$",
+        format: StillFormat = StillFormat.TIF,
+        clean_drx: bool = True,
+        delete_exported_stills: bool = True,
+        use_subfolder: bool = False,
+        subfolder: str = "",
+        file_workers: int = 8,
+    ) -> Iterator[Dict[str, dict]]:
+        """Grab stills at each marker location and export them window by window.
+
+        Marker stills come from iter_marker_stills and are exported every
+        `window` stills with one ExportStills call, so at most one window of
+        MarkerStill is held at a time and marker_still_list is left alone.
+
+        Args:
+            export_base_path (str): stills export path
+            window (int, optional): stills grabbed before each export. Defaults to 50.
+            timeline (Timeline, optional): Timeline to evaluate. Defaults to the manager timeline.
+            grab_sleep_time (float, optional): Fixed seconds to sleep after each grab. Defaults to None, waiting until the still is committed.
+            file_name_format (str, optional): file name format, see export_stills. Defaults to "$file_name$_$clip_frame_tc$".
+            format (StillFormat, optional): exported stills format. Defaults to StillFormat.TIF.
+            clean_drx (bool, optional): clean drx files after stills exported. Defaults to True.
+            delete_exported_stills (bool, optional): remove each window's exported stills from the album. Defaults to True.
+            use_subfolder (bool, optional): use subfolder to export stills. Defaults to False.
+            subfolder (str, optional): subfolder name to export stills. Defaults to "".
+            file_workers (int, optional): threads renaming and deleting exported files. Defaults to 8.
+
+        Raises:
+            ValueError: window is less than 1.
+
+        Yields:
+            Dict[str, dict]: export_stills results of one window, by target file name
+        """
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+        export = self._prepare_export(
+            export_base_path, file_name_format, format, use_subfolder, subfolder
+        )
+
+        def _export_window(marker_stills: List[MarkerStill]) -> Dict[str, dict]:
+            export_result, batch, exported = self._export_marker_stills(
+                marker_stills, export, clean_drx, file_workers
+            )
+            if delete_exported_stills:
+                exported_stills = [
+                    marker_still.still_obj
+                    for marker_still, target_file_name in batch
+                    if target_file_name in exported
+                ]
+                if exported_stills:
+                    self._still_album.delete_stills(exported_stills)
+            return export_result
+
+        pending: List[MarkerStill] = []
+        for marker_still in self.iter_marker_stills(timeline, grab_sleep_time):
+            pending.append(marker_still)
+            if len(pending) >= window:
+                yield _export_window(pending)
+                pending = []
+        if pending:
+            yield _export_window(pending)
+
+    def _prepare_export(
+        self,
+        export_base_path: str,
+        file_name_format: str,
+        format: StillFormat,
+        use_subfolder: bool,
+        subfolder: str,
+    ) -> "_StillExport":
         base_path = Path(export_base_path).expanduser()
         base_path = base_path if base_path.is_absolute() else base_path.resolve()
 
@@ -540,8 +952,6 @@ class StillManager(object):
         else:
             export_path = base_path
 
-        export_result = {}
-
         export_path.mkdir(parents=True, exist_ok=True)
 
         wildcard_pattern = re.compile(r"\$(.*?)\$")
@@ -549,18 +959,31 @@ class StillManager(object):
         file_name_template = re.sub(wildcard_pattern, r"{\1}", file_name_format)
         logger.debug("file_name_template : %s", file_name_template)
 
-        existing_files = {
-            entry.name for entry in export_path.iterdir() if entry.is_file()
-        }
-        original_contents = set(existing_files)
+        return _StillExport(export_path, file_name_template, wildcard_matches, format)
+
+    def _export_marker_stills(
+        self,
+        marker_stills: Iterable[MarkerStill],
+        export: "_StillExport",
+        clean_drx: bool,
+        file_workers: int,
+    ) -> Tuple[Dict[str, dict], List[Tuple[MarkerStill, str]], Set[str]]:
+        """Exports marker_stills with one ExportStills call.
 
-        skip_count = 0
-        for marker_still in self.marker_still_list:
+        Returns:
+            Tuple[Dict[str, dict], List[Tuple[MarkerStill, str]], Set[str]]: results by target file name, the stills sent to ExportStills with their target file names, and the target file names exported.
+        """
+        export_result = {}
+        claimed_files = export.claimed_files
+        format = export.format
+
+        batch: List[Tuple[MarkerStill, str]] = []
+        for marker_still in marker_stills:
             try:
-                _file_prefix = file_name_template.format(
+                _file_prefix = export.file_name_template.format(
                     **{
                         var: self._get_metadata(marker_still, var)
-                        for var in wildcard_matches
+                        for var in export.wildcard_matches
                     }
                 ).strip()
             except KeyError as exc:
@@ -573,59 +996,172 @@ class StillManager(object):
             target_file_name = f"{_file_prefix}.{format.value}"
             logger.debug("target file name:%s", target_file_name)
 
-            if target_file_name in existing_files:
+            journal_key = marker_still.journal_key
+            if (
+                self._journal is not None
+                and journal_key
+                and self._journal.exported(journal_key, target_file_name)
+            ):
+                logger.info(
+                    "%s exported in an earlier run. Skipping.", target_file_name
+                )
+                export_result[target_file_name] = {
+                    "exported": False,
+                    "message": "Exported in an earlier run, skipped.",
+                }
+                claimed_files.add(target_file_name)
+                continue
+
+            if marker_still.still_obj is None:
+                logger.warning(
+                    "Still for %s is no longer in the album. Skipping.",
+                    target_file_name,
+                )
+                export_result[target_file_name] = {
+                    "exported": False,
+                    "message": "Still no longer in the album, skipped.",
+                }
+                continue
+
+            if (
+                target_file_name in claimed_files
+                or (export.path / target_file_name).exists()
+            ):
                 logger.info("File %s exists. Skipping export.", target_file_name)
-                skip_count += 1
                 export_result[target_file_name] = {
                     "exported": False,
                     "message": "File already exists, skipped.",
                 }
                 continue
 
-            export_success = self._still_album.export_stills(
-                gallery_stills=[marker_still.still_obj],
-                folder_path=str(export_path),
-                file_prefix=_file_prefix,
-                format=format,
-            )
+            batch.append((marker_still, target_file_name))
+            claimed_files.add(target_file_name)
+
+        exported = self._export_batch(
+            batch, export.path, format, clean_drx, file_workers
+        )
+        for marker_still, target_file_name in batch:
+            if self._journal is not None and marker_still.journal_key:
+                self._journal.record_export(
+                    marker_still.journal_key,
+                    target_file_name,
+                    EXPORTED if target_file_name in exported else FAILED,
+                )
             export_result[target_file_name] = {
-                "exported": export_success,
-                "file_path": str(os.path.join(export_path, target_file_name)),
+                "exported": target_file_name in exported,
+                "file_path": str(os.path.join(export.path, target_file_name)),
                 "clip_name": marker_still.clip_obj.get_name(),
-                "record_tc": marker_still.marker_record_tc.timecode_output("smpte"),
-                "source_tc": marker_still.marker_source_tc.timecode_output("smpte"),
+                "record_tc": marker_still.marker_record_tc.smpte,
+                "source_tc": marker_still.marker_source_tc.smpte,
             }
-            existing_files.add(target_file_name)
 
-        # check export folder
-        exported_files = {
-            entry.name for entry in export_path.iterdir() if entry.is_file()
-        }
-        exported_stills_count = len(exported_files - original_contents)
+        return export_result, batch, exported
 
-        # clear album
-        if clean_still_album:
-            stills = self._still_album.get_stills()
-            self._still_album.delete_stills(stills)
+    def _export_batch(
+        self,
+        batch: List[Tuple[MarkerStill, str]],
+        export_path: Path,
+        format: StillFormat,
+        clean_drx: bool,
+        file_workers: int,
+    ) -> Set[str]:
+        """Exports the stills of batch with one call and renames them to their target file names.
+
+        Stills without a label, or sharing one with an earlier still of the
+        batch, are left out as their exported files could not be told apart.
 
-        if (
-            exported_stills_count == 0
-            and len(self.marker_still_list) != 0
-            and skip_count < len(self.marker_still_list)
+        Returns:
+            Set[str]: target file names that were exported
+        """
+        if not batch:
+            return set()
+        # Resolve names the files <prefix>_<still label>.<ext>
+        batch_prefix = f"pybmd_{uuid.uuid4().hex[:12]}"
+        targets: Dict[str, str] = {}
+        gallery_stills: List[GalleryStill] = []
+        for marker_still, target_file_name in batch:
+            # label seen by StillCommitWaiter at commit time, read only when missing
+            label = marker_still.still_label
+            if not label:
+                label = self._still_album.get_label(marker_still.still_obj) or ""
+                marker_still.still_label = label
+            exported_stem = f"{batch_prefix}_{label}"
+            if not label or exported_stem in targets:
+                logger.warning(
+                    "Still for %s has no unique label. Skipping export.",
+                    target_file_name,
+                )
+                continue
+            targets[exported_stem] = Path(target_file_name).stem
+            gallery_stills.append(marker_still.still_obj)
+        if not gallery_stills:
+            return set()
+
+        if not self._still_album.export_stills(
+            gallery_stills=gallery_stills,
+            folder_path=str(export_path),
+            file_prefix=batch_prefix,
+            format=format,
         ):
-            logger.warning(
-                f"No stills exported to folder {export_path}. Please check if you open the [gallery] in color page or not"
-            )
-            return
-        self.clean_and_rename_stills(str(export_path), clean_drx, original_contents)
+            logger.warning("ExportStills failed for %d stills.", len(gallery_stills))
+
+        # the exported names are known, no need to list the folder
+        renames: Dict[Path, Path] = {}
+        removals: List[Path] = []
+        for exported_stem, target_stem in targets.items():
+            still_file = export_path / f"{exported_stem}.{format.value}"
+            renames[still_file] = still_file.with_name(f"{target_stem}.{format.value}")
+            drx_file = export_path / f"{exported_stem}.drx"
+            if clean_drx:
+                removals.append(drx_file)
+            else:
+                renames[drx_file] = drx_file.with_name(f"{target_stem}.drx")
+        done = self._apply_file_operations(renames, removals, file_workers)
+        return {destination.name for destination in done}
 
-        return export_result
+    @staticmethod
+    def _apply_file_operations(
+        renames: Dict[Path, Path], removals: List[Path], workers: int = 8
+    ) -> List[Path]:
+        """Runs renames and deletions in a thread pool, returns the renamed destinations.
+
+        Missing sources, e.g. stills Resolve did not export, are skipped.
+        """
+
+        def _rename(source: Path, destination: Path) -> Optional[Path]:
+            try:
+                source.rename(destination)
+            except FileNotFoundError:
+                logger.debug("%s was not exported", source.name)
+                return None
+            except OSError as exc:
+                logger.warning("Failed to rename %s: %s", source.name, exc)
+                return None
+            logger.info("%s export successfully!", destination.name)
+            return destination
+
+        def _remove(path: Path) -> bool:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                return False
+            return True
+
+        if not renames and not removals:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            renamed = list(pool.map(_rename, renames.keys(), renames.values()))
+            removed = sum(pool.map(_remove, removals))
+        if removed:
+            logger.info("Deleted %d drx files", removed)
+        return [destination for destination in renamed if destination is not None]
 
     def clean_and_rename_stills(
         self,
         still_file_path: str,
         clean_drx: bool = True,
         export_folder_exist_file_list: Optional[Iterable[str]] = None,
+        file_workers: int = 8,
     ):
         """Normalize exported still names and optionally clean up DRX files."""
         existing_files = set(export_folder_exist_file_list or [])
@@ -634,7 +1170,8 @@ class StillManager(object):
             target_path if target_path.is_absolute() else target_path.resolve()
         )
 
-        remove_count = 0
+        renames: Dict[Path, Path] = {}
+        removals: List[Path] = []
 
         for entry in target_path.iterdir():
             if not entry.is_file():
@@ -645,21 +1182,13 @@ class StillManager(object):
                 continue
 
             if entry.suffix == ".drx" and clean_drx:
-                try:
-                    entry.unlink()
-                except FileNotFoundError:
-                    pass
-                remove_count += 1
+                removals.append(entry)
                 continue
 
             match = re.match(r"(.*)_[0-9]{1,}\.[0-9]{1,}\.[0-9]{1,}", entry.stem)
             if not match:
                 continue
 
-            new_name = f"{match.group(1)}{entry.suffix}"
-            destination = entry.with_name(new_name)
-            entry.rename(destination)
-            logger.info("%s export successfully!", destination.name)
+            renames[entry] = entry.with_name(f"{match.group(1)}{entry.suffix}")
 
-        if remove_count != 0:
-            logger.info("Deleted %d drx files", remove_count)
+        self._apply_file_operations(renames, removals, file_workers)
@@ -8,8 +8,13 @@ class UI_Dispather(object):
     """docstring for UI_Dispather."""
 
     def __init__(self, ui_manager: UI_Manager):
-        self._ui_dispather = _init_bmd._bmd_module_object.UIDispatcher(  # ty:ignore[unresolved-attribute]
-            ui_manager._ui_manager
+        bmd_module = (
+            ui_manager._context.bmd_module
+            if ui_manager._context is not None
+            else _init_bmd._bmd_module_object
+        )
+        self._ui_dispather = bmd_module.UIDispatcher(  # ty:ignore[unresolved-attribute]
+            ui_manager._object
         )
 
     def add_window(self, id: str, children: List):
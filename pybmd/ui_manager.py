@@ -4,6 +4,8 @@ from pybmd._wrapper_base import WrapperBase
 class UI_Manager(WrapperBase):
     """docstring for UI_Manager."""
 
-    def __init__(self, ui_manager):
-        super(UI_Manager, self).__init__(ui_manager)
-        self._ui_manager = self._object
\ No newline at end of file
+    __slots__ = ()
+    _ui_manager = WrapperBase._handle_alias
+
+    def __init__(self, ui_manager, context=None):
+        super(UI_Manager, self).__init__(ui_manager, context)
@@ -5,9 +5,13 @@ for all APIs in the pybmd library. Decorators automatically register APIs,
 and the registry can be queried to check compatibility.
 """
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from pybmd.version_info import Version, VersionConstraint
+from pybmd.version_info import APIStatus, Version, VersionConstraint
+
+# Precomputed gate for one registered constraint. ``None`` means the API is
+# available without warnings; otherwise (is_compatible, status, message, version).
+GateStatus = Optional[Tuple[bool, APIStatus, str, str]]
 
 
 class VersionRegistry:
@@ -25,15 +29,24 @@ class VersionRegistry:
     """
 
     _registry: Dict[str, VersionConstraint] = {}
+    # Every registered constraint in registration order; a decorator keeps the
+    # index of its constraint to look up the precomputed gate status.
+    _constraints: List[VersionConstraint] = []
+    _resolved_version: Optional[Version] = None
+    # Mutated in place only, decorators hold a reference to this list.
+    _resolved_status: List[GateStatus] = []
 
     @classmethod
-    def register(cls, api_identifier: str, constraint: VersionConstraint) -> None:
+    def register(cls, api_identifier: str, constraint: VersionConstraint) -> int:
         """Register an API with its version constraints.
 
         Args:
             api_identifier: Full API identifier (e.g., "TimelineItem.set_name")
             constraint: Version constraint object defining compatibility rules
 
+        Returns:
+            int: gate index of the constraint, see `get_gate_status`
+
         Example:
             >>> from pybmd.version_info import Version, VersionConstraint
             >>> constraint = VersionConstraint(
@@ -43,6 +56,12 @@ class VersionRegistry:
             >>> VersionRegistry.register("Timeline.export_subtitle", constraint)
         """
         cls._registry[api_identifier] = constraint
+        cls._constraints.append(constraint)
+        if cls._resolved_version is not None:
+            cls._resolved_status.append(
+                cls.compute_gate_status(constraint, cls._resolved_version)
+            )
+        return len(cls._constraints) - 1
 
     @classmethod
     def get_constraint(cls, api_identifier: str) -> Optional[VersionConstraint]:
@@ -87,11 +106,86 @@ class VersionRegistry:
             result[api_id] = (is_compat, msg)
         return result
 
+    @staticmethod
+    def compute_gate_status(
+        constraint: VersionConstraint, current_version: Version
+    ) -> GateStatus:
+        """Evaluate a constraint once for the given version.
+
+        Args:
+            constraint: Version constraint to evaluate
+            current_version: The current DaVinci Resolve version
+
+        Returns:
+            None if the API is available without warnings, otherwise a tuple of
+            (is_compatible, status, message, current_version_string)
+        """
+        is_compat, status, msg = constraint.get_status(current_version)
+        if is_compat and status != APIStatus.DEPRECATED:
+            return None
+        return (is_compat, status, msg, str(current_version))
+
+    @classmethod
+    def compute_gate_statuses(
+        cls, current_version: Version, start: int = 0
+    ) -> List[GateStatus]:
+        """Evaluate every registered constraint for the given version.
+
+        Args:
+            current_version: The current DaVinci Resolve version
+            start: First gate index to evaluate, to extend an existing list
+
+        Returns:
+            List of gate statuses indexed by gate index - start
+        """
+        return [
+            cls.compute_gate_status(constraint, current_version)
+            for constraint in cls._constraints[start:]
+        ]
+
+    @classmethod
+    def gate_count(cls) -> int:
+        """Number of registered gates."""
+        return len(cls._constraints)
+
+    @classmethod
+    def resolve_version(cls, current_version: Version) -> None:
+        """Precompute compatibility of every registered API for a Resolve version.
+
+        Called by `Resolve.__init__` once the version is known. Afterwards
+        decorated methods only look up their precomputed gate instead of
+        re-evaluating their constraint on every call. APIs registered later
+        are evaluated at registration time.
+
+        Args:
+            current_version: The current DaVinci Resolve version
+
+        Example:
+            >>> VersionRegistry.resolve_version(Version(20, 2, 0))
+            >>> VersionRegistry.get_resolved_version()
+            Version(major=20, minor=2, patch=0)
+        """
+        cls._resolved_status[:] = cls.compute_gate_statuses(current_version)
+        cls._resolved_version = current_version
+
+    @classmethod
+    def get_resolved_version(cls) -> Optional[Version]:
+        """Returns the version passed to `resolve_version`, None if unresolved."""
+        return cls._resolved_version
+
+    @classmethod
+    def reset_resolution(cls) -> None:
+        """Drop precomputed gates so decorated methods check on every call again."""
+        cls._resolved_status.clear()
+        cls._resolved_version = None
+
     @classmethod
     def clear(cls) -> None:
         """Clear all registered APIs.
 
-        This method is primarily useful for testing purposes.
+        This method is primarily useful for testing purposes. Constraints held
+        by already decorated methods stay valid, only the lookup table and the
+        resolved version are dropped.
 
         Example:
             >>> VersionRegistry.clear()
@@ -99,6 +193,7 @@ class VersionRegistry:
             0
         """
         cls._registry.clear()
+        cls.reset_resolution()
 
     @classmethod
     def get_all_registered(cls) -> Dict[str, VersionConstraint]: